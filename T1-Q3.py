@@ -1,43 +1,76 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from typing import List, Tuple
 
+from passos import RegistroPassos, formatar_matriz
+
 def imprimir_matriz(matriz: np.ndarray, nome: str = "Matriz"):
-    print(f"\n{nome}:")
-    print("-" * 80)
-    linhas, colunas = matriz.shape
-    for i in range(linhas):
-        linha_str = "| "
-        for j in range(colunas):
-            valor = matriz[i, j]
-            if abs(valor) < 1e-10:
-                valor = 0.0
-            linha_str += f"{valor:10.4f} "
-        linha_str += "|"
-        print(linha_str)
-    print("-" * 80)
+    print(formatar_matriz(matriz, nome))
+
+def matriz_aumentada(A: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Monta [A|b] em float copiando A e b uma única vez (sem as cópias
+    intermediárias de `np.column_stack`, que dobram o pico de memória).
+    """
+    n = len(b)
+    Ab = np.empty((n, n + 1), dtype=float)
+    Ab[:, :n] = A
+    Ab[:, n] = b
+    return Ab
 
-def eliminacao_gaussiana(A: np.ndarray, b: np.ndarray, mostrar_passos: bool = True) -> np.ndarray:
+def eliminacao_gaussiana(
+    A: np.ndarray,
+    b: np.ndarray,
+    mostrar_passos: bool = True,
+    contadores: dict | None = None,
+    registro: RegistroPassos | None = None,
+    prazo: float | None = None,
+) -> np.ndarray | None:
     """
     Resolve um sistema linear Ax = b usando eliminação gaussiana com pivoteamento parcial.
     
     Args:
         A: Matriz de coeficientes (n x n)
         b: Vetor de termos independentes (n x 1)
-        mostrar_passos: Se True, mostra os passos intermediários
+        mostrar_passos: Se True, mostra os passos intermediários ao final
+        contadores: Se informado, acumula em "trocas_pivo" o número de trocas de linhas
+        registro: Se informado, recebe os passos (trocas, fatores, substituições)
+            sem imprimir nada; o texto sai de `registro.renderizar()`
+        prazo: Se informado, desiste após `prazo` segundos
     
     Returns:
-        Vetor solução x
+        Vetor solução x, ou None se o prazo acabou
     """
+    imprimir = registro is None and mostrar_passos
+    if imprimir:
+        registro = RegistroPassos(matrizes=True)
+    limite = None if prazo is None else time.perf_counter() + prazo
+    try:
+        return _eliminar_com_registro(A, b, contadores, registro, limite)
+    finally:
+        if imprimir:
+            registro.imprimir()
+
+def _eliminar_com_registro(
+    A: np.ndarray,
+    b: np.ndarray,
+    contadores: dict | None,
+    registro: RegistroPassos | None,
+    limite: float | None = None,
+) -> np.ndarray | None:
     n = len(b)
-    Ab = np.column_stack([A.astype(float), b.astype(float)])
+    Ab = matriz_aumentada(A, b)
     
-    if mostrar_passos:
-        print("\n" + "="*80)
-        print("MÉTODO DE ELIMINAÇÃO GAUSSIANA")
-        print("="*80)
-        imprimir_matriz(Ab, "Matriz Aumentada Inicial [A|b]")
+    if registro is not None:
+        registro.registrar("secao", "MÉTODO DE ELIMINAÇÃO GAUSSIANA")
+        registro.registrar_matriz("Matriz Aumentada Inicial [A|b]", Ab)
     
     for k in range(n-1):
+        if limite is not None and time.perf_counter() > limite:
+            return None
         max_idx = k
         for i in range(k+1, n):
             if abs(Ab[i, k]) > abs(Ab[max_idx, k]):
@@ -45,31 +78,29 @@ def eliminacao_gaussiana(A: np.ndarray, b: np.ndarray, mostrar_passos: bool = Tr
         
         if max_idx != k:
             Ab[[k, max_idx]] = Ab[[max_idx, k]]
-            if mostrar_passos:
-                print(f"\nTroca de linhas {k+1} ↔ {max_idx+1} (pivoteamento)")
-                imprimir_matriz(Ab, f"Após pivoteamento na etapa {k+1}")
+            if contadores is not None:
+                contadores["trocas_pivo"] = contadores.get("trocas_pivo", 0) + 1
+            if registro is not None:
+                registro.registrar("troca", k, max_idx)
+                registro.registrar_matriz(f"Após pivoteamento na etapa {k+1}", Ab)
         
         for i in range(k+1, n):
             if Ab[k, k] != 0:
                 fator = Ab[i, k] / Ab[k, k]
                 Ab[i, k:] = Ab[i, k:] - fator * Ab[k, k:]
                 
-                if mostrar_passos:
-                    print(f"\nEliminando elemento ({i+1},{k+1}): L{i+1} = L{i+1} - ({fator:.4f}) * L{k+1}")
+                if registro is not None:
+                    registro.registrar("fator", i, k, fator)
         
-        if mostrar_passos and k < n-2:
-            imprimir_matriz(Ab, f"Matriz após eliminação na coluna {k+1}")
+        if registro is not None and k < n-2:
+            registro.registrar_matriz(f"Matriz após eliminação na coluna {k+1}", Ab)
     
-    if mostrar_passos:
-        imprimir_matriz(Ab, "Matriz Triangular Superior Final")
+    if registro is not None:
+        registro.registrar_matriz("Matriz Triangular Superior Final", Ab)
+        registro.registrar("secao", "SUBSTITUIÇÃO RETROATIVA")
     
     x = np.zeros(n)
     
-    if mostrar_passos:
-        print("\n" + "="*80)
-        print("SUBSTITUIÇÃO RETROATIVA")
-        print("="*80)
-    
     for i in range(n-1, -1, -1):
         soma = 0
         for j in range(i+1, n):
@@ -80,11 +111,236 @@ def eliminacao_gaussiana(A: np.ndarray, b: np.ndarray, mostrar_passos: bool = Tr
         
         x[i] = (Ab[i, n] - soma) / Ab[i, i]
         
-        if mostrar_passos:
-            print(f"\nx[{i+1}] = ({Ab[i, n]:.4f} - {soma:.4f}) / {Ab[i, i]:.4f} = {x[i]:.4f}")
+        if registro is not None:
+            registro.registrar("retro", i, Ab[i, n], soma, Ab[i, i], x[i])
     
     return x
 
+def _fatorar_painel(painel: np.ndarray, deslocamento: int = 0) -> List[int]:
+    """
+    Fatora um painel (m x nb) in-place com pivoteamento parcial.
+
+    Os multiplicadores ficam abaixo da diagonal e a parte de U acima dela,
+    como na eliminação gaussiana clássica restrita às colunas do painel.
+
+    Args:
+        painel: Bloco de colunas a partir da linha do pivô atual
+        deslocamento: Índice global da primeira linha do painel (para mensagens)
+
+    Returns:
+        Índice (relativo ao painel) da linha escolhida como pivô em cada coluna
+    """
+    m, nb = painel.shape
+    trocas = []
+    for c in range(min(m, nb)):
+        p = c + int(np.argmax(np.abs(painel[c:, c])))
+        trocas.append(p)
+        if p != c:
+            painel[[c, p]] = painel[[p, c]]
+        pivo = painel[c, c]
+        if pivo == 0:
+            raise ValueError(f"Sistema impossível ou indeterminado: pivô zero na linha {deslocamento + c + 1}")
+        painel[c+1:, c] /= pivo
+        painel[c+1:, c+1:] -= np.outer(painel[c+1:, c], painel[c, c+1:])
+    return trocas
+
+def _resolver_unitaria_inferior(L: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """Resolve L X = B para L triangular inferior com diagonal unitária."""
+    X = np.array(B, dtype=float)
+    for i in range(1, L.shape[0]):
+        X[i] -= L[i, :i] @ X[:i]
+    return X
+
+def _substituicao_retroativa(U: np.ndarray, c: np.ndarray, deslocamento: int = 0) -> np.ndarray:
+    """Resolve U x = c para U triangular superior (bloco começando na linha `deslocamento`)."""
+    n = len(c)
+    x = np.zeros(n)
+    for i in range(n-1, -1, -1):
+        if U[i, i] == 0:
+            raise ValueError(f"Sistema impossível ou indeterminado: pivô zero na linha {deslocamento + i + 1}")
+        x[i] = (c[i] - U[i, i+1:] @ x[i+1:]) / U[i, i]
+    return x
+
+def salvar_sistema_em_disco(A: np.ndarray, b: np.ndarray, caminho: str, linhas_por_bloco: int = 1024) -> None:
+    """
+    Grava a matriz aumentada [A|b] em um arquivo .npy, bloco a bloco de linhas.
+
+    A pode ser ela mesma um memmap: apenas `linhas_por_bloco` linhas são
+    convertidas por vez.
+    """
+    n = len(b)
+    Ab = np.lib.format.open_memmap(caminho, mode="w+", dtype=np.float64, shape=(n, n + 1))
+    for i0 in range(0, n, linhas_por_bloco):
+        i1 = min(i0 + linhas_por_bloco, n)
+        Ab[i0:i1, :n] = A[i0:i1]
+        Ab[i0:i1, n] = b[i0:i1]
+    Ab.flush()
+    del Ab
+
+def tamanho_bloco_para_memoria(n: int, memoria_maxima: int, tamanho_bloco: int = 256, num_threads: int = 1) -> int:
+    """
+    Maior largura de bloco (<= tamanho_bloco) cujo painel n x nb e blocos auxiliares
+    (três por thread) cabem em `memoria_maxima` bytes.
+    """
+    nb = min(tamanho_bloco, n)
+    while nb > 0 and 8 * (n * nb + 3 * nb * nb * num_threads) > memoria_maxima:
+        nb //= 2
+    if nb == 0:
+        raise ValueError("Orçamento de memória insuficiente para um painel de uma coluna.")
+    return nb
+
+def _atualizar_coluna_de_blocos(Ab, painel: np.ndarray, k0: int, k1: int, j0: int, j1: int, nb: int) -> None:
+    """Calcula U12 e atualiza os blocos da matriz restante em uma faixa de colunas."""
+    n = Ab.shape[0]
+    U12 = _resolver_unitaria_inferior(painel[:k1 - k0], Ab[k0:k1, j0:j1])
+    Ab[k0:k1, j0:j1] = U12
+    for i0 in range(k1, n, nb):
+        i1 = min(i0 + nb, n)
+        Ab[i0:i1, j0:j1] -= painel[i0 - k0:i1 - k0] @ U12
+
+def _eliminar_em_blocos(
+    Ab, nb: int, executor: ThreadPoolExecutor | None = None, limite: float | None = None
+) -> int | None:
+    """
+    Triangulariza in-place a matriz aumentada Ab (ndarray ou memmap), painel a painel.
+
+    A partição em blocos depende apenas de `nb`, de modo que cada bloco recebe
+    exatamente as mesmas operações com qualquer número de threads.
+    Retorna o número de trocas de linhas feitas no pivoteamento, ou None se
+    `time.perf_counter()` passou de `limite` antes de algum painel.
+    """
+    total_trocas = 0
+    n = Ab.shape[0]
+    for k0 in range(0, n, nb):
+        if limite is not None and time.perf_counter() > limite:
+            return None
+        k1 = min(k0 + nb, n)
+        painel = np.array(Ab[k0:, k0:k1])
+        trocas = _fatorar_painel(painel, deslocamento=k0)
+        Ab[k0:, k0:k1] = painel
+
+        for c, p in enumerate(trocas):
+            if p != c:
+                total_trocas += 1
+                linha_c = np.array(Ab[k0 + c, k1:])
+                Ab[k0 + c, k1:] = Ab[k0 + p, k1:]
+                Ab[k0 + p, k1:] = linha_c
+
+        faixas = [(j0, min(j0 + nb, n + 1)) for j0 in range(k1, n + 1, nb)]
+        if executor is None:
+            for j0, j1 in faixas:
+                _atualizar_coluna_de_blocos(Ab, painel, k0, k1, j0, j1, nb)
+        else:
+            tarefas = [
+                executor.submit(_atualizar_coluna_de_blocos, Ab, painel, k0, k1, j0, j1, nb)
+                for j0, j1 in faixas
+            ]
+            for tarefa in tarefas:
+                tarefa.result()
+    return total_trocas
+
+def _retrossubstituir_em_blocos(Ab, x, nb: int) -> None:
+    """Substituição retroativa por blocos sobre a matriz triangularizada Ab."""
+    n = Ab.shape[0]
+    for k0 in reversed(range(0, n, nb)):
+        k1 = min(k0 + nb, n)
+        c = np.array(Ab[k0:k1, n])
+        for j0 in range(k1, n, nb):
+            j1 = min(j0 + nb, n)
+            c -= Ab[k0:k1, j0:j1] @ x[j0:j1]
+        x[k0:k1] = _substituicao_retroativa(np.array(Ab[k0:k1, k0:k1]), c, deslocamento=k0)
+
+def eliminacao_gaussiana_blocos(
+    A: np.ndarray,
+    b: np.ndarray,
+    tamanho_bloco: int = 64,
+    num_threads: int | None = None,
+    contadores: dict | None = None,
+    prazo: float | None = None,
+) -> np.ndarray | None:
+    """
+    Resolve Ax = b por eliminação gaussiana em blocos, com a atualização da
+    matriz restante dividida em tarefas executadas em um pool de threads.
+
+    Args:
+        A: Matriz de coeficientes (n x n)
+        b: Vetor de termos independentes (n x 1)
+        tamanho_bloco: Largura dos painéis e blocos
+        num_threads: Número de threads (None usa todos os núcleos; 1 desativa o pool)
+        contadores: Se informado, acumula em "trocas_pivo" o número de trocas de linhas
+        prazo: Se informado, desiste após `prazo` segundos
+
+    Returns:
+        Vetor solução x (idêntico bit a bit para qualquer número de threads),
+        ou None se o prazo acabou
+    """
+    n = len(b)
+    if num_threads is None:
+        num_threads = os.cpu_count() or 1
+    if num_threads < 1:
+        raise ValueError("O número de threads deve ser positivo.")
+    limite = None if prazo is None else time.perf_counter() + prazo
+    Ab = matriz_aumentada(A, b)
+
+    if num_threads == 1:
+        trocas = _eliminar_em_blocos(Ab, tamanho_bloco, limite=limite)
+    else:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            trocas = _eliminar_em_blocos(Ab, tamanho_bloco, executor, limite)
+    if trocas is None:
+        return None
+    if contadores is not None:
+        contadores["trocas_pivo"] = contadores.get("trocas_pivo", 0) + trocas
+
+    x = np.zeros(n)
+    _retrossubstituir_em_blocos(Ab, x, tamanho_bloco)
+    return x
+
+def eliminacao_gaussiana_em_disco(
+    caminho_sistema: str,
+    caminho_solucao: str,
+    tamanho_bloco: int = 256,
+    memoria_maxima: int = 256 * 2**20,
+    num_threads: int = 1,
+) -> np.memmap:
+    """
+    Resolve [A|b] armazenado em disco (.npy) por eliminação gaussiana em blocos.
+
+    A matriz aumentada é aberta como memmap e fatorada in-place, painel a painel:
+    cada painel de colunas é trazido para a memória e fatorado com pivoteamento
+    parcial; a matriz restante é atualizada bloco a bloco. Nunca há mais que um
+    painel e alguns blocos por thread na memória ao mesmo tempo.
+
+    Args:
+        caminho_sistema: Arquivo .npy com a matriz aumentada n x (n+1) (é sobrescrito)
+        caminho_solucao: Arquivo .npy onde a solução será gravada
+        tamanho_bloco: Largura máxima dos painéis/blocos
+        memoria_maxima: Orçamento de memória em bytes para os blocos em RAM
+        num_threads: Threads usadas na atualização da matriz restante
+
+    Returns:
+        Vetor solução x (memmap somente leitura sobre `caminho_solucao`)
+    """
+    Ab = np.load(caminho_sistema, mmap_mode="r+")
+    n = Ab.shape[0]
+    if Ab.shape != (n, n + 1):
+        raise ValueError("O arquivo deve conter uma matriz aumentada n x (n+1).")
+    nb = tamanho_bloco_para_memoria(n, memoria_maxima, tamanho_bloco, num_threads)
+
+    if num_threads == 1:
+        _eliminar_em_blocos(Ab, nb)
+    else:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            _eliminar_em_blocos(Ab, nb, executor)
+    Ab.flush()
+
+    x = np.lib.format.open_memmap(caminho_solucao, mode="w+", dtype=np.float64, shape=(n,))
+    _retrossubstituir_em_blocos(Ab, x, nb)
+    x.flush()
+    del x, Ab
+
+    return np.load(caminho_solucao, mmap_mode="r")
+
 def criar_sistema_mineracao(necessidades: List[float], composicao: List[List[float]]) -> Tuple[np.ndarray, np.ndarray]:
     """
     Cria o sistema de equações lineares para o problema de mineração.
@@ -102,6 +358,97 @@ def criar_sistema_mineracao(necessidades: List[float], composicao: List[List[flo
     
     return A, b
 
+def minimos_quadrados_qr(A: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Resolve min ||Ax - b|| para sistemas sobre ou subdeterminados.
+
+    Usa a fatoração QR quando A tem posto completo por colunas; caso contrário
+    recorre à solução de norma mínima de `np.linalg.lstsq`.
+    """
+    m, n = A.shape
+    if m >= n:
+        Q, R = np.linalg.qr(A)
+        diagonal = np.abs(np.diag(R))
+        if n == 0 or diagonal.min() > np.finfo(float).eps * max(m, n) * diagonal.max():
+            return _substituicao_retroativa(R, Q.T @ b)
+    return np.linalg.lstsq(A, b, rcond=None)[0]
+
+def _resolver_passivo(AtA: np.ndarray, Atb: np.ndarray, passivo: np.ndarray) -> np.ndarray:
+    """Solução de mínimos quadrados restrita às variáveis do conjunto passivo."""
+    s = np.zeros(len(Atb))
+    if passivo.any():
+        G = AtA[np.ix_(passivo, passivo)]
+        try:
+            s[passivo] = np.linalg.solve(G, Atb[passivo])
+        except np.linalg.LinAlgError:
+            s[passivo] = np.linalg.lstsq(G, Atb[passivo], rcond=None)[0]
+    return s
+
+def _passo_viavel(x: np.ndarray, s: np.ndarray, passivo: np.ndarray) -> float:
+    """
+    Maior fração do caminho de x até s que mantém x >= 0 (passo de Lawson-Hanson).
+    Só limitam o passo as variáveis passivas com s_j <= 0 que de fato diminuem
+    (x_j > s_j); uma com x_j = s_j = 0 não gera 0/0.
+    """
+    bloqueantes = passivo & (s <= 0) & (x > s)
+    return float(np.min(x[bloqueantes] / (x[bloqueantes] - s[bloqueantes]), initial=1.0))
+
+def nnls_conjunto_ativo(
+    A: np.ndarray,
+    b: np.ndarray,
+    x_inicial: np.ndarray | None = None,
+    max_iter: int | None = None,
+) -> Tuple[np.ndarray, int]:
+    """
+    Resolve min ||Ax - b|| com x >= 0 pelo método de conjunto ativo de Lawson-Hanson
+    (variante de Bro e De Jong, sobre a matriz de Gram A^T A).
+
+    Args:
+        A: Matriz de coeficientes (m x n), m e n quaisquer
+        b: Vetor de termos independentes (m)
+        x_inicial: Solução de um problema parecido, usada como partida a quente
+        max_iter: Limite de iterações externas (padrão: 3n)
+
+    Returns:
+        Tupla (x, iteracoes)
+    """
+    m, n = A.shape
+    AtA = A.T @ A
+    Atb = A.T @ b
+    tol = 10 * np.finfo(float).eps * max(m, n) * max(np.abs(AtA).sum(axis=0).max(initial=0.0), 1.0)
+    if max_iter is None:
+        max_iter = 3 * n
+
+    x = np.zeros(n) if x_inicial is None else np.clip(np.asarray(x_inicial, dtype=float), 0.0, None)
+    if x.shape != (n,):
+        raise ValueError("A solução inicial deve ter uma entrada por mina.")
+    passivo = x > 0
+
+    def ajustar(x: np.ndarray, passivo: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        s = _resolver_passivo(AtA, Atb, passivo)
+        while passivo.any() and s[passivo].min() <= 0:
+            alfa = _passo_viavel(x, s, passivo)
+            x = x + alfa * (s - x)
+            passivo = passivo & (x > tol)
+            x[~passivo] = 0.0
+            s = _resolver_passivo(AtA, Atb, passivo)
+        return s, passivo
+
+    if passivo.any():
+        x, passivo = ajustar(x, passivo)
+
+    iteracoes = 0
+    w = Atb - AtA @ x
+    while iteracoes < max_iter and (~passivo).any() and w[~passivo].max() > tol:
+        iteracoes += 1
+        j = int(np.argmax(np.where(passivo, -np.inf, w)))
+        passivo = passivo.copy()
+        passivo[j] = True
+        x, passivo = ajustar(x, passivo)
+        w = Atb - AtA @ x
+
+    return x, iteracoes
+
 def verificar_solucao(A: np.ndarray, b: np.ndarray, x: np.ndarray) -> None:
     """Verifica se a solução encontrada está correta."""
     resultado = A @ x
@@ -38,32 +38,306 @@ def matriz_questao():
     ], dtype=float)
 
 
-def gauss_sidel(matriz, row, col, precision=0.0001):
-    pr = precision
+def iterar_gauss_sidel(
+    matriz,
+    row,
+    col,
+    precision=0.0001,
+    k_inicial=None,
+    economizar_memoria=False,
+    max_iter=10000,
+    ordem_original=False,
+):
+    """
+    Gera o iterado de Gauss-Seidel e o critério de parada a cada varredura.
 
-    diff = np.zeros(col-1)
-    k = np.zeros(col-1)
-    k1 = np.zeros(col-1)
+    Produz (k, diffR) após cada varredura e termina quando diffR <= precision;
+    levanta ValueError se não convergir em `max_iter` varreduras (None não
+    limita). Com k_inicial a iteração continua a partir de um iterado salvo,
+    reproduzindo exatamente as varreduras seguintes.
 
-    diffR = 0
+    Por padrão cada varredura é um produto matriz-vetor, cuja ordem de soma
+    difere da do laço original por arredondamento. Com ordem_original, as
+    somas seguem coluna a coluna a ordem do laço (resultado idêntico bit a bit
+    ao de antes da vetorização, mas mais lento para n grande).
 
-    for i in range(row):
-        k[i] =  ( matriz[i][col-1] / matriz[i][i] )
+    Com economizar_memoria, a parte fora da diagonal não é copiada: cada
+    varredura usa A @ k - diag(A) * k direto sobre `matriz` (memória extra O(n)).
+    """
+    b = matriz[:row, col-1]
+    A = matriz[:row, :col-1]
+    diagonal = np.diagonal(A).copy()
+    if ordem_original:
+        produto = lambda k: _somas_fora_diagonal(A, k)
+    elif economizar_memoria:
+        produto = lambda k: A @ k - diagonal * k
+    else:
+        fora_diagonal = np.array(A, dtype=float)
+        np.fill_diagonal(fora_diagonal, 0.0)
+        produto = lambda k: fora_diagonal @ k
+
+    if k_inicial is None:
+        k = b / diagonal
+    else:
+        k = np.array(k_inicial, dtype=float)
+
+    iteracoes = 0
     while True:
-        for i in range(row):
-            res = 0
-            for j in range(col-1):
-                if(i != j):
-                    res += matriz[i][j]*k[j]
-            k1[i] = ( matriz[i][col-1] - res ) / matriz[i][i]
-            diff[i] = abs( k1[i] - k[i] )
-        k = k1.copy()
-        diffR = diff.max() / np.abs(k1).max()
-        if(diffR <= pr):
-            break;
+        k1 = (b - produto(k)) / diagonal
+        # Com k1 nulo (termos independentes nulos) a solução é exata: mede a diferença absoluta.
+        norma = np.abs(k1).max()
+        diffR = np.abs(k1 - k).max() / (norma if norma != 0 else 1.0)
+        k = k1
+        iteracoes += 1
+        yield k, diffR
+        if diffR <= precision:
+            return
+        if max_iter is not None and iteracoes >= max_iter:
+            raise ValueError(f"Gauss-Seidel não convergiu em {max_iter} iterações (diffR = {diffR:.3g}).")
+
+
+def _somas_fora_diagonal(A, k):
+    """soma_{j != i} a_ij k_j somando j em ordem crescente, como no laço original."""
+    res = np.zeros(len(A))
+    for j in range(A.shape[1]):
+        res[:j] += A[:j, j] * k[j]
+        res[j+1:] += A[j+1:, j] * k[j]
+    return res
+
+
+def gauss_sidel(matriz, row, col, precision=0.0001, max_iter=10000):
+    k = None
+    for k, diffR in iterar_gauss_sidel(matriz, row, col, precision, max_iter=max_iter, ordem_original=True):
+        pass
     return k
 
 
+def gauss_sidel_lote(A, B, precision=0.0001, max_iter=10000):
+    """
+    Aplica a iteração de gauss_sidel a vários sistemas de uma só vez.
+
+    A: matriz de coeficientes compartilhada (n x n) ou pilha de matrizes (L x n x n)
+    B: termos independentes, um sistema por linha (L x n)
+
+    As varreduras são vetorizadas na dimensão do lote; cada sistema tem seu
+    próprio critério de parada e, ao convergir, deixa de ser atualizado.
+    Retorna (solucoes L x n, iteracoes por sistema, convergiu por sistema).
+    """
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    compartilhada = A.ndim == 2
+    diagonal = np.diagonal(A, axis1=-2, axis2=-1)
+    if (diagonal == 0).any():
+        raise ValueError("A diagonal principal não pode ter zeros.")
+    fora_diagonal = A.copy()
+    fora_diagonal[..., np.arange(A.shape[-1]), np.arange(A.shape[-1])] = 0.0
+
+    k = B / diagonal
+    iteracoes = np.zeros(len(B), dtype=int)
+    convergiu = np.zeros(len(B), dtype=bool)
+    ativos = np.arange(len(B))
+
+    while ativos.size and iteracoes[ativos[0]] < max_iter:
+        ka = k[ativos]
+        if compartilhada:
+            res = ka @ fora_diagonal.T
+            k1 = (B[ativos] - res) / diagonal
+        else:
+            res = np.einsum("lij,lj->li", fora_diagonal[ativos], ka)
+            k1 = (B[ativos] - res) / diagonal[ativos]
+        norma = np.abs(k1).max(axis=1)
+        norma[norma == 0] = 1.0  # sistema com solução nula: diferença absoluta
+        diffR = np.abs(k1 - ka).max(axis=1) / norma
+        k[ativos] = k1
+        iteracoes[ativos] += 1
+        prontos = diffR <= precision
+        convergiu[ativos[prontos]] = True
+        ativos = ativos[~prontos]
+
+    return k, iteracoes, convergiu
+
+
+def _vizinhos_malha(v, gh, gv):
+    """Soma, em cada nó, das condutâncias vezes a tensão dos nós vizinhos."""
+    s = np.zeros_like(v)
+    s[:, :-1] += gh * v[:, 1:]
+    s[:, 1:] += gh * v[:, :-1]
+    s[:-1, :] += gv * v[1:, :]
+    s[1:, :] += gv * v[:-1, :]
+    return s
+
+
+def aplicar_malha(v, gh, gv, diagonal):
+    """Produto A·v da matriz nodal da malha, sem montá-la."""
+    return diagonal * v - _vizinhos_malha(v, gh, gv)
+
+
+def varredura_gauss_seidel_malha(v, b, gh, gv, diagonal, cores):
+    """
+    Uma varredura de Gauss-Seidel sobre a malha, em ordenação vermelho-preto.
+
+    É a mesma atualização de gauss_sidel, x_i = (b_i - soma_j a_ij x_j) / a_ii,
+    aplicada sem montar a matriz: os nós de uma cor só dependem dos da outra,
+    então cada meia varredura é vetorizada.
+    """
+    for cor in cores:
+        novo = (b + _vizinhos_malha(v, gh, gv)) / diagonal
+        v[cor] = novo[cor]
+    return v
+
+
+def _tamanho_grosso(n):
+    return (n + 1) // 2 if n >= 3 else n
+
+
+def _prolongar_eixo(c, n_fino, eixo):
+    """Interpolação linear de um eixo da malha grossa para a fina."""
+    c = np.moveaxis(c, eixo, -1)
+    n_grosso = c.shape[-1]
+    if n_grosso == n_fino:
+        return np.moveaxis(c, -1, eixo)
+    f = np.empty(c.shape[:-1] + (n_fino,))
+    f[..., ::2] = c
+    impares = n_fino // 2
+    direita = np.minimum(np.arange(impares) + 1, n_grosso - 1)
+    f[..., 1::2] = 0.5 * (c[..., :impares] + c[..., direita])
+    return np.moveaxis(f, -1, eixo)
+
+
+def _restringir_eixo(f, n_grosso, eixo):
+    """Transposta de _prolongar_eixo (conserva a corrente total injetada)."""
+    f = np.moveaxis(f, eixo, -1)
+    n_fino = f.shape[-1]
+    if n_grosso == n_fino:
+        return np.moveaxis(f, -1, eixo)
+    c = f[..., ::2].copy()
+    impares = n_fino // 2
+    meio = 0.5 * f[..., 1::2]
+    c[..., :impares] += meio
+    if impares < n_grosso:
+        c[..., 1:impares + 1] += meio
+    else:
+        c[..., 1:impares] += meio[..., :impares - 1]
+        c[..., -1] += meio[..., -1]
+    return np.moveaxis(c, -1, eixo)
+
+
+def _engrossar_arestas(g, ao_longo, atraves):
+    """
+    Condutâncias das arestas da malha grossa (arestas ao longo do último eixo).
+
+    Duas arestas em série ao longo do eixo engrossado viram g1·g2/(g1+g2);
+    engrossar o eixo transversal dobra a largura, e a condutância dobra.
+    """
+    if ao_longo:
+        n_arestas = g.shape[1] // 2
+        g1 = g[:, 0:2 * n_arestas:2]
+        g2 = g[:, 1:2 * n_arestas:2]
+        soma = g1 + g2
+        g = np.divide(g1 * g2, soma, out=np.zeros_like(soma), where=soma > 0)
+    if atraves:
+        g = 2 * g[::2]
+    return g
+
+
+def _montar_matriz_malha(gh, gv, diagonal):
+    """Matriz nodal densa (usada apenas no nível mais grosso)."""
+    ny, nx = diagonal.shape
+    indice = np.arange(ny * nx).reshape(ny, nx)
+    A = np.diag(diagonal.ravel())
+    a, b = indice[:, :-1].ravel(), indice[:, 1:].ravel()
+    A[a, b] -= gh.ravel()
+    A[b, a] -= gh.ravel()
+    a, b = indice[:-1, :].ravel(), indice[1:, :].ravel()
+    A[a, b] -= gv.ravel()
+    A[b, a] -= gv.ravel()
+    return A
+
+
+def montar_niveis_malha(gh, gv, gt, nos_diretos=256):
+    """
+    Hierarquia de malhas para o multigrid geométrico.
+
+    Cada nível guarda as condutâncias, a diagonal e as máscaras vermelho-preto;
+    o nível mais grosso guarda também a matriz densa para solução direta.
+    """
+    niveis = []
+    while True:
+        ny, nx = gt.shape
+        diagonal = gt.copy()
+        diagonal[:, :-1] += gh
+        diagonal[:, 1:] += gh
+        diagonal[:-1, :] += gv
+        diagonal[1:, :] += gv
+        paridade = np.add.outer(np.arange(ny), np.arange(nx)) % 2
+        nivel = {"gh": gh, "gv": gv, "diagonal": diagonal, "cores": (paridade == 0, paridade == 1)}
+        niveis.append(nivel)
+
+        nyc, nxc = _tamanho_grosso(ny), _tamanho_grosso(nx)
+        if ny * nx <= nos_diretos or (nyc, nxc) == (ny, nx):
+            nivel["direta"] = _montar_matriz_malha(gh, gv, diagonal)
+            return niveis
+        gh = _engrossar_arestas(gh, nxc < nx, nyc < ny)
+        gv = _engrossar_arestas(gv.T, nyc < ny, nxc < nx).T
+        gt = _restringir_eixo(_restringir_eixo(gt, nyc, 0), nxc, 1)
+
+
+def _ciclo_multigrid(niveis, nivel, v, b, gamma, pre, pos):
+    atual = niveis[nivel]
+    if "direta" in atual:
+        return np.linalg.solve(atual["direta"], b.ravel()).reshape(b.shape)
+
+    gh, gv, diagonal, cores = atual["gh"], atual["gv"], atual["diagonal"], atual["cores"]
+    for _ in range(pre):
+        varredura_gauss_seidel_malha(v, b, gh, gv, diagonal, cores)
+
+    r = b - aplicar_malha(v, gh, gv, diagonal)
+    ny, nx = b.shape
+    grosso = niveis[nivel + 1]["diagonal"].shape
+    rc = _restringir_eixo(_restringir_eixo(r, grosso[0], 0), grosso[1], 1)
+    ec = np.zeros(grosso)
+    for _ in range(gamma if "direta" not in niveis[nivel + 1] else 1):
+        ec = _ciclo_multigrid(niveis, nivel + 1, ec, rc, gamma, pre, pos)
+    v += _prolongar_eixo(_prolongar_eixo(ec, ny, 0), nx, 1)
+
+    for _ in range(pos):
+        varredura_gauss_seidel_malha(v, b, gh, gv, diagonal, cores[::-1])
+    return v
+
+
+def multigrid_malha(correntes, gh, gv, gt, precision=1e-6, ciclo="V", max_ciclos=100, pre=2, pos=2):
+    """
+    Resolve a análise nodal de uma malha resistiva 2-D por multigrid geométrico.
+
+    correntes: corrente injetada em cada nó (linhas x colunas)
+    gh: condutâncias entre nós vizinhos na horizontal (linhas x colunas-1)
+    gv: condutâncias entre nós vizinhos na vertical (linhas-1 x colunas)
+    gt: condutância de cada nó para a terra (linhas x colunas)
+
+    Usa a varredura de Gauss-Seidel como suavizador e para quando o resíduo
+    relativo ||b - Av|| / ||b|| fica abaixo de `precision`. Retorna as tensões
+    nodais e o histórico de resíduos relativos (um por ciclo).
+    """
+    if ciclo not in ("V", "W"):
+        raise ValueError("O ciclo deve ser 'V' ou 'W'.")
+    gamma = 1 if ciclo == "V" else 2
+
+    niveis = montar_niveis_malha(gh, gv, gt)
+    b = np.asarray(correntes, dtype=float)
+    v = np.zeros_like(b)
+    norma_b = np.linalg.norm(b)
+    if norma_b == 0:
+        return v, [0.0]
+
+    fino = niveis[0]
+    historico = []
+    for _ in range(max_ciclos):
+        v = _ciclo_multigrid(niveis, 0, v, b, gamma, pre, pos)
+        r = b - aplicar_malha(v, fino["gh"], fino["gv"], fino["diagonal"])
+        historico.append(float(np.linalg.norm(r) / norma_b))
+        if historico[-1] <= precision:
+            break
+    return v, historico
 
 
 def gauss(matriz,rows,col):
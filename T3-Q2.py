@@ -1,98 +1,103 @@
 import numpy as np
+from typing import Tuple
 
-def interpolacao_lagrange(x_pontos, y_pontos, x_alvo, mostrar_passos: bool = True):
+from passos import RegistroPassos
+
+def _registro_para(mostrar_passos: bool, registro: RegistroPassos | None) -> Tuple[RegistroPassos | None, bool]:
+    """Sem registro explícito, `mostrar_passos` usa um registro próprio impresso ao final."""
+    if registro is None and mostrar_passos:
+        return RegistroPassos(matrizes=True), True
+    return registro, False
+
+def interpolacao_lagrange(x_pontos, y_pontos, x_alvo, mostrar_passos: bool = True, registro: RegistroPassos | None = None):
     """Calcula a interpolação usando o método de Lagrange."""
-    n = len(x_pontos)
-    resultado = 0.0
+    registro, imprimir = _registro_para(mostrar_passos, registro)
+    try:
+        n = len(x_pontos)
+        resultado = 0.0
     
-    if mostrar_passos:
-        print("\n=== MÉTODO DE LAGRANGE ===")
-        print(f"\nCalculando para x = {x_alvo}")
+        if registro is not None:
+            registro.registrar("secao", "MÉTODO DE LAGRANGE")
+            registro.registrar("calculo", x_alvo)
+            x_registrados = tuple(x_pontos)
     
-    for i in range(n):
-        termo = y_pontos[i]
-        L_i = 1.0
-        
-        if mostrar_passos:
-            print(f"\nTermo {i+1}: y_{i} = {y_pontos[i]}")
-            print(f"L_{i}({x_alvo}) = ", end="")
-        
-        numeradores = []
-        denominadores = []
+        for i in range(n):
+            termo = y_pontos[i]
+            L_i = 1.0
         
-        for j in range(n):
-            if i != j:
-                numeradores.append(f"({x_alvo} - {x_pontos[j]})")
-                denominadores.append(f"({x_pontos[i]} - {x_pontos[j]})")
-                L_i *= (x_alvo - x_pontos[j]) / (x_pontos[i] - x_pontos[j])
+            for j in range(n):
+                if i != j:
+                    L_i *= (x_alvo - x_pontos[j]) / (x_pontos[i] - x_pontos[j])
         
-        if mostrar_passos:
-            print(" × ".join(numeradores) + " / " + " × ".join(denominadores))
-            print(f"L_{i}({x_alvo}) = {L_i:.10f}")
-            print(f"Contribuição: {y_pontos[i]} × {L_i:.10f} = {termo * L_i:.10f}")
+            if registro is not None:
+                registro.registrar("lagrange", i, x_registrados, y_pontos[i], x_alvo, L_i)
         
-        resultado += termo * L_i
+            resultado += termo * L_i
     
+    finally:
+        if imprimir:
+            registro.imprimir()
     return resultado
 
-def diferencas_divididas(x_pontos, y_pontos, mostrar_passos: bool = True):
+def diferencas_divididas(x_pontos, y_pontos, mostrar_passos: bool = True, registro: RegistroPassos | None = None):
     """Calcula a tabela de diferenças divididas para Newton."""
-    n = len(x_pontos)
-    tabela = np.zeros((n, n))
-    tabela[:, 0] = y_pontos
-    
-    if mostrar_passos:
-        print("\n=== TABELA DE DIFERENÇAS DIVIDIDAS ===")
-        print(f"{'i':<5} {'x_i':<10} {'f[x_i]':<15}", end="")
-        for ordem in range(1, n):
-            print(f"f[x_i,...,x_i+{ordem}]".ljust(20), end="")
-        print()
-    
-    for j in range(1, n):
-        for i in range(n - j):
-            tabela[i, j] = (tabela[i+1, j-1] - tabela[i, j-1]) / (x_pontos[i+j] - x_pontos[i])
-    
-    if mostrar_passos:
-        for i in range(n):
-            print(f"{i:<5} {x_pontos[i]:<10.2f} {tabela[i, 0]:<15.10f}", end="")
-            for j in range(1, n - i):
-                print(f"{tabela[i, j]:<20.10f}", end="")
-            print()
-    
+    registro, imprimir = _registro_para(mostrar_passos, registro)
+    try:
+        n = len(x_pontos)
+        tabela = np.zeros((n, n))
+        tabela[:, 0] = y_pontos
+    
+        for j in range(1, n):
+            for i in range(n - j):
+                tabela[i, j] = (tabela[i+1, j-1] - tabela[i, j-1]) / (x_pontos[i+j] - x_pontos[i])
+                if registro is not None:
+                    registro.registrar("diferenca", i, j, tabela[i, j])
+    
+        if registro is not None:
+            registro.registrar("tabela_dd", tuple(x_pontos), tabela)
+    finally:
+        if imprimir:
+            registro.imprimir()
     return tabela
 
-def interpolacao_newton(x_pontos, y_pontos, x_alvo, mostrar_passos: bool = True):
+def coeficientes_newton(x_pontos, y_pontos):
+    """
+    Primeira linha da tabela de diferenças divididas (os coeficientes de Newton),
+    calculada no próprio vetor: memória O(n) em vez da tabela n x n.
+    """
+    x = np.asarray(x_pontos, dtype=float)
+    coeficientes = np.array(y_pontos, dtype=float)
+    for j in range(1, len(x)):
+        coeficientes[j:] = (coeficientes[j:] - coeficientes[j-1:-1]) / (x[j:] - x[:-j])
+    return coeficientes
+
+def interpolacao_newton(x_pontos, y_pontos, x_alvo, mostrar_passos: bool = True, registro: RegistroPassos | None = None):
     """Calcula a interpolação usando o método de Newton."""
-    n = len(x_pontos)
-    tabela = diferencas_divididas(x_pontos, y_pontos, mostrar_passos=mostrar_passos)
-    
-    if mostrar_passos:
-        print(f"\n=== MÉTODO DE NEWTON ===")
-        print(f"\nCalculando para x = {x_alvo}")
-        print(f"\nP(x) = f[x_0]", end="")
+    registro, imprimir = _registro_para(mostrar_passos, registro)
+    try:
+        n = len(x_pontos)
+        # A tabela completa só é necessária para mostrar os passos.
+        if registro is None:
+            coeficientes = coeficientes_newton(x_pontos, y_pontos)
+        else:
+            coeficientes = diferencas_divididas(x_pontos, y_pontos, mostrar_passos=False, registro=registro)[0]
+    
+        resultado = coeficientes[0]
+        if registro is not None:
+            x_registrados = tuple(x_pontos)
+            registro.registrar("newton_inicio", x_registrados, x_alvo, coeficientes[0])
+    
+        produto_acumulado = 1.0
         for i in range(1, n):
-            print(f" + f[x_0,...,x_{i}]", end="")
-            for j in range(i):
-                print(f"(x - {x_pontos[j]})", end="")
-        print()
-    
-    resultado = tabela[0, 0]
-    if mostrar_passos:
-        print(f"\nP({x_alvo}) = {tabela[0, 0]:.10f}", end="")
-    
-    produto_acumulado = 1.0
-    for i in range(1, n):
-        produto_acumulado *= (x_alvo - x_pontos[i-1])
-        termo = tabela[0, i] * produto_acumulado
-        if mostrar_passos:
-            print(f" + ({tabela[0, i]:.10f})", end="")
-            for j in range(i):
-                print(f" × ({x_alvo} - {x_pontos[j]})", end="")
-            print(f" = ... + {termo:.10f}", end="")
-        resultado += termo
-    
-    if mostrar_passos:
-        print()
+            produto_acumulado *= (x_alvo - x_pontos[i-1])
+            termo = coeficientes[i] * produto_acumulado
+            if registro is not None:
+                registro.registrar("newton", i, coeficientes[i], x_registrados, x_alvo, termo)
+            resultado += termo
+    
+    finally:
+        if imprimir:
+            registro.imprimir()
     return resultado
 
 def escolher_pontos_centralizados(x_pontos, y_pontos, x_alvo, grau):
@@ -115,6 +120,18 @@ def escolher_pontos_centralizados(x_pontos, y_pontos, x_alvo, grau):
     
     return x_selecionados, y_selecionados
 
+def escolher_pontos_centralizados_vetorizado(x_pontos, y_pontos, x_alvo, grau):
+    """
+    Mesma escolha de `escolher_pontos_centralizados` (empates pela ordem original),
+    com arrays em vez de listas: cerca de 24 bytes por ponto em vez de ~140.
+    """
+    x = np.asarray(x_pontos, dtype=float)
+    y = np.asarray(y_pontos, dtype=float)
+    if len(x) <= grau + 1:
+        return x, y
+    indices = np.sort(np.argsort(np.abs(x - x_alvo), kind="stable")[:grau + 1])
+    return x[indices], y[indices]
+
 def main():
     print("=" * 80)
     print("INTERPOLAÇÃO POLINOMIAL - MÉTODOS DE LAGRANGE E NEWTON")
@@ -28,12 +28,13 @@ def regra_simpson_1_3(profundidades, espacamento, mostrar_aviso: bool = True):
         
         soma_impares = sum(profundidades[i] for i in range(1, n-2, 2))
         soma_pares = sum(profundidades[i] for i in range(2, n-2, 2))
+        # Com dois pontos não há trecho de Simpson, só o Trapézio.
         area_simpson = (espacamento / 3) * (
             profundidades[0] + 
             4 * soma_impares + 
             2 * soma_pares + 
             profundidades[n-2]
-        )
+        ) if n > 2 else 0.0
         
         area_trapezio = espacamento * (profundidades[n-2] + profundidades[n-1]) / 2
         
@@ -50,8 +51,112 @@ def regra_simpson_1_3(profundidades, espacamento, mostrar_aviso: bool = True):
         )
         return area
 
-def imprimir_resultados(profundidades, distancias, espacamento, area_trapezio, area_simpson):
-    """Imprime os resultados formatados"""
+def _passos(distancias):
+    h = np.diff(np.asarray(distancias, dtype=float), axis=-1)
+    if np.any(h <= 0):
+        raise ValueError("As distâncias devem ser estritamente crescentes.")
+    return h
+
+def trapezio_nao_uniforme(distancias, profundidades):
+    """
+    Regra do Trapézio para espaçamentos quaisquer
+    A = Σ (x[i+1] - x[i]) * (y[i] + y[i+1]) / 2
+    Vetorizada: `profundidades` pode ter um perfil por linha.
+    """
+    y = np.asarray(profundidades, dtype=float)
+    h = _passos(distancias)
+    return np.sum(h * (y[..., :-1] + y[..., 1:]), axis=-1) / 2
+
+def simpson_pares_nao_uniforme(distancias, profundidades):
+    """
+    Simpson 1/3 para espaçamentos quaisquer, por pares de intervalos (h0, h1)
+    A = Σ (h0+h1)/6 * [(2 - h1/h0)*y0 + (h0+h1)²/(h0*h1)*y1 + (2 - h0/h1)*y2]
+    Requer número par de intervalos; com h0 = h1 coincide com Simpson 1/3.
+    """
+    y = np.asarray(profundidades, dtype=float)
+    h = _passos(distancias)
+    h0, h1 = h[..., 0::2], h[..., 1::2]
+    soma = h0 + h1
+    termos = (2 - h1 / h0) * y[..., 0:-2:2] + soma * soma / (h0 * h1) * y[..., 1:-1:2] + (2 - h0 / h1) * y[..., 2::2]
+    return np.sum(soma / 6 * termos, axis=-1)
+
+def segmentos_simpson(n_pontos):
+    """
+    Trechos (ponto inicial, ponto final, regra) da Simpson composta: Simpson 1/3
+    até o último ponto de índice par e Trapézio no intervalo que sobrar.
+    """
+    fim = n_pontos - 1 if (n_pontos - 1) % 2 == 0 else n_pontos - 2
+    segmentos = []
+    if fim > 0:
+        segmentos.append((0, fim, "simpson_1_3"))
+    if fim < n_pontos - 1:
+        segmentos.append((n_pontos - 2, n_pontos - 1, "trapezio"))
+    return segmentos
+
+def regra_simpson_nao_uniforme(distancias, profundidades):
+    """
+    Simpson 1/3 composta para espaçamentos quaisquer, com Trapézio no último
+    intervalo quando o número de intervalos é ímpar (como `regra_simpson_1_3`).
+    Retorna (área, segmentos), com os trechos de `segmentos_simpson`.
+    """
+    x = np.asarray(distancias, dtype=float)
+    y = np.asarray(profundidades, dtype=float)
+    segmentos = segmentos_simpson(y.shape[-1])
+    area = 0.0
+    for inicio, fim, regra in segmentos:
+        trecho_x, trecho_y = x[..., inicio:fim + 1], y[..., inicio:fim + 1]
+        if regra == "simpson_1_3":
+            area = area + simpson_pares_nao_uniforme(trecho_x, trecho_y)
+        else:
+            area = area + trapezio_nao_uniforme(trecho_x, trecho_y)
+    return area, segmentos
+
+class IntegradorPerfil:
+    """
+    Trapézio e Simpson (não uniformes) acumulados bloco a bloco, para perfis
+    grandes demais para a memória. Entre blocos ficam guardados só os um ou
+    dois últimos pontos ainda não integrados pela Simpson.
+    """
+
+    def __init__(self):
+        self.area_trapezio = 0.0
+        self.area_simpson_pares = 0.0
+        self.pontos = 0
+        self._pendentes_x = np.empty(0)
+        self._pendentes_y = np.empty(0)
+
+    def adicionar(self, distancias, profundidades):
+        x = np.asarray(distancias, dtype=float).ravel()
+        y = np.asarray(profundidades, dtype=float).ravel()
+        if x.shape != y.shape:
+            raise ValueError("Listas de distâncias e profundidades devem ter o mesmo tamanho.")
+        if not len(x):
+            return
+        x = np.concatenate((self._pendentes_x, x))
+        y = np.concatenate((self._pendentes_y, y))
+        if len(self._pendentes_x):
+            # O último ponto pendente já entrou no Trapézio; só os intervalos novos contam.
+            self.area_trapezio += trapezio_nao_uniforme(x[len(self._pendentes_x) - 1:], y[len(self._pendentes_y) - 1:])
+        elif len(x) > 1:
+            self.area_trapezio += trapezio_nao_uniforme(x, y)
+        self.pontos += len(x) - len(self._pendentes_x)
+
+        pares = (len(x) - 1) // 2
+        if pares:
+            self.area_simpson_pares += simpson_pares_nao_uniforme(x[:2 * pares + 1], y[:2 * pares + 1])
+        self._pendentes_x, self._pendentes_y = x[2 * pares:], y[2 * pares:]
+
+    def resultado(self):
+        """Retorna (área pelo Trapézio, área pela Simpson, segmentos da Simpson)."""
+        if self.pontos < 2:
+            raise ValueError("Forneça pelo menos dois pontos de profundidade.")
+        area_simpson = self.area_simpson_pares
+        if len(self._pendentes_x) == 2:
+            area_simpson += trapezio_nao_uniforme(self._pendentes_x, self._pendentes_y)
+        return self.area_trapezio, area_simpson, segmentos_simpson(self.pontos)
+
+def imprimir_resultados(profundidades, distancias, espacamento, area_trapezio, area_simpson, segmentos=None):
+    """Imprime os resultados formatados (espacamento None indica pontos desigualmente espaçados)"""
     print("\n" + "="*70)
     print("DADOS DE ENTRADA")
     print("="*70)
@@ -60,7 +165,10 @@ def imprimir_resultados(profundidades, distancias, espacamento, area_trapezio, a
     for i, (dist, prof) in enumerate(zip(distancias, profundidades)):
         print(f"{i:<8} {dist:<18.2f} {prof:<20.2f}")
     
-    print(f"\nEspaçamento entre pontos: {espacamento:.2f} m")
+    if espacamento is None:
+        print("\nEspaçamento entre pontos: não uniforme (regras para espaçamentos quaisquer)")
+    else:
+        print(f"\nEspaçamento entre pontos: {espacamento:.2f} m")
     print(f"Número de pontos: {len(profundidades)}")
     print(f"Número de intervalos: {len(profundidades)-1}")
     
@@ -71,6 +179,8 @@ def imprimir_resultados(profundidades, distancias, espacamento, area_trapezio, a
     print(f"Área pela Regra de Simpson 1/3:     {area_simpson:.4f} m²")
     print(f"Diferença entre os métodos:         {abs(area_trapezio - area_simpson):.4f} m²")
     print(f"Diferença percentual:               {abs(area_trapezio - area_simpson)/area_simpson*100:.2f}%")
+    for inicio, fim, regra in segmentos or []:
+        print(f"Simpson composta - pontos {inicio} a {fim}: {regra}")
     print("="*70)
 
 def main():
@@ -114,8 +224,7 @@ def main():
             if np.allclose(diferencas, diferencas[0], rtol=0.01):
                 espacamento = diferencas[0]
             else:
-                print("\nERRO: Os métodos requerem pontos igualmente espaçados!")
-                return
+                espacamento = None
         
         print("\nInsira as profundidades:")
         profundidades = []
@@ -124,11 +233,20 @@ def main():
             profundidades.append(prof)
         profundidades = np.array(profundidades)
     
-    area_trapezio = regra_trapezio(profundidades, espacamento)
-    area_simpson = regra_simpson_1_3(profundidades, espacamento)
+    try:
+        if espacamento is None:
+            area_trapezio = trapezio_nao_uniforme(distancias_acum, profundidades)
+            area_simpson, segmentos = regra_simpson_nao_uniforme(distancias_acum, profundidades)
+        else:
+            area_trapezio = regra_trapezio(profundidades, espacamento)
+            area_simpson = regra_simpson_1_3(profundidades, espacamento)
+            segmentos = segmentos_simpson(len(profundidades))
+    except ValueError as e:
+        print(f"\nErro ao calcular a área: {e}")
+        return
     
     imprimir_resultados(profundidades, distancias_acum, espacamento, 
-                       area_trapezio, area_simpson)
+                       area_trapezio, area_simpson, segmentos)
 
 if __name__ == "__main__":
     main()
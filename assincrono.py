@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import threading
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Sequence, Tuple
+
+import numpy as np
+
+from solvers import (
+    CircuitResult,
+    Q1Result,
+    Q2Result,
+    Q3Result,
+    SolucaoCancelada,
+    solve_circuit,
+    solve_q1,
+    solve_q2,
+    solve_q3,
+)
+
+# As soluções rodam em threads: o numpy libera o GIL nas operações pesadas e o
+# evento de cancelamento precisa ser visto pelo solver, o que um processo não permite.
+_trava = threading.Lock()
+_executor: Executor | None = None
+_executor_proprio = False
+_max_concorrencia = os.cpu_count() or 1
+_semaforos: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def configurar(max_concorrencia: int | None = None, executor: Executor | None = None) -> None:
+    """Define o limite de soluções simultâneas e, opcionalmente, o executor (de threads) usado.
+
+    Sem `executor`, um ThreadPoolExecutor com `max_concorrencia` threads é
+    criado sob demanda e encerrado por `encerrar()`.
+    """
+    global _executor, _executor_proprio, _max_concorrencia
+    if max_concorrencia is not None and max_concorrencia < 1:
+        raise ValueError("O limite de concorrência deve ser positivo.")
+    encerrar()
+    with _trava:
+        _max_concorrencia = max_concorrencia or os.cpu_count() or 1
+        _executor, _executor_proprio = executor, False
+        _semaforos.clear()
+
+
+def encerrar() -> None:
+    """Encerra o executor criado por este módulo (um executor informado em `configurar` não é tocado)."""
+    global _executor, _executor_proprio
+    with _trava:
+        executor, proprio = _executor, _executor_proprio
+        _executor, _executor_proprio = None, False
+    if executor is not None and proprio:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _executor_ativo() -> Executor:
+    global _executor, _executor_proprio
+    with _trava:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_max_concorrencia, thread_name_prefix="solver-async")
+            _executor_proprio = True
+        return _executor
+
+
+def _semaforo(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    with _trava:
+        semaforo = _semaforos.get(loop)
+        if semaforo is None:
+            semaforo = _semaforos[loop] = asyncio.Semaphore(_max_concorrencia)
+        return semaforo
+
+
+async def _executar(funcao: Callable[..., object], *args, cancelamento: threading.Event | None = None, **kwargs):
+    """Roda `funcao` no executor respeitando o limite de concorrência.
+
+    Se a tarefa for cancelada, aciona `cancelamento` e espera a thread terminar
+    (ela não pode ser interrompida) antes de liberar a vaga e propagar o
+    `CancelledError`.
+    """
+    loop = asyncio.get_running_loop()
+    async with _semaforo(loop):
+        futuro = loop.run_in_executor(_executor_ativo(), functools.partial(funcao, *args, **kwargs))
+        try:
+            return await asyncio.shield(futuro)
+        except asyncio.CancelledError:
+            if cancelamento is not None:
+                cancelamento.set()
+            await asyncio.wait({futuro})
+            if not futuro.cancelled():
+                futuro.exception()  # SolucaoCancelada ou resultado descartado
+            raise
+        except SolucaoCancelada:
+            if cancelamento is not None and cancelamento.is_set():
+                raise asyncio.CancelledError() from None
+            raise
+
+
+async def solve_q1_async(*args, **kwargs) -> Q1Result:
+    """`solve_q1` executado fora do laço de eventos."""
+    return await _executar(solve_q1, *args, **kwargs)
+
+
+async def solve_q2_async(*args, **kwargs) -> Q2Result:
+    """`solve_q2` executado fora do laço de eventos."""
+    return await _executar(solve_q2, *args, **kwargs)
+
+
+async def solve_q3_async(*args, **kwargs) -> Q3Result:
+    """`solve_q3` executado fora do laço de eventos."""
+    return await _executar(solve_q3, *args, **kwargs)
+
+
+class SolucaoAssincrona:
+    """Solução iterativa em andamento no executor.
+
+    `async for iteracao, diffR in solucao` acompanha o progresso e `await
+    solucao` devolve o resultado. O progresso é coalescido: quem consome mais
+    devagar que as varreduras recebe sempre o mais recente. Cancelar a tarefa
+    que espera (ou chamar `cancelar()`, ou sair do `async with` antes do fim)
+    interrompe o solver entre duas varreduras.
+    """
+
+    def __init__(self, solver: Callable[..., object], *args, **kwargs) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._cancelamento = threading.Event()
+        self._ultimo: Tuple[int, float] | None = None
+        self._aviso_pendente = False
+        self._sinal = asyncio.Event()
+        chamada = functools.partial(solver, *args, progresso=self._relatar, cancelamento=self._cancelamento, **kwargs)
+        self._tarefa = asyncio.ensure_future(_executar(chamada, cancelamento=self._cancelamento))
+        self._tarefa.add_done_callback(lambda _tarefa: self._sinal.set())
+
+    def _relatar(self, iteracao: int, diffR: float) -> None:
+        # Thread do solver: guarda o progresso e acorda o laço no máximo uma vez por vez.
+        self._ultimo = (iteracao, diffR)
+        if not self._aviso_pendente:
+            self._aviso_pendente = True
+            self._loop.call_soon_threadsafe(self._avisar)
+
+    def _avisar(self) -> None:
+        self._aviso_pendente = False
+        self._sinal.set()
+
+    def cancelar(self) -> None:
+        self._tarefa.cancel()
+
+    def done(self) -> bool:
+        return self._tarefa.done()
+
+    def __aiter__(self) -> SolucaoAssincrona:
+        return self
+
+    async def __anext__(self) -> Tuple[int, float]:
+        while True:
+            progresso, self._ultimo = self._ultimo, None
+            if progresso is not None:
+                return progresso
+            if self._tarefa.done():
+                raise StopAsyncIteration
+            self._sinal.clear()
+            try:
+                await self._sinal.wait()
+            except asyncio.CancelledError:
+                self.cancelar()
+                raise
+
+    async def resultado(self) -> object:
+        try:
+            return await asyncio.shield(self._tarefa)
+        except asyncio.CancelledError:
+            self.cancelar()
+            raise
+
+    def __await__(self):
+        return self.resultado().__await__()
+
+    async def __aenter__(self) -> SolucaoAssincrona:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        if not self._tarefa.done():
+            self.cancelar()
+            await asyncio.wait({self._tarefa})
+
+
+def iniciar_circuit(
+    matriz: Sequence[Sequence[float]] | np.ndarray,
+    precision: float = 0.0001,
+    checkpoint: str | None = None,
+    intervalo_checkpoint: int = 100,
+    metodo: str = "gauss_seidel",
+    orcamento_memoria: int | None = None,
+    max_iter: int | None = 10000,
+    vetorizado: bool = False,
+) -> SolucaoAssincrona:
+    """Inicia `solve_circuit` no executor; deve ser chamada dentro de um laço de eventos."""
+    return SolucaoAssincrona(
+        solve_circuit,
+        matriz,
+        precision,
+        checkpoint=checkpoint,
+        intervalo_checkpoint=intervalo_checkpoint,
+        metodo=metodo,
+        orcamento_memoria=orcamento_memoria,
+        max_iter=max_iter,
+        vetorizado=vetorizado,
+    )
+
+
+async def solve_circuit_async(
+    matriz: Sequence[Sequence[float]] | np.ndarray,
+    precision: float = 0.0001,
+    checkpoint: str | None = None,
+    intervalo_checkpoint: int = 100,
+    metodo: str = "gauss_seidel",
+    orcamento_memoria: int | None = None,
+    max_iter: int | None = 10000,
+    vetorizado: bool = False,
+) -> CircuitResult:
+    """`solve_circuit` executado fora do laço de eventos; o cancelamento para entre varreduras."""
+    async with iniciar_circuit(
+        matriz, precision, checkpoint, intervalo_checkpoint, metodo, orcamento_memoria, max_iter, vetorizado
+    ) as solucao:
+        return await solucao
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from solvers import solve_circuit, solve_q1, solve_q2, solve_q3
+
+TAMANHOS = {
+    "q1": [3, 30, 300],
+    "q2": [5, 500, 50_000],
+    "q2_grau": [4, 16, 64],
+    "q3": [11, 1_001, 100_001, 1_000_001],
+    "circuit": [5, 50, 500, 2_000],
+}
+TAMANHOS_RAPIDOS = {
+    "q1": [3, 30],
+    "q2": [5, 500],
+    "q2_grau": [4, 16],
+    "q3": [11, 1_001],
+    "circuit": [5, 50],
+}
+
+
+def gerar_circuito(n: int, rng: np.random.Generator) -> np.ndarray:
+    """Matriz estendida [A|b] n x (n+1) estritamente diagonal dominante."""
+    A = rng.uniform(-1.0, 1.0, size=(n, n))
+    np.fill_diagonal(A, 0.0)
+    np.fill_diagonal(A, np.abs(A).sum(axis=1) + rng.uniform(1.0, 2.0, size=n))
+    b = rng.uniform(-20.0, 20.0, size=n)
+    return np.column_stack([A, b])
+
+
+def gerar_mistura(n: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Necessidades e composição (n minas x n materiais) de uma mistura bem condicionada."""
+    composicao = rng.uniform(0.0, 1.0, size=(n, n))
+    np.fill_diagonal(composicao, composicao.sum(axis=1) + 1.0)
+    composicao = 100.0 * composicao / composicao.sum(axis=1, keepdims=True)
+    necessidades = rng.uniform(1_000.0, 10_000.0, size=n)
+    return necessidades, composicao
+
+
+def gerar_interpolacao(
+    n: int,
+    rng: np.random.Generator,
+    chebyshev: bool = False,
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """Pontos (x, y) crescentes em [0, 1] e um x alvo no meio do intervalo.
+
+    Com `chebyshev`, usa os nós de Chebyshev, para que polinômios de grau alto
+    continuem numericamente razoáveis.
+    """
+    if chebyshev:
+        x = 0.5 - 0.5 * np.cos(np.pi * (np.arange(n) + 0.5) / n)
+    else:
+        x = np.unique(rng.uniform(0.0, 1.0, size=n))
+    y = np.sin(6.0 * x) + 0.1 * rng.normal(size=x.size)
+    return x, y, 0.5
+
+
+def gerar_perfil(n: int, rng: np.random.Generator) -> Tuple[np.ndarray, float]:
+    """Profundidades de uma seção de rio com n estações igualmente espaçadas."""
+    t = np.linspace(0.0, np.pi, n)
+    profundidades = 5.0 * np.sin(t) + 0.2 * rng.normal(size=n)
+    profundidades[[0, -1]] = 0.0
+    return np.clip(profundidades, 0.0, None), 2.0
+
+
+def _casos(tamanhos: Dict[str, List[int]], semente: int) -> List[Tuple[str, int, Callable[[], object]]]:
+    casos = []
+    for n in tamanhos.get("q1", []):
+        necessidades, composicao = gerar_mistura(n, np.random.default_rng(semente))
+        casos.append(("q1", n, lambda a=necessidades, c=composicao: solve_q1(a, c)))
+    for n in tamanhos.get("q2", []):
+        x, y, alvo = gerar_interpolacao(n, np.random.default_rng(semente))
+        casos.append(("q2", n, lambda x=x, y=y, alvo=alvo: solve_q2(x, y, alvo, min(4, len(x) - 1))))
+    for grau in tamanhos.get("q2_grau", []):
+        x, y, alvo = gerar_interpolacao(grau + 1, np.random.default_rng(semente), chebyshev=True)
+        casos.append(("q2_grau", grau, lambda x=x, y=y, alvo=alvo, g=grau: solve_q2(x, y, alvo, g)))
+    for n in tamanhos.get("q3", []):
+        profundidades, espacamento = gerar_perfil(n, np.random.default_rng(semente))
+        casos.append(("q3", n, lambda p=profundidades, h=espacamento: solve_q3(p, espacamento=h)))
+    for n in tamanhos.get("circuit", []):
+        matriz = gerar_circuito(n, np.random.default_rng(semente))
+        casos.append(("circuit", n, lambda m=matriz: solve_circuit(m)))
+    return casos
+
+
+def cronometrar(funcao: Callable[[], object], repeticoes: int = 5, aquecimento: int = 1) -> Dict[str, float]:
+    """Executa `funcao` após `aquecimento` chamadas descartadas e resume os tempos (s)."""
+    for _ in range(aquecimento):
+        funcao()
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return {
+        "minimo_s": min(tempos),
+        "mediana_s": statistics.median(tempos),
+        "media_s": statistics.fmean(tempos),
+        "maximo_s": max(tempos),
+        "repeticoes": repeticoes,
+    }
+
+
+# Dependências que cada módulo precisa carregar de qualquer jeito: a linha de base
+# contra a qual o custo próprio da importação é medido.
+LINHA_DE_BASE_INICIALIZACAO = {"solvers": "numpy", "gui_app": "numpy, tkinter, tkinter.ttk"}
+
+
+def medir_inicializacao(modulo: str, repeticoes: int = 5) -> Dict[str, float]:
+    """Tempo de `import modulo` (s) em interpretadores novos, sem cache de módulos em memória.
+
+    No mesmo processo, as dependências de `LINHA_DE_BASE_INICIALIZACAO` são
+    importadas antes; `proprio_mediana_s` é o que o módulo gasta além delas,
+    comparável entre máquinas e execuções. Uma rodada inicial, fora da medida,
+    grava o bytecode (mesmo com PYTHONDONTWRITEBYTECODE), para não cronometrar
+    a compilação dos fontes.
+    """
+    base = LINHA_DE_BASE_INICIALIZACAO.get(modulo)
+    codigo = (
+        "import time; inicio = time.perf_counter(); "
+        + (f"import {base}; " if base else "")
+        + f"meio = time.perf_counter(); import {modulo}; fim = time.perf_counter(); "
+        "print(fim - inicio, fim - meio)"
+    )
+    diretorio = os.path.dirname(os.path.abspath(__file__))
+    ambiente = {chave: valor for chave, valor in os.environ.items() if chave != "PYTHONDONTWRITEBYTECODE"}
+    tempos, proprios = [], []
+    for rodada in range(repeticoes + 1):
+        saida = subprocess.run(
+            [sys.executable, "-c", codigo],
+            cwd=diretorio,
+            env=ambiente,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        if rodada == 0:
+            continue
+        total, proprio = map(float, saida.stdout.strip().splitlines()[-1].split())
+        tempos.append(total)
+        proprios.append(proprio)
+    return {
+        "minimo_s": min(tempos),
+        "mediana_s": statistics.median(tempos),
+        "media_s": statistics.fmean(tempos),
+        "maximo_s": max(tempos),
+        "proprio_mediana_s": statistics.median(proprios),
+        "repeticoes": repeticoes,
+    }
+
+
+def executar(
+    tamanhos: Dict[str, List[int]] | None = None,
+    repeticoes: int = 5,
+    aquecimento: int = 1,
+    semente: int = 0,
+) -> Dict[str, object]:
+    """Roda a suíte e retorna um dicionário pronto para ser gravado em JSON."""
+    resultados = []
+    for modulo in ("solvers", "gui_app"):
+        medida = medir_inicializacao(modulo, repeticoes=repeticoes)
+        resultados.append({"solver": f"import_{modulo}", "tamanho": 0, **medida})
+        print(
+            f"{'import ' + modulo:<14} {'':<11} mediana={medida['mediana_s'] * 1e3:10.3f} ms"
+            f" (próprio: {medida['proprio_mediana_s'] * 1e3:.3f} ms)",
+            file=sys.stderr,
+        )
+    for solver, n, funcao in _casos(tamanhos or TAMANHOS, semente):
+        medida = cronometrar(funcao, repeticoes=repeticoes, aquecimento=aquecimento)
+        resultados.append({"solver": solver, "tamanho": n, **medida})
+        print(f"{solver:<14} n={n:<9} mediana={medida['mediana_s'] * 1e3:10.3f} ms", file=sys.stderr)
+    return {
+        "metadados": {
+            "data": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "semente": semente,
+        },
+        "resultados": resultados,
+    }
+
+
+def comparar(
+    atual: Dict[str, object],
+    referencia: Dict[str, object],
+    tolerancia: float = 0.2,
+) -> List[Dict[str, object]]:
+    """Lista os casos cuja mediana piorou mais que `tolerancia` (fração) em relação à referência."""
+    base = {(r["solver"], r["tamanho"]): r for r in referencia["resultados"]}
+    regressoes = []
+    for r in atual["resultados"]:
+        anterior = base.get((r["solver"], r["tamanho"]))
+        if anterior is None or anterior["mediana_s"] <= 0:
+            continue
+        razao = r["mediana_s"] / anterior["mediana_s"]
+        if razao > 1.0 + tolerancia:
+            regressoes.append(
+                {
+                    "solver": r["solver"],
+                    "tamanho": r["tamanho"],
+                    "referencia_s": anterior["mediana_s"],
+                    "atual_s": r["mediana_s"],
+                    "razao": razao,
+                }
+            )
+    return regressoes
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de escala dos solvers.")
+    parser.add_argument("--saida", default="benchmarks.json", help="arquivo JSON de resultados")
+    parser.add_argument("--rapido", action="store_true", help="usa apenas os tamanhos pequenos")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--aquecimento", type=int, default=1)
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--comparar", metavar="REFERENCIA", help="JSON de referência para detectar regressões")
+    parser.add_argument("--tolerancia", type=float, default=0.2, help="piora relativa aceita (padrão: 0.2)")
+    parser.add_argument(
+        "--limite-inicializacao",
+        type=float,
+        metavar="SEGUNDOS",
+        help="falha se `import solvers` ou `import gui_app` gastar mais que isso além da importação "
+        "de suas dependências (numpy, tkinter), medida no mesmo processo",
+    )
+    args = parser.parse_args(argv)
+
+    resultado = executar(
+        TAMANHOS_RAPIDOS if args.rapido else TAMANHOS,
+        repeticoes=args.repeticoes,
+        aquecimento=args.aquecimento,
+        semente=args.semente,
+    )
+    with open(args.saida, "w", encoding="utf-8") as arquivo:
+        json.dump(resultado, arquivo, indent=2)
+
+    codigo_saida = 0
+    if args.limite_inicializacao is not None:
+        for r in resultado["resultados"]:
+            if r["solver"].startswith("import_") and r["proprio_mediana_s"] > args.limite_inicializacao:
+                print(
+                    f"INICIALIZAÇÃO LENTA {r['solver']}: {r['proprio_mediana_s'] * 1e3:.3f} ms além das dependências "
+                    f"(limite: {args.limite_inicializacao * 1e3:.3f} ms)",
+                    file=sys.stderr,
+                )
+                codigo_saida = 1
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as arquivo:
+            referencia = json.load(arquivo)
+        regressoes = comparar(resultado, referencia, args.tolerancia)
+        for r in regressoes:
+            print(
+                f"REGRESSÃO {r['solver']} n={r['tamanho']}: "
+                f"{r['referencia_s'] * 1e3:.3f} ms -> {r['atual_s'] * 1e3:.3f} ms ({r['razao']:.2f}x)",
+                file=sys.stderr,
+            )
+        if regressoes:
+            codigo_saida = 1
+    return codigo_saida
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ArrayCompartilhado:
+    """Identificador leve (nome do bloco, forma e tipo) de um array em memória compartilhada.
+
+    É o que se envia aos processos trabalhadores no lugar do array.
+    """
+
+    nome: str
+    forma: Tuple[int, ...]
+    dtype: str
+
+
+class AreaCompartilhada:
+    """Blocos de memória compartilhada criados e possuídos pelo processo pai.
+
+    `fechar()` (chamado ao sair do `with`) remove todos os blocos mesmo que um
+    trabalhador tenha morrido no meio. Os trabalhadores só anexam e fecham, nunca
+    removem. Se o próprio pai morrer, o resource_tracker do multiprocessing
+    remove os blocos que ele registrou ao criá-los.
+    """
+
+    def __init__(self) -> None:
+        self._blocos: List[shared_memory.SharedMemory] = []
+
+    def __enter__(self) -> AreaCompartilhada:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fechar()
+
+    def alocar(self, forma: Sequence[int], dtype: np.dtype | type = np.float64) -> Tuple[ArrayCompartilhado, np.ndarray]:
+        """Cria um bloco para um array de `forma` e `dtype`; retorna o identificador e a visão local."""
+        dtype = np.dtype(dtype)
+        forma = tuple(int(d) for d in forma)
+        tamanho = max(1, int(np.prod(forma, dtype=np.int64)) * dtype.itemsize)
+        bloco = shared_memory.SharedMemory(create=True, size=tamanho)
+        self._blocos.append(bloco)
+        return ArrayCompartilhado(bloco.name, forma, dtype.str), np.ndarray(forma, dtype=dtype, buffer=bloco.buf)
+
+    def publicar(self, array: np.ndarray) -> ArrayCompartilhado:
+        """Copia `array` uma única vez para um bloco novo e retorna seu identificador."""
+        array = np.asarray(array)
+        identificador, destino = self.alocar(array.shape, array.dtype)
+        destino[...] = array
+        return identificador
+
+    def fechar(self) -> None:
+        for bloco in self._blocos:
+            try:
+                bloco.unlink()
+            except FileNotFoundError:
+                pass
+            try:
+                bloco.close()
+            except BufferError:
+                pass  # ainda há visões locais do bloco; o mapeamento é liberado com elas
+        self._blocos.clear()
+
+
+def _abrir_bloco(nome: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=nome, track=False)
+    except TypeError:
+        # Antes do Python 3.13 não há `track`; os trabalhadores do pool compartilham
+        # o resource_tracker do pai, então o registro extra não remove nada sozinho.
+        return shared_memory.SharedMemory(name=nome)
+
+
+@contextmanager
+def anexar(*identificadores: ArrayCompartilhado) -> Iterator[List[np.ndarray]]:
+    """No trabalhador: visões dos arrays compartilhados, desanexadas ao sair do `with`."""
+    blocos = []
+    try:
+        arrays = []
+        for identificador in identificadores:
+            bloco = _abrir_bloco(identificador.nome)
+            blocos.append(bloco)
+            arrays.append(np.ndarray(identificador.forma, dtype=np.dtype(identificador.dtype), buffer=bloco.buf))
+        yield arrays
+    finally:
+        arrays = []
+        for bloco in blocos:
+            try:
+                bloco.close()
+            except BufferError:
+                pass
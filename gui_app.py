@@ -1,16 +1,32 @@
 from __future__ import annotations
 
-import re
+import math
+import os
+import threading
+import time
 import tkinter as tk
-from tkinter import messagebox, ttk
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from tkinter import filedialog, messagebox, ttk
 from tkinter.scrolledtext import ScrolledText
-from typing import List, Sequence
+from typing import Callable, Deque, Dict, Hashable, List, Sequence, Tuple
 
+import numpy as np
+
+from gui_graficos import GraficoDecimado
+from gui_tabela import ColunaTabela, TabelaVirtual
 from solvers import (
     CircuitResult,
     Q1Result,
     Q2Result,
     Q3Result,
+    SolucaoCancelada,
+    carregar_matriz,
+    carregar_perfil,
+    carregar_pontos,
+    hash_matriz,
+    ler_matriz_texto,
+    ler_numeros,
     solve_circuit,
     solve_q1,
     solve_q2,
@@ -47,6 +63,34 @@ MONO_BG = "#242933"
 MONO_FG = "#E5E9F0"
 INPUT_BG = "#434C5E"
 
+POLL_INTERVAL_MS = 50
+WORKER_THREADS = 2
+LIVE_DEBOUNCE_MS = 400
+MEMO_SIZE = 64
+INLINE_LOAD_LIMIT = 10_000
+CURVE_POINTS = 2_000
+FILE_TYPES = [
+    ("Dados numéricos", "*.npy *.npz *.csv *.txt"),
+    ("Todos os arquivos", "*.*"),
+]
+
+Job = Callable[[threading.Event, Callable[[int, float], None]], object]
+Tabela = Tuple[List[str], List[ColunaTabela]]
+
+
+class _Task:
+    """Solução em andamento de uma aba: futuro, evento de cancelamento e progresso reportado."""
+
+    __slots__ = ("future", "cancel_event", "progress", "history", "started")
+
+    def __init__(self, future: Future, cancel_event: threading.Event) -> None:
+        self.future = future
+        self.cancel_event = cancel_event
+        self.progress: Tuple[int, float] | None = None
+        # Pontos (iteração, resíduo) ainda não desenhados; o worker anexa e a janela consome.
+        self.history: Deque[Tuple[int, float]] = deque()
+        self.started = time.perf_counter()
+
 
 class UnifiedApp(ttk.Frame):
     def __init__(self, master: tk.Tk) -> None:
@@ -66,19 +110,216 @@ class UnifiedApp(ttk.Frame):
             text="Cálculo numérico - 4 Questões em um único painel",
             style="Subheader.TLabel",
         ).pack(anchor="w", pady=(2, 0))
-
-        notebook = ttk.Notebook(self, style="Card.TNotebook")
-        notebook.pack(fill="both", expand=True, padx=10, pady=10)
-
-        self._build_q1_tab(notebook)
-        self._build_circuit_tab(notebook)
-        self._build_q2_tab(notebook)
-        self._build_q3_tab(notebook)
-
-    def _build_q1_tab(self, notebook: ttk.Notebook) -> None:
-        frame = ttk.Frame(notebook, padding=15, style="Content.TFrame")
-        notebook.add(frame, text="Questão T1 - Mineração")
-
+        self.live_mode = tk.BooleanVar(value=False)
+        ttk.Checkbutton(header, text="Recalcular ao digitar", variable=self.live_mode).pack(anchor="w", pady=(8, 0))
+
+        self.notebook = ttk.Notebook(self, style="Card.TNotebook")
+        self.notebook.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # Cada aba é montada apenas quando selecionada pela primeira vez.
+        self._pending_tabs: Dict[str, Callable[[ttk.Frame], None]] = {}
+        for title, padding, builder in (
+            ("Questão T1 - Mineração", 15, self._build_q1_tab),
+            ("Questão T2 - Circuitos", 20, self._build_circuit_tab),
+            ("Questão T3 - Interpolação", 20, self._build_q2_tab),
+            ("Questão T4 - Área (Trapézio/Simpson)", 20, self._build_q3_tab),
+        ):
+            frame = ttk.Frame(self.notebook, padding=padding, style="Content.TFrame")
+            self.notebook.add(frame, text=title)
+            self._pending_tabs[str(frame)] = builder
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+        # As soluções rodam fora da thread do Tk; a janela consulta os resultados com after().
+        self._executor = ThreadPoolExecutor(max_workers=WORKER_THREADS, thread_name_prefix="solver")
+        self._tasks: Dict[str, _Task] = {}
+        self._task_widgets: Dict[str, Tuple[ttk.Progressbar, ttk.Label, ttk.Button]] = {}
+        # Abas cujo gráfico acompanha o resíduo de cada iteração enquanto a solução roda.
+        self._live_plots: Dict[str, GraficoDecimado] = {}
+
+        # Modo ao vivo: edições disparam o cálculo após uma pausa; resultados ficam
+        # memorizados pela entrada já convertida, então desfazer uma edição é instantâneo.
+        self._live_jobs: Dict[str, str] = {}
+        self._memo: Dict[str, OrderedDict[Hashable, object]] = {}
+        self._rendered: Dict[str, str] = {}
+        # Arquivos grandes não passam pelo texto: o campo mostra um resumo e o array fica aqui.
+        self._loaded_values: Dict[str, Tuple[str, np.ndarray]] = {}
+        self._on_tab_changed()
+
+    def _on_tab_changed(self, _event: tk.Event | None = None) -> None:
+        selected = self.notebook.select()
+        builder = self._pending_tabs.pop(selected, None)
+        if builder is not None:
+            builder(self.nametowidget(selected))
+
+    def destroy(self) -> None:
+        for task in self._tasks.values():
+            task.cancel_event.set()
+        self._tasks.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
+    def _build_task_bar(self, parent: ttk.Frame, key: str) -> None:
+        bar = ttk.Frame(parent, style="Content.TFrame")
+        bar.pack(fill="x", pady=(0, 5))
+        progress = ttk.Progressbar(bar, mode="determinate", maximum=1.0)
+        progress.pack(side="left", fill="x", expand=True, padx=(0, 10))
+        status = ttk.Label(bar, text="")
+        status.pack(side="left", padx=(0, 10))
+        cancel = ttk.Button(bar, text="Cancelar", state="disabled", command=lambda: self._cancel_task(key))
+        cancel.pack(side="right")
+        self._task_widgets[key] = (progress, status, cancel)
+
+    def _submit_task(
+        self,
+        key: str,
+        job: Job,
+        on_done: Callable[[object], None],
+        error_title: str,
+        memo_key: Hashable | None = None,
+        silent: bool = False,
+    ) -> None:
+        """Executa `job` no pool; um pedido novo da mesma aba substitui (e cancela) o anterior.
+
+        Com `memo_key`, um resultado já calculado para a mesma entrada é exibido
+        sem nova solução. Com `silent`, erros vão para a barra de status.
+        """
+        previous = self._tasks.pop(key, None)
+        if previous is not None:
+            previous.cancel_event.set()
+
+        memo = self._memo.setdefault(key, OrderedDict())
+        if memo_key is not None and memo_key in memo:
+            memo.move_to_end(memo_key)
+            self._finish_task_bar(key, "Resultado memorizado.", done=True)
+            on_done(memo[memo_key])
+            return
+
+        def finished(result: object) -> None:
+            if memo_key is not None:
+                memo[memo_key] = result
+                if len(memo) > MEMO_SIZE:
+                    memo.popitem(last=False)
+            on_done(result)
+
+        cancel_event = threading.Event()
+        holder: List[_Task] = []
+
+        live_plot = key in self._live_plots
+
+        def report(iteracao: int, residuo: float) -> None:
+            if holder:
+                holder[0].progress = (iteracao, residuo)
+                if live_plot:
+                    holder[0].history.append((iteracao, residuo))
+
+        future = self._executor.submit(job, cancel_event, report)
+        task = _Task(future, cancel_event)
+        holder.append(task)
+        self._tasks[key] = task
+
+        progress, status, cancel = self._task_widgets[key]
+        progress.configure(mode="indeterminate")
+        progress.start(15)
+        status.configure(text="Calculando...")
+        cancel.configure(state="normal")
+        self.after(POLL_INTERVAL_MS, self._poll_task, key, task, finished, error_title, silent)
+
+    def _poll_task(
+        self,
+        key: str,
+        task: _Task,
+        on_done: Callable[[object], None],
+        error_title: str,
+        silent: bool,
+    ) -> None:
+        if self._tasks.get(key) is not task:
+            return  # pedido cancelado ou substituído: o resultado é descartado
+
+        progress, status, _ = self._task_widgets[key]
+        if task.progress is not None:
+            iteracao, residuo = task.progress
+            if str(progress.cget("mode")) != "determinate":
+                progress.stop()
+                progress.configure(mode="determinate")
+            progress.configure(value=self._progress_fraction(key, residuo))
+            status.configure(text=f"Iteração {iteracao} | diferença relativa {residuo:.3e}")
+        self._drain_history(key, task)
+
+        if not task.future.done():
+            self.after(POLL_INTERVAL_MS, self._poll_task, key, task, on_done, error_title, silent)
+            return
+
+        del self._tasks[key]
+        elapsed = time.perf_counter() - task.started
+        try:
+            result = task.future.result()
+        except SolucaoCancelada:
+            self._finish_task_bar(key, "Cancelado.")
+        except Exception as exc:
+            self._report_error(key, error_title, exc, silent)
+        else:
+            self._finish_task_bar(key, f"Concluído em {elapsed:.2f} s.", done=True)
+            on_done(result)
+
+    def _drain_history(self, key: str, task: _Task) -> None:
+        plot = self._live_plots.get(key)
+        if plot is None or not task.history:
+            return
+        pontos = [task.history.popleft() for _ in range(len(task.history))]
+        iteracoes, residuos = zip(*pontos)
+        plot.acrescentar("residuo", iteracoes, residuos)
+
+    def _progress_fraction(self, key: str, residuo: float) -> float:
+        """Fração concluída de uma solução iterativa, pela razão log(diffR)/log(precisão)."""
+        if key != "circuit" or residuo <= 0:
+            return 0.0
+        try:
+            precision = float(self.circuit_precision.get())
+        except ValueError:
+            return 0.0
+        if not 0 < precision < 1 or residuo >= 1:
+            return 0.0
+        return min(1.0, math.log(residuo) / math.log(precision))
+
+    def _finish_task_bar(self, key: str, message: str, done: bool = False) -> None:
+        progress, status, cancel = self._task_widgets[key]
+        progress.stop()
+        progress.configure(mode="determinate", value=1.0 if done else 0.0)
+        status.configure(text=message)
+        cancel.configure(state="disabled")
+
+    def _report_error(self, key: str, error_title: str, exc: Exception, silent: bool) -> None:
+        if silent:
+            self._finish_task_bar(key, f"Entrada inválida: {exc}")
+        else:
+            self._finish_task_bar(key, "Erro.")
+            messagebox.showerror(error_title, str(exc))
+
+    def _bind_live(self, key: str, widgets: Sequence[tk.Widget], run: Callable[[bool], None]) -> None:
+        for widget in widgets:
+            widget.bind("<KeyRelease>", lambda _event: self._schedule_live(key, run), add="+")
+
+    def _schedule_live(self, key: str, run: Callable[[bool], None]) -> None:
+        """Agenda `run(live=True)` para depois de LIVE_DEBOUNCE_MS sem novas edições."""
+        if not self.live_mode.get():
+            return
+        pending = self._live_jobs.pop(key, None)
+        if pending is not None:
+            self.after_cancel(pending)
+
+        def fire() -> None:
+            self._live_jobs.pop(key, None)
+            run(True)
+
+        self._live_jobs[key] = self.after(LIVE_DEBOUNCE_MS, fire)
+
+    def _cancel_task(self, key: str) -> None:
+        task = self._tasks.pop(key, None)
+        if task is not None:
+            task.cancel_event.set()
+            self._finish_task_bar(key, "Cancelado.")
+
+    def _build_q1_tab(self, frame: ttk.Frame) -> None:
         needs_frame = ttk.LabelFrame(frame, text="Necessidades (m³)", style="Card.TLabelframe", padding=15)
         needs_frame.pack(fill="x", pady=5)
         materiais = ["Areia", "Cascalho Fino", "Cascalho Grosso"]
@@ -108,22 +349,33 @@ class UnifiedApp(ttk.Frame):
             self.q1_comp_entries.append(row_entries)
 
         ttk.Button(frame, text="Calcular minerações", style="Accent.TButton", command=self._run_q1).pack(pady=10)
+        self._build_task_bar(frame, "q1")
         self.q1_output = self._build_output_box(frame)
+        self._bind_live(
+            "q1", self.q1_need_entries + [cell for row in self.q1_comp_entries for cell in row], self._run_q1
+        )
 
-    def _run_q1(self) -> None:
+    def _run_q1(self, live: bool = False) -> None:
         try:
             necessidades = [float(entry.get()) for entry in self.q1_need_entries]
             composicao = [[float(cell.get()) for cell in row] for row in self.q1_comp_entries]
-            result = solve_q1(necessidades, composicao)
-            texto = self._format_q1_result(result)
-            self._write_output(self.q1_output, texto)
         except Exception as exc:
-            messagebox.showerror("Erro na Questão 1", str(exc))
-
-    def _build_circuit_tab(self, notebook: ttk.Notebook) -> None:
-        frame = ttk.Frame(notebook, padding=20, style="Content.TFrame")
-        notebook.add(frame, text="Questão T2 - Circuitos")
+            self._report_error("q1", "Erro na Questão 1", exc, live)
+            return
+
+        def job(cancel_event: threading.Event, report: Callable[[int, float], None]) -> str:
+            return self._format_q1_result(solve_q1(necessidades, composicao))
+
+        self._submit_task(
+            "q1",
+            job,
+            lambda texto: self._write_output(self.q1_output, texto),
+            "Erro na Questão 1",
+            memo_key=(tuple(necessidades), tuple(map(tuple, composicao))),
+            silent=live,
+        )
 
+    def _build_circuit_tab(self, frame: ttk.Frame) -> None:
         input_frame = ttk.LabelFrame(frame, text="Matriz Estendida [A|b]", style="Card.TLabelframe", padding=20)
         input_frame.pack(fill="both", expand=True, pady=10)
 
@@ -158,44 +410,75 @@ class UnifiedApp(ttk.Frame):
         ttk.Button(controls_frame, text="Resolver Circuito", style="Accent.TButton", command=self._run_circuit).pack(
             side="right"
         )
+        ttk.Button(controls_frame, text="Carregar arquivo...", command=self._load_circuit_file).pack(
+            side="right", padx=10
+        )
+
+        self._build_task_bar(frame, "circuit")
+        table_area, plot_area = self._build_split(frame)
+        self.circuit_table = self._build_result_table(table_area)
+        self.circuit_plot = self._build_plot(plot_area, "Convergência (diferença relativa)", log_y=True)
+        self._live_plots["circuit"] = self.circuit_plot
+        self._bind_live("circuit", [self.circuit_input, self.circuit_precision], self._run_circuit)
 
-        self.circuit_output = self._build_output_box(frame)
+    def _load_circuit_file(self) -> None:
+        caminho = self._ask_data_file()
+        if caminho:
+            self._load_into("Erro na Questão T2", lambda: self._show_values(self.circuit_input, caminho, carregar_matriz(caminho)))
 
-    def _run_circuit(self) -> None:
+    def _run_circuit(self, live: bool = False) -> None:
         try:
             text = self.circuit_input.get("1.0", tk.END).strip()
             if not text:
                 raise ValueError("Matriz vazia.")
 
-            matrix = []
-            for line in text.splitlines():
-                if line.strip():
-                    matrix.append([float(x) for x in line.replace(",", " ").split()])
-
+            matrix = self._values_from(self.circuit_input, text, ler_matriz_texto)
             precision = float(self.circuit_precision.get())
-            result = solve_circuit(matrix, precision)
-            texto = self._format_circuit_result(result)
-            self._write_output(self.circuit_output, texto)
+            memo_key = (hash_matriz(matrix), precision)
         except Exception as exc:
-            messagebox.showerror("Erro na Questão T2", str(exc))
-
-    def _format_circuit_result(self, result: CircuitResult) -> str:
-        linhas = ["=== RESULTADOS - QUESTÃO T2 (CIRCUITOS) ===", "Correntes calculadas:"]
-        for i, val in enumerate(result.correntes):
-            linhas.append(f"  i{i+1} = {val:.6f} A")
-
-        linhas.append("\nVerificação (A*x):")
-        ax = result.matriz @ result.correntes
-        for i, (calc, expected) in enumerate(zip(ax, result.termos_independentes)):
-            erro = abs(calc - expected)
-            linhas.append(f"  Eq {i+1}: {calc:10.4f} (esperado: {expected:10.4f}) | erro: {erro:.6e}")
-
-        return "\n".join(linhas)
+            self._report_error("circuit", "Erro na Questão T2", exc, live)
+            return
+
+        def job(cancel_event: threading.Event, report: Callable[[int, float], None]) -> Tuple[Tabela, np.ndarray]:
+            result = solve_circuit(matrix, precision, progresso=report, cancelamento=cancel_event)
+            return self._tabulate_circuit_result(result), result.historico
+
+        self.circuit_plot.limpar()
+        self._submit_task(
+            "circuit",
+            job,
+            lambda saida: self._show_circuit_result(*saida),
+            "Erro na Questão T2",
+            memo_key=memo_key,
+            silent=live,
+        )
 
-    def _build_q2_tab(self, notebook: ttk.Notebook) -> None:
-        frame = ttk.Frame(notebook, padding=20, style="Content.TFrame")
-        notebook.add(frame, text="Questão T3 - Interpolação")
+    def _show_circuit_result(self, tabela: Tabela, historico: np.ndarray) -> None:
+        self.circuit_table.definir(*tabela)
+        # O histórico completo substitui os pontos recebidos ao vivo (e cobre resultados memorizados).
+        self.circuit_plot.definir("residuo", np.arange(1, historico.size + 1), historico)
+
+    def _tabulate_circuit_result(self, result: CircuitResult) -> Tabela:
+        correntes = result.correntes
+        esperado = result.termos_independentes
+        ax = result.matriz @ correntes
+        erro = np.abs(ax - esperado)
+        resumo = [
+            "=== RESULTADOS - QUESTÃO T2 (CIRCUITOS) ===",
+            f"Correntes calculadas: {correntes.size} | iterações: {result.iteracoes}",
+            f"Corrente mínima: {correntes.min():.6f} A | máxima: {correntes.max():.6f} A",
+            f"Verificação (A*x): erro máximo {erro.max():.6e} | erro médio {erro.mean():.6e}",
+        ]
+        colunas = [
+            ColunaTabela("Eq", range(1, correntes.size + 1), "6d"),
+            ColunaTabela("Corrente (A)", correntes, "14.6f"),
+            ColunaTabela("A*x", ax, "12.4f"),
+            ColunaTabela("Esperado", esperado, "12.4f"),
+            ColunaTabela("Erro", erro, "12.6e"),
+        ]
+        return resumo, colunas
 
+    def _build_q2_tab(self, frame: ttk.Frame) -> None:
         points_frame = ttk.LabelFrame(frame, text="Pontos (separe por vírgula, espaço ou nova linha)", style="Card.TLabelframe", padding=20)
         points_frame.pack(fill="x", pady=10)
 
@@ -222,25 +505,77 @@ class UnifiedApp(ttk.Frame):
         self.q2_grau_entry.insert(0, DEFAULT_Q2_GRAU)
         self.q2_grau_entry.grid(row=0, column=3, padx=10, pady=5)
 
-        ttk.Button(frame, text="Interpolar", style="Accent.TButton", command=self._run_q2).pack(pady=15)
-        self.q2_output = self._build_output_box(frame)
+        buttons = ttk.Frame(frame, style="Content.TFrame")
+        buttons.pack(pady=15)
+        ttk.Button(buttons, text="Interpolar", style="Accent.TButton", command=self._run_q2).pack(side="left")
+        ttk.Button(buttons, text="Carregar pontos...", command=self._load_q2_file).pack(side="left", padx=10)
+        self._build_task_bar(frame, "q2")
+        output_area, plot_area = self._build_split(frame)
+        self.q2_output = self._build_output_box(output_area)
+        self.q2_plot = self._build_plot(plot_area, "Pontos e polinômio interpolador")
+        self._bind_live(
+            "q2", [self.q2_x_entry, self.q2_y_entry, self.q2_x_alvo_entry, self.q2_grau_entry], self._run_q2
+        )
 
-    def _run_q2(self) -> None:
+    def _run_q2(self, live: bool = False) -> None:
         try:
-            x_pontos = self._parse_float_sequence(self.q2_x_entry.get())
-            y_pontos = self._parse_float_sequence(self.q2_y_entry.get())
+            x_pontos = self._values_from(self.q2_x_entry, self.q2_x_entry.get(), self._parse_float_sequence)
+            y_pontos = self._values_from(self.q2_y_entry, self.q2_y_entry.get(), self._parse_float_sequence)
             x_alvo = float(self.q2_x_alvo_entry.get())
             grau = int(float(self.q2_grau_entry.get()))
-            result = solve_q2(x_pontos, y_pontos, x_alvo, grau)
-            texto = self._format_q2_result(result, grau, x_alvo)
-            self._write_output(self.q2_output, texto)
         except Exception as exc:
-            messagebox.showerror("Erro na Questão 2", str(exc))
+            self._report_error("q2", "Erro na Questão 2", exc, live)
+            return
 
-    def _build_q3_tab(self, notebook: ttk.Notebook) -> None:
-        frame = ttk.Frame(notebook, padding=20, style="Content.TFrame")
-        notebook.add(frame, text="Questão T4 - Área (Trapézio/Simpson)")
+        def job(cancel_event: threading.Event, report: Callable[[int, float], None]) -> Tuple[str, np.ndarray, np.ndarray]:
+            result = solve_q2(x_pontos, y_pontos, x_alvo, grau)
+            return (self._format_q2_result(result, grau, x_alvo), result.pontos_selecionados, *self._q2_curve(result))
+
+        self._submit_task(
+            "q2",
+            job,
+            lambda saida: self._show_q2_result(x_pontos, y_pontos, *saida),
+            "Erro na Questão 2",
+            memo_key=(hash_matriz(x_pontos), hash_matriz(y_pontos), x_alvo, grau),
+            silent=live,
+        )
 
+    def _q2_curve(self, result: Q2Result) -> Tuple[np.ndarray, np.ndarray]:
+        """Polinômio que passa pelos pontos selecionados, amostrado no intervalo entre eles."""
+        selecionados = result.pontos_selecionados
+        x_sel, y_sel = selecionados[:, 0], selecionados[:, 1]
+        polinomio = np.polynomial.Polynomial.fit(x_sel, y_sel, len(x_sel) - 1)
+        x_curva = np.linspace(x_sel.min(), x_sel.max(), CURVE_POINTS)
+        return x_curva, polinomio(x_curva)
+
+    def _show_q2_result(
+        self,
+        x_pontos: np.ndarray,
+        y_pontos: np.ndarray,
+        texto: str,
+        selecionados: np.ndarray,
+        x_curva: np.ndarray,
+        y_curva: np.ndarray,
+    ) -> None:
+        self._write_output(self.q2_output, texto)
+        self.q2_plot.definir("dados", x_pontos, y_pontos, marcadores=True)
+        self.q2_plot.definir("polinomio", x_curva, y_curva)
+        self.q2_plot.definir("selecionados", selecionados[:, 0], selecionados[:, 1], marcadores=True)
+        self.q2_plot.enquadrar()
+
+    def _load_q2_file(self) -> None:
+        caminho = self._ask_data_file()
+        if not caminho:
+            return
+
+        def load() -> None:
+            x_pontos, y_pontos = carregar_pontos(caminho)
+            self._show_values(self.q2_x_entry, caminho, x_pontos)
+            self._show_values(self.q2_y_entry, caminho, y_pontos)
+
+        self._load_into("Erro na Questão 2", load)
+
+    def _build_q3_tab(self, frame: ttk.Frame) -> None:
         inputs_frame = ttk.LabelFrame(frame, text="Dados de entrada", style="Card.TLabelframe", padding=20)
         inputs_frame.pack(fill="x", pady=10)
 
@@ -260,21 +595,105 @@ class UnifiedApp(ttk.Frame):
         self.q3_esp_entry.grid(row=2, column=1, sticky="w", padx=10, pady=5)
         inputs_frame.columnconfigure(1, weight=1)
 
-        ttk.Button(frame, text="Calcular áreas", style="Accent.TButton", command=self._run_q3).pack(pady=15)
-        self.q3_output = self._build_output_box(frame)
-
-    def _run_q3(self) -> None:
+        buttons = ttk.Frame(frame, style="Content.TFrame")
+        buttons.pack(pady=15)
+        ttk.Button(buttons, text="Calcular áreas", style="Accent.TButton", command=self._run_q3).pack(side="left")
+        ttk.Button(buttons, text="Carregar perfil...", command=self._load_q3_file).pack(side="left", padx=10)
+        self._build_task_bar(frame, "q3")
+        table_area, plot_area = self._build_split(frame)
+        self.q3_table = self._build_result_table(table_area)
+        self.q3_plot = self._build_plot(plot_area, "Perfil do rio (profundidade)", inverter_y=True)
+        self._bind_live("q3", [self.q3_dist_entry, self.q3_prof_entry, self.q3_esp_entry], self._run_q3)
+
+    def _run_q3(self, live: bool = False) -> None:
         try:
-            profundidades = self._parse_float_sequence(self.q3_prof_entry.get())
+            profundidades = self._values_from(self.q3_prof_entry, self.q3_prof_entry.get(), self._parse_float_sequence)
             distancias_text = self.q3_dist_entry.get().strip()
-            distancias = self._parse_float_sequence(distancias_text) if distancias_text else None
+            distancias = (
+                self._values_from(self.q3_dist_entry, distancias_text, self._parse_float_sequence)
+                if distancias_text
+                else None
+            )
             espacamento_text = self.q3_esp_entry.get().strip()
             espacamento = float(espacamento_text) if espacamento_text else None
-            result = solve_q3(profundidades, espacamento=espacamento, distancias=distancias)
-            texto = self._format_q3_result(result)
-            self._write_output(self.q3_output, texto)
         except Exception as exc:
-            messagebox.showerror("Erro na Questão 3", str(exc))
+            self._report_error("q3", "Erro na Questão 3", exc, live)
+            return
+
+        def job(cancel_event: threading.Event, report: Callable[[int, float], None]) -> Tuple[Tabela, Q3Result]:
+            result = solve_q3(profundidades, espacamento=espacamento, distancias=distancias)
+            return self._tabulate_q3_result(result), result
+
+        self._submit_task(
+            "q3",
+            job,
+            lambda saida: self._show_q3_result(*saida),
+            "Erro na Questão 3",
+            memo_key=(
+                hash_matriz(profundidades),
+                hash_matriz(distancias) if distancias is not None else None,
+                espacamento,
+            ),
+            silent=live,
+        )
+
+    def _show_q3_result(self, tabela: Tabela, result: Q3Result) -> None:
+        self.q3_table.definir(*tabela)
+        self.q3_plot.definir("perfil", result.distancias, result.profundidades)
+        self.q3_plot.enquadrar()
+
+    def _load_q3_file(self) -> None:
+        caminho = self._ask_data_file()
+        if not caminho:
+            return
+
+        def load() -> None:
+            distancias, profundidades = carregar_perfil(caminho)
+            if distancias is None:
+                self.q3_dist_entry.delete(0, tk.END)
+                self._loaded_values.pop(str(self.q3_dist_entry), None)
+            else:
+                # As distâncias do arquivo definem o espaçamento.
+                self.q3_esp_entry.delete(0, tk.END)
+                self._show_values(self.q3_dist_entry, caminho, distancias)
+            self._show_values(self.q3_prof_entry, caminho, profundidades)
+
+        self._load_into("Erro na Questão 3", load)
+
+    def _ask_data_file(self) -> str:
+        return filedialog.askopenfilename(parent=self, filetypes=FILE_TYPES)
+
+    def _load_into(self, error_title: str, load: Callable[[], None]) -> None:
+        try:
+            load()
+        except (OSError, ValueError) as exc:
+            messagebox.showerror(error_title, str(exc))
+
+    def _show_values(self, widget: tk.Widget, caminho: str, values: np.ndarray) -> None:
+        """Mostra valores carregados no campo: por extenso se forem poucos, senão só um resumo."""
+        if values.size <= INLINE_LOAD_LIMIT:
+            if values.ndim == 2:
+                text = "\n".join(" ".join(f"{v:.10g}" for v in row) for row in values)
+            else:
+                text = ", ".join(f"{v:.10g}" for v in values)
+            self._loaded_values.pop(str(widget), None)
+        else:
+            forma = " x ".join(map(str, values.shape))
+            text = f"# {os.path.basename(caminho)}: {forma} valores carregados (edite para substituir)"
+            self._loaded_values[str(widget)] = (text, values)
+
+        if isinstance(widget, tk.Text):
+            widget.delete("1.0", tk.END)
+            widget.insert("1.0", text)
+        else:
+            widget.delete(0, tk.END)
+            widget.insert(0, text)
+
+    def _values_from(self, widget: tk.Widget, text: str, parse: Callable[[str], np.ndarray]) -> np.ndarray:
+        loaded = self._loaded_values.get(str(widget))
+        if loaded is not None and loaded[0] == text.strip():
+            return loaded[1]
+        return parse(text)
 
     def _build_output_box(self, parent: ttk.Frame) -> ScrolledText:
         output = ScrolledText(
@@ -292,22 +711,39 @@ class UnifiedApp(ttk.Frame):
         output.pack(fill="both", expand=True, pady=10)
         return output
 
+    def _build_result_table(self, parent: ttk.Frame) -> TabelaVirtual:
+        table = TabelaVirtual(parent, background=MONO_BG, foreground=MONO_FG)
+        table.pack(fill="both", expand=True, pady=10)
+        return table
+
+    def _build_split(self, parent: ttk.Frame) -> Tuple[ttk.Frame, ttk.Frame]:
+        """Área de resultados dividida: texto ou tabela à esquerda, gráfico à direita."""
+        split = ttk.PanedWindow(parent, orient="horizontal")
+        split.pack(fill="both", expand=True)
+        left = ttk.Frame(split, style="Content.TFrame")
+        right = ttk.Frame(split, style="Content.TFrame")
+        split.add(left, weight=3)
+        split.add(right, weight=2)
+        return left, right
+
+    def _build_plot(self, parent: ttk.Frame, titulo: str, log_y: bool = False, inverter_y: bool = False) -> GraficoDecimado:
+        plot = GraficoDecimado(
+            parent, titulo=titulo, log_y=log_y, inverter_y=inverter_y, background=MONO_BG, foreground=MONO_FG
+        )
+        plot.pack(fill="both", expand=True, pady=10, padx=(10, 0))
+        return plot
+
     def _write_output(self, widget: ScrolledText, text: str) -> None:
+        if self._rendered.get(str(widget)) == text:
+            return
+        self._rendered[str(widget)] = text
         widget.configure(state="normal")
         widget.delete("1.0", tk.END)
         widget.insert(tk.END, text)
         widget.configure(state="disabled")
 
-    def _parse_float_sequence(self, text: str) -> List[float]:
-        text = text.strip()
-        if not text:
-            return []
-        tokens = re.split(r"[\s,;]+", text)
-        values: List[float] = []
-        for token in tokens:
-            if token:
-                values.append(float(token))
-        return values
+    def _parse_float_sequence(self, text: str) -> np.ndarray:
+        return ler_numeros(text)
 
     def _format_q1_result(self, result: Q1Result) -> str:
         linhas = ["=== RESULTADOS - QUESTÃO 1 ===", "Quantidades a minerar por mina (m³):"]
@@ -335,26 +771,30 @@ class UnifiedApp(ttk.Frame):
         )
         return "\n".join(linhas)
 
-    def _format_q3_result(self, result: Q3Result) -> str:
-        linhas = [
+    def _tabulate_q3_result(self, result: Q3Result) -> Tabela:
+        profundidades = result.profundidades
+        resumo = [
             "=== RESULTADOS - QUESTÃO 3 ===",
-            f"Espaçamento adotado: {result.espacamento:.4f} m",
-            f"Número de pontos: {len(result.profundidades)}",
-            "",
-            "Distância (m) | Profundidade (m)",
-            "--------------+-----------------",
+            (
+                f"Espaçamento adotado: {result.espacamento:.4f} m"
+                if result.uniforme
+                else f"Espaçamento não uniforme (passo médio {result.espacamento:.4f} m)"
+            ),
+            f"Número de pontos: {profundidades.size} | profundidade máxima: {profundidades.max():.4f} m",
+            f"Área - Trapézio : {result.area_trapezio:.4f} m²",
+            f"Área - Simpson  : {result.area_simpson:.4f} m²",
+            f"Diferença       : {result.diferenca:.4f} m² ({result.diferenca_percentual:.2f}%)",
+            "Simpson composta: "
+            + "; ".join(
+                f"pontos {inicio}-{fim}: {regra}"
+                for (inicio, fim), regra in zip(result.segmentos_simpson.tolist(), result.regras_simpson.tolist())
+            ),
         ]
-        for dist, prof in zip(result.distancias, result.profundidades):
-            linhas.append(f"{dist:12.4f} | {prof:13.4f}")
-        linhas.extend(
-            [
-                "",
-                f"Área - Trapézio : {result.area_trapezio:.4f} m²",
-                f"Área - Simpson  : {result.area_simpson:.4f} m²",
-                f"Diferença       : {result.diferenca:.4f} m² ({result.diferenca_percentual:.2f}%)",
-            ]
-        )
-        return "\n".join(linhas)
+        colunas = [
+            ColunaTabela("Distância (m)", result.distancias, "12.4f"),
+            ColunaTabela("Profundidade (m)", profundidades, "13.4f"),
+        ]
+        return resumo, colunas
 
     def _configure_styles(self, master: tk.Misc) -> None:
         master.configure(bg=BG_COLOR)
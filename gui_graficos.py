@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import math
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+MARGEM_ESQUERDA = 64
+MARGEM_DIREITA = 16
+MARGEM_TOPO = 28
+MARGEM_BASE = 28
+ATRASO_REDESENHO_MS = 30
+MAX_MARCADORES = 400
+CORES = ("#88C0D0", "#EBCB8B", "#A3BE8C", "#BF616A", "#B48EAD")
+
+Vista = Tuple[float, float, float, float]
+
+
+def decimar_minmax(
+    x: np.ndarray, y: np.ndarray, x_min: float, x_max: float, colunas: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduz (x, y), com x crescente, a no máximo 4 pontos por coluna de pixel em [x_min, x_max].
+
+    Cada coluna mantém o primeiro, o mínimo, o máximo e o último ponto na ordem
+    original, então picos e vales continuam no traço. Um ponto de cada lado do
+    intervalo é incluído para a linha chegar às bordas.
+    """
+    inicio = max(0, int(np.searchsorted(x, x_min, "left")) - 1)
+    fim = min(len(x), int(np.searchsorted(x, x_max, "right")) + 1)
+    x, y = x[inicio:fim], y[inicio:fim]
+    if len(x) <= 4 * colunas or x_max <= x_min:
+        return x, y
+
+    pixel = np.clip(((x - x_min) * (colunas / (x_max - x_min))).astype(np.int64), -1, colunas)
+    inicios = np.concatenate(([0], np.flatnonzero(np.diff(pixel)) + 1))
+    fins = np.append(inicios[1:], len(x)) - 1
+    grupo = np.repeat(np.arange(len(inicios)), fins - inicios + 1)
+    minimos = _primeira_ocorrencia(y == np.minimum.reduceat(y, inicios)[grupo], grupo)
+    maximos = _primeira_ocorrencia(y == np.maximum.reduceat(y, inicios)[grupo], grupo)
+    indices = np.unique(np.concatenate((inicios, fins, minimos, maximos)))
+    return x[indices], y[indices]
+
+
+def _primeira_ocorrencia(mascara: np.ndarray, grupo: np.ndarray) -> np.ndarray:
+    posicoes = np.flatnonzero(mascara)
+    grupos = grupo[posicoes]
+    return posicoes[np.flatnonzero(np.diff(grupos, prepend=-1))]
+
+
+def _marcas(inicio: float, fim: float, quantidade: int = 5) -> np.ndarray:
+    """Valores "redondos" (1, 2 ou 5 x 10^k) para as marcas de um eixo."""
+    passo_bruto = (fim - inicio) / max(1, quantidade)
+    if not passo_bruto > 0 or not math.isfinite(passo_bruto):
+        return np.array([inicio])
+    escala = 10.0 ** math.floor(math.log10(passo_bruto))
+    passo = escala * min((1, 2, 5, 10), key=lambda m: abs(m * escala - passo_bruto))
+    return np.arange(math.ceil(inicio / passo), math.floor(fim / passo) + 1) * passo
+
+
+class _Serie:
+    """Pontos de uma série em buffers que crescem por duplicação, com limites acumulados."""
+
+    __slots__ = ("cor", "marcadores", "x", "y", "tamanho", "limites")
+
+    def __init__(self, cor: str, marcadores: bool) -> None:
+        self.cor = cor
+        self.marcadores = marcadores
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self.tamanho = 0
+        self.limites = (math.inf, -math.inf, math.inf, -math.inf)
+
+    def definir(self, x: np.ndarray, y: np.ndarray) -> None:
+        self.x, self.y, self.tamanho = x, y, len(x)
+        self.limites = (math.inf, -math.inf, math.inf, -math.inf)
+        self._atualizar_limites(x, y)
+
+    def acrescentar(self, x: np.ndarray, y: np.ndarray) -> None:
+        necessario = self.tamanho + len(x)
+        if necessario > len(self.x):
+            capacidade = max(1024, 2 * necessario)
+            for nome in ("x", "y"):
+                novo = np.empty(capacidade)
+                novo[: self.tamanho] = getattr(self, nome)[: self.tamanho]
+                setattr(self, nome, novo)
+        self.x[self.tamanho : necessario] = x
+        self.y[self.tamanho : necessario] = y
+        self.tamanho = necessario
+        self._atualizar_limites(x, y)
+
+    def _atualizar_limites(self, x: np.ndarray, y: np.ndarray) -> None:
+        validos = np.isfinite(y)
+        if not validos.any():
+            return
+        x0, x1, y0, y1 = self.limites
+        self.limites = (
+            min(x0, float(x[validos].min())),
+            max(x1, float(x[validos].max())),
+            min(y0, float(y[validos].min())),
+            max(y1, float(y[validos].max())),
+        )
+
+
+class GraficoDecimado(ttk.Frame):
+    """Gráfico de linhas num Canvas que desenha só o que cabe nos pixels visíveis.
+
+    Cada série é reduzida por `decimar_minmax` para a faixa visível a cada
+    redesenho. Roda do mouse aproxima/afasta em torno do cursor, arrastar move a
+    vista e duplo clique volta ao enquadramento automático. Durante o arraste os
+    traços já desenhados são deslocados de imediato e a redução é refeita logo
+    depois, uma vez só. `acrescentar` permite alimentar a série durante uma
+    solução (por exemplo, o histórico de resíduos).
+    """
+
+    def __init__(
+        self,
+        parent: tk.Misc,
+        titulo: str = "",
+        log_y: bool = False,
+        inverter_y: bool = False,
+        background: str = "#242933",
+        foreground: str = "#E5E9F0",
+    ) -> None:
+        super().__init__(parent, style="Content.TFrame")
+        self.titulo = titulo
+        self.log_y = log_y
+        self.inverter_y = inverter_y
+        self._foreground = foreground
+        self._series: Dict[str, _Serie] = {}
+        self._vista: Vista | None = None  # None: enquadra todas as séries
+        self._arraste: Tuple[int, int, int, int, Vista] | None = None
+        self._pendente: str | None = None
+
+        self._canvas = tk.Canvas(self, background=background, highlightthickness=0, width=360, height=240)
+        self._canvas.pack(fill="both", expand=True)
+        self._canvas.bind("<Configure>", lambda _e: self._agendar())
+        for evento in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self._canvas.bind(evento, self._zoom)
+        self._canvas.bind("<ButtonPress-1>", self._iniciar_arraste)
+        self._canvas.bind("<B1-Motion>", self._arrastar)
+        self._canvas.bind("<ButtonRelease-1>", lambda _e: setattr(self, "_arraste", None))
+        self._canvas.bind("<Double-Button-1>", lambda _e: self.enquadrar())
+
+    def definir(
+        self,
+        nome: str,
+        x: Sequence[float] | np.ndarray,
+        y: Sequence[float] | np.ndarray,
+        cor: str | None = None,
+        marcadores: bool = False,
+    ) -> None:
+        """Substitui (ou cria) uma série; os pontos são ordenados por x uma única vez aqui."""
+        x_np = np.asarray(x, dtype=float)
+        y_np = self._transformar(np.asarray(y, dtype=float))
+        if x_np.shape != y_np.shape or x_np.ndim != 1:
+            raise ValueError("x e y devem ser vetores do mesmo tamanho.")
+        if len(x_np) > 1 and (np.diff(x_np) < 0).any():
+            ordem = np.argsort(x_np, kind="stable")
+            x_np, y_np = x_np[ordem], y_np[ordem]
+        self._serie(nome, cor, marcadores).definir(x_np, y_np)
+        self._agendar()
+
+    def acrescentar(
+        self, nome: str, x: Sequence[float] | np.ndarray, y: Sequence[float] | np.ndarray, cor: str | None = None
+    ) -> None:
+        """Anexa pontos ao fim de uma série; x deve continuar crescente."""
+        x_np = np.asarray(x, dtype=float).ravel()
+        y_np = self._transformar(np.asarray(y, dtype=float).ravel())
+        if x_np.shape != y_np.shape:
+            raise ValueError("x e y devem ter o mesmo tamanho.")
+        self._serie(nome, cor, False).acrescentar(x_np, y_np)
+        self._agendar()
+
+    def limpar(self) -> None:
+        self._series.clear()
+        self._vista = None
+        self._agendar()
+
+    def enquadrar(self) -> None:
+        """Volta ao enquadramento automático de todas as séries."""
+        self._vista = None
+        self._agendar()
+
+    def pontos(self, nome: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Pontos da série como armazenados (y já em log10 quando `log_y`)."""
+        serie = self._series[nome]
+        return serie.x[: serie.tamanho], serie.y[: serie.tamanho]
+
+    def _serie(self, nome: str, cor: str | None, marcadores: bool) -> _Serie:
+        serie = self._series.get(nome)
+        if serie is None:
+            serie = _Serie(cor or CORES[len(self._series) % len(CORES)], marcadores)
+            self._series[nome] = serie
+        elif cor is not None:
+            serie.cor = cor
+        return serie
+
+    def _transformar(self, y: np.ndarray) -> np.ndarray:
+        if not self.log_y:
+            return y
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(y > 0, np.log10(np.where(y > 0, y, 1.0)), np.nan)
+
+    def _vista_atual(self) -> Vista:
+        if self._vista is not None:
+            return self._vista
+        limites = [serie.limites for serie in self._series.values() if serie.limites[0] <= serie.limites[1]]
+        if not limites:
+            return (0.0, 1.0, 0.0, 1.0)
+        x0, x1 = min(l[0] for l in limites), max(l[1] for l in limites)
+        y0, y1 = min(l[2] for l in limites), max(l[3] for l in limites)
+        folga = 0.05 * (y1 - y0) or 0.5
+        return (x0, x1 if x1 > x0 else x0 + 1.0, y0 - folga, y1 + folga)
+
+    def _area(self) -> Tuple[int, int, int, int]:
+        largura = max(self._canvas.winfo_width(), MARGEM_ESQUERDA + MARGEM_DIREITA + 2)
+        altura = max(self._canvas.winfo_height(), MARGEM_TOPO + MARGEM_BASE + 2)
+        return MARGEM_ESQUERDA, MARGEM_TOPO, largura - MARGEM_DIREITA, altura - MARGEM_BASE
+
+    def _agendar(self) -> None:
+        if self._pendente is None:
+            self._pendente = self.after(ATRASO_REDESENHO_MS, self._desenhar)
+
+    def _desenhar(self) -> None:
+        self._pendente = None
+        canvas = self._canvas
+        canvas.delete("all")
+        esquerda, topo, direita, base = self._area()
+        x0, x1, y0, y1 = self._vista_atual()
+        escala_x = (direita - esquerda) / (x1 - x0)
+        escala_y = (base - topo) / (y1 - y0)
+
+        self._desenhar_eixos(esquerda, topo, direita, base, (x0, x1, y0, y1))
+        for serie in self._series.values():
+            x, y = decimar_minmax(serie.x[: serie.tamanho], serie.y[: serie.tamanho], x0, x1, direita - esquerda)
+            validos = np.isfinite(y)
+            x, y = x[validos], y[validos]
+            if not len(x):
+                continue
+            px = np.clip(esquerda + (x - x0) * escala_x, esquerda, direita)
+            if self.inverter_y:
+                py = np.clip(topo + (y - y0) * escala_y, topo, base)
+            else:
+                py = np.clip(base - (y - y0) * escala_y, topo, base)
+            coordenadas = np.column_stack((px, py)).ravel().tolist()
+            if len(x) > 1:
+                canvas.create_line(*coordenadas, fill=serie.cor, width=1.5, tags="dados")
+            if serie.marcadores and len(x) <= MAX_MARCADORES:
+                for cx, cy in zip(px.tolist(), py.tolist()):
+                    canvas.create_oval(cx - 3, cy - 3, cx + 3, cy + 3, outline=serie.cor, tags="dados")
+
+    def _desenhar_eixos(self, esquerda: int, topo: int, direita: int, base: int, vista: Vista) -> None:
+        canvas = self._canvas
+        x0, x1, y0, y1 = vista
+        cor = self._foreground
+        canvas.create_rectangle(esquerda, topo, direita, base, outline="#4C566A")
+        if self.titulo:
+            canvas.create_text(esquerda, topo - 8, text=self.titulo, anchor="sw", fill=cor, font=("Segoe UI", 10, "bold"))
+        for valor in _marcas(x0, x1):
+            px = esquerda + (valor - x0) * (direita - esquerda) / (x1 - x0)
+            canvas.create_line(px, base, px, base + 4, fill=cor)
+            canvas.create_text(px, base + 6, text=f"{valor:g}", anchor="n", fill=cor, font=("Consolas", 8))
+        for valor in _marcas(y0, y1):
+            fracao = (valor - y0) / (y1 - y0)
+            py = topo + fracao * (base - topo) if self.inverter_y else base - fracao * (base - topo)
+            rotulo = f"1e{valor:g}" if self.log_y else f"{valor:.4g}"
+            canvas.create_line(esquerda - 4, py, esquerda, py, fill=cor)
+            canvas.create_text(esquerda - 6, py, text=rotulo, anchor="e", fill=cor, font=("Consolas", 8))
+
+    def _zoom(self, event: tk.Event) -> str:
+        esquerda, topo, direita, base = self._area()
+        x0, x1, y0, y1 = self._vista_atual()
+        fator = 0.8 if (event.num == 4 or getattr(event, "delta", 0) > 0) else 1.25
+        fx = min(1.0, max(0.0, (event.x - esquerda) / (direita - esquerda)))
+        fy = min(1.0, max(0.0, (event.y - topo) / (base - topo)))
+        if not self.inverter_y:
+            fy = 1.0 - fy
+        cx, cy = x0 + fx * (x1 - x0), y0 + fy * (y1 - y0)
+        self._vista = (cx - (cx - x0) * fator, cx + (x1 - cx) * fator, cy - (cy - y0) * fator, cy + (y1 - cy) * fator)
+        self._agendar()
+        return "break"
+
+    def _iniciar_arraste(self, event: tk.Event) -> None:
+        self._arraste = (event.x, event.y, event.x, event.y, self._vista_atual())
+
+    def _arrastar(self, event: tk.Event) -> None:
+        if self._arraste is None:
+            return
+        inicio_x, inicio_y, ultimo_x, ultimo_y, (x0, x1, y0, y1) = self._arraste
+        self._canvas.move("dados", event.x - ultimo_x, event.y - ultimo_y)
+        esquerda, topo, direita, base = self._area()
+        dx = (event.x - inicio_x) * (x1 - x0) / (direita - esquerda)
+        dy = (event.y - inicio_y) * (y1 - y0) / (base - topo)
+        if self.inverter_y:
+            dy = -dy
+        self._vista = (x0 - dx, x1 - dx, y0 + dy, y1 + dy)
+        self._arraste = (inicio_x, inicio_y, event.x, event.y, (x0, x1, y0, y1))
+        self._agendar()
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import tkinter as tk
+from dataclasses import dataclass
+from tkinter import filedialog, messagebox, ttk
+from tkinter import font as tkfont
+from typing import List, Sequence
+
+import numpy as np
+
+SEPARADOR = " | "
+LINHAS_POR_LOTE_EXPORTACAO = 10_000
+
+
+@dataclass(frozen=True)
+class ColunaTabela:
+    """Coluna da tabela: título, valores (qualquer sequência fatiável) e especificação de formato."""
+
+    titulo: str
+    valores: Sequence[float]
+    formato: str = "12.4f"
+
+    def largura(self) -> int:
+        return max(len(self.titulo), len(format(0, self.formato)))
+
+
+class TabelaVirtual(ttk.Frame):
+    """Tabela que formata apenas as linhas visíveis, direto dos vetores de resultado.
+
+    Mostra um resumo no topo e exporta todas as linhas para CSV em lotes, sem
+    montar o texto completo em memória.
+    """
+
+    def __init__(
+        self,
+        parent: tk.Misc,
+        altura: int = 18,
+        fonte: tuple = ("Consolas", 11),
+        background: str = "#242933",
+        foreground: str = "#E5E9F0",
+    ) -> None:
+        super().__init__(parent, style="Content.TFrame")
+        self._colunas: List[ColunaTabela] = []
+        self._resumo_linhas: List[str] = []
+        self._total = 0
+        self._inicio = 0
+        self._visiveis = altura
+        self._altura_linha = tkfont.Font(font=fonte).metrics("linespace")
+
+        estilo = dict(font=fonte, background=background, foreground=foreground, borderwidth=0)
+        self._resumo = tk.Label(self, justify="left", anchor="w", padx=15, pady=10, **estilo)
+        self._resumo.pack(fill="x")
+
+        barra = ttk.Frame(self, style="Content.TFrame")
+        barra.pack(fill="x", pady=(4, 4))
+        self._exportar_botao = ttk.Button(barra, text="Exportar CSV...", state="disabled", command=self._pedir_exportacao)
+        self._exportar_botao.pack(side="right")
+        self._posicao = ttk.Label(barra, text="")
+        self._posicao.pack(side="left")
+
+        self._cabecalho = tk.Label(self, anchor="w", padx=15, **estilo)
+        self._cabecalho.pack(fill="x")
+
+        corpo = ttk.Frame(self, style="Content.TFrame")
+        corpo.pack(fill="both", expand=True)
+        self._rolagem = ttk.Scrollbar(corpo, orient="vertical", command=self._rolar)
+        self._rolagem.pack(side="right", fill="y")
+        self._texto = tk.Text(
+            corpo,
+            height=altura,
+            wrap="none",
+            state="disabled",
+            padx=15,
+            pady=0,
+            **estilo,
+        )
+        self._texto.pack(side="left", fill="both", expand=True)
+        self._texto.bind("<Configure>", self._redimensionar)
+        for evento in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self._texto.bind(evento, self._roda_do_mouse)
+        self._texto.bind("<Prior>", lambda _e: self._rolar("scroll", -1, "pages"))
+        self._texto.bind("<Next>", lambda _e: self._rolar("scroll", 1, "pages"))
+
+    def definir(self, resumo: Sequence[str], colunas: Sequence[ColunaTabela]) -> None:
+        """Troca o conteúdo da tabela; todas as colunas devem ter o mesmo comprimento."""
+        tamanhos = {len(coluna.valores) for coluna in colunas}
+        if len(tamanhos) > 1:
+            raise ValueError("As colunas da tabela precisam ter o mesmo número de linhas.")
+        self._colunas = list(colunas)
+        self._resumo_linhas = list(resumo)
+        self._total = tamanhos.pop() if tamanhos else 0
+        self._inicio = 0
+        self._resumo.configure(text="\n".join(self._resumo_linhas))
+        self._cabecalho.configure(
+            text=SEPARADOR.join(coluna.titulo.rjust(coluna.largura()) for coluna in self._colunas)
+        )
+        self._exportar_botao.configure(state="normal" if self._total else "disabled")
+        self._renderizar()
+
+    def linhas(self, inicio: int, fim: int) -> List[str]:
+        """Formata as linhas [inicio, fim) da tabela."""
+        fatias = [
+            [format(valor, coluna.formato).rjust(coluna.largura()) for valor in coluna.valores[inicio:fim]]
+            for coluna in self._colunas
+        ]
+        return [SEPARADOR.join(celulas) for celulas in zip(*fatias)]
+
+    def exportar(self, caminho: str, linhas_por_lote: int = LINHAS_POR_LOTE_EXPORTACAO) -> None:
+        """Grava o resumo (como comentários) e todas as linhas em CSV, um lote por vez."""
+        with open(caminho, "w", encoding="utf-8", newline="\n") as arquivo:
+            for linha in self._resumo_linhas:
+                if linha.strip():
+                    arquivo.write(f"# {linha}\n")
+            arquivo.write(",".join(coluna.titulo for coluna in self._colunas) + "\n")
+            for inicio in range(0, self._total, linhas_por_lote):
+                fim = min(self._total, inicio + linhas_por_lote)
+                bloco = np.column_stack(
+                    [np.asarray(coluna.valores[inicio:fim], dtype=float) for coluna in self._colunas]
+                )
+                np.savetxt(arquivo, bloco, delimiter=",", fmt="%.17g")
+
+    def _pedir_exportacao(self) -> None:
+        caminho = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("Todos os arquivos", "*.*")],
+        )
+        if not caminho:
+            return
+        try:
+            self.exportar(caminho)
+        except OSError as exc:
+            messagebox.showerror("Erro ao exportar", str(exc))
+
+    def _renderizar(self) -> None:
+        fim = min(self._total, self._inicio + self._visiveis)
+        self._texto.configure(state="normal")
+        self._texto.delete("1.0", tk.END)
+        self._texto.insert(tk.END, "\n".join(self.linhas(self._inicio, fim)))
+        self._texto.configure(state="disabled")
+        if self._total:
+            self._rolagem.set(self._inicio / self._total, fim / self._total)
+            self._posicao.configure(text=f"Linhas {self._inicio + 1}-{fim} de {self._total}")
+        else:
+            self._rolagem.set(0.0, 1.0)
+            self._posicao.configure(text="")
+
+    def _ir_para(self, inicio: int) -> None:
+        inicio = max(0, min(inicio, self._total - self._visiveis))
+        if inicio != self._inicio:
+            self._inicio = inicio
+            self._renderizar()
+
+    def _rolar(self, acao: str, quantidade: str | int, unidade: str = "units") -> None:
+        """Comando da barra de rolagem: ("moveto", fração) ou ("scroll", n, "units"|"pages")."""
+        if acao == "moveto":
+            self._ir_para(int(float(quantidade) * self._total))
+        elif acao == "scroll":
+            passo = self._visiveis if unidade == "pages" else 1
+            self._ir_para(self._inicio + int(quantidade) * passo)
+
+    def _roda_do_mouse(self, event: tk.Event) -> str:
+        if event.num == 4 or event.delta > 0:
+            self._rolar("scroll", -3)
+        else:
+            self._rolar("scroll", 3)
+        return "break"
+
+    def _redimensionar(self, event: tk.Event) -> None:
+        visiveis = max(1, event.height // self._altura_linha)
+        if visiveis != self._visiveis:
+            self._visiveis = visiveis
+            self._inicio = max(0, min(self._inicio, self._total - visiveis))
+            self._renderizar()
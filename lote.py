@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Sequence, TextIO, Tuple
+
+from solvers import (
+    resultado_para_dict,
+    solve_blend,
+    solve_circuit,
+    solve_q1,
+    solve_q2,
+    solve_q3,
+)
+
+SOLVERS: Dict[str, Callable[..., object]] = {
+    "q1": solve_q1,
+    "blend": solve_blend,
+    "q2": solve_q2,
+    "q3": solve_q3,
+    "circuit": solve_circuit,
+}
+# Campos que apenas repetem a entrada e não precisam voltar na saída.
+OMITIR = {"circuit": ("matriz", "termos_independentes")}
+# Solvers que aceitam `orcamento_memoria`.
+COM_ORCAMENTO = ("q1", "q2", "q3", "circuit")
+MAX_ITER_CIRCUITO = 10000
+
+Trabalho = Dict[str, object]
+
+
+def ler_jsonl(arquivo: TextIO) -> Iterator[Trabalho]:
+    """Um trabalho por linha: {"id": ..., "tipo": "circuit", <parâmetros do solver>}."""
+    for numero, linha in enumerate(arquivo, start=1):
+        if not linha.strip():
+            continue
+        try:
+            trabalho = json.loads(linha)
+            if not isinstance(trabalho, dict):
+                raise ValueError("cada linha deve ser um objeto JSON")
+        except ValueError as exc:
+            yield {"id": numero, "erro_leitura": f"linha {numero}: {exc}"}
+            continue
+        trabalho.setdefault("id", numero)
+        yield trabalho
+
+
+def ler_csv(arquivo: TextIO) -> Iterator[Trabalho]:
+    """Colunas `id`, `tipo` e uma por parâmetro; cada célula é lida como JSON (listas, números)."""
+    for numero, linha in enumerate(csv.DictReader(arquivo), start=1):
+        trabalho: Trabalho = {"id": numero}
+        try:
+            for chave, valor in linha.items():
+                if chave is None or valor is None or valor == "":
+                    continue
+                if chave in ("id", "tipo"):
+                    trabalho[chave] = valor
+                else:
+                    trabalho[chave] = json.loads(valor)
+        except ValueError as exc:
+            yield {"id": trabalho.get("id", numero), "erro_leitura": f"linha {numero}: {exc}"}
+            continue
+        yield trabalho
+
+
+def executar_trabalho(trabalho: Trabalho) -> Dict[str, object]:
+    """Resolve um trabalho e devolve o registro de saída; falhas viram `"ok": false`."""
+    parametros = dict(trabalho)
+    identificador = parametros.pop("id", None)
+    tipo = parametros.pop("tipo", None)
+    saida: Dict[str, object] = {"id": identificador, "tipo": tipo}
+    inicio = time.perf_counter()
+    try:
+        if "erro_leitura" in parametros:
+            raise ValueError(parametros["erro_leitura"])
+        if tipo not in SOLVERS:
+            raise ValueError(f"Tipo de trabalho desconhecido: {tipo!r}.")
+        resultado = SOLVERS[tipo](**parametros)
+        saida["ok"] = True
+        saida["resultado"] = resultado_para_dict(resultado, excluir=OMITIR.get(tipo, ()))
+    except Exception as exc:
+        saida["ok"] = False
+        saida["erro"] = {"tipo": type(exc).__name__, "mensagem": str(exc)}
+    saida["tempo_s"] = time.perf_counter() - inicio
+    return saida
+
+
+def com_padroes(trabalhos: Iterable[Trabalho], padroes: Dict[str, Dict[str, object]]) -> Iterator[Trabalho]:
+    """Completa cada trabalho com os parâmetros de `padroes[tipo]` que ele não traz."""
+    for trabalho in trabalhos:
+        faltando = {chave: valor for chave, valor in padroes.get(trabalho.get("tipo"), {}).items() if chave not in trabalho}
+        yield {**trabalho, **faltando} if faltando else trabalho
+
+
+def _finito(valor: object) -> object:
+    if isinstance(valor, float):
+        return valor if math.isfinite(valor) else None
+    if isinstance(valor, dict):
+        return {chave: _finito(item) for chave, item in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_finito(item) for item in valor]
+    return valor
+
+
+def json_estrito(valor: object) -> str:
+    """JSON válido (RFC 8259): NaN e infinitos viram null em vez de `NaN`/`Infinity`."""
+    return json.dumps(_finito(valor), ensure_ascii=False, allow_nan=False)
+
+
+def _falha_do_grupo(trabalhos: List[Trabalho], exc: BaseException) -> List[Dict[str, object]]:
+    """Registros de erro para os trabalhos de um grupo cujo processo não devolveu resultado."""
+    erro = {"tipo": type(exc).__name__, "mensagem": str(exc)}
+    return [
+        {"id": trabalho.get("id"), "tipo": trabalho.get("tipo"), "ok": False, "erro": erro, "tempo_s": 0.0}
+        for trabalho in trabalhos
+    ]
+
+
+def _executar_grupo(trabalhos: List[Trabalho]) -> List[Dict[str, object]]:
+    return [executar_trabalho(trabalho) for trabalho in trabalhos]
+
+
+def _agrupar(trabalhos: Iterable[Trabalho], tamanho: int) -> Iterator[List[Trabalho]]:
+    grupo: List[Trabalho] = []
+    for trabalho in trabalhos:
+        grupo.append(trabalho)
+        if len(grupo) == tamanho:
+            yield grupo
+            grupo = []
+    if grupo:
+        yield grupo
+
+
+def processar(
+    trabalhos: Iterable[Trabalho],
+    trabalhadores: int | None = None,
+    max_em_voo: int | None = None,
+    ordenado: bool = True,
+    tamanho_grupo: int = 1,
+) -> Iterator[Dict[str, object]]:
+    """Distribui os trabalhos num pool de processos e devolve os resultados à medida que ficam prontos.
+
+    No máximo `max_em_voo` grupos de `tamanho_grupo` trabalhos ficam pendentes ao
+    mesmo tempo (contando os que aguardam a vez na saída ordenada), então a
+    entrada é consumida sob demanda e a memória fica limitada. Com
+    `ordenado=False`, cada resultado sai assim que termina.
+
+    Se um processo morrer (falta de memória, falha fatal), o pool é recriado e
+    os grupos que estavam nele rodam de novo, um de cada vez; o grupo que
+    derrubar o pool sozinho sai como registros `"ok": false` e o lote continua.
+    """
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+    max_em_voo = max_em_voo or 2 * trabalhadores
+    if max_em_voo < 1 or tamanho_grupo < 1:
+        raise ValueError("max_em_voo e tamanho_grupo devem ser positivos.")
+
+    grupos = enumerate(_agrupar(trabalhos, tamanho_grupo))
+    # futuro -> (índice do grupo, trabalhos, se roda isolado após uma queda do pool)
+    pendentes: Dict[Future, Tuple[int, List[Trabalho], bool]] = {}
+    suspeitos: Deque[Tuple[int, List[Trabalho]]] = deque()
+    prontos: Dict[int, List[Dict[str, object]]] = {}
+    proximo = 0
+    esgotado = False
+
+    executor = ProcessPoolExecutor(max_workers=trabalhadores)
+    try:
+        while True:
+            if suspeitos:
+                if not pendentes:
+                    indice, grupo = suspeitos.popleft()
+                    pendentes[executor.submit(_executar_grupo, grupo)] = (indice, grupo, True)
+            else:
+                while not esgotado and len(pendentes) + len(prontos) < max_em_voo:
+                    try:
+                        indice, grupo = next(grupos)
+                    except StopIteration:
+                        esgotado = True
+                        break
+                    pendentes[executor.submit(_executar_grupo, grupo)] = (indice, grupo, False)
+            if not pendentes:
+                break
+
+            concluidos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+            quebrado = False
+            for futuro in concluidos:
+                indice, grupo, isolado = pendentes.pop(futuro)
+                try:
+                    registros = futuro.result()
+                except BrokenProcessPool as exc:
+                    quebrado = True
+                    if not isolado:
+                        suspeitos.append((indice, grupo))
+                        continue
+                    registros = _falha_do_grupo(grupo, exc)
+                except Exception as exc:
+                    registros = _falha_do_grupo(grupo, exc)
+                if ordenado:
+                    prontos[indice] = registros
+                else:
+                    yield from registros
+            if quebrado:
+                # Os demais grupos do pool quebrado também falham: voltam para rodar isolados.
+                for indice, grupo, _ in pendentes.values():
+                    suspeitos.append((indice, grupo))
+                pendentes.clear()
+                executor.shutdown(wait=True, cancel_futures=True)
+                executor = ProcessPoolExecutor(max_workers=trabalhadores)
+            while proximo in prontos:
+                yield from prontos.pop(proximo)
+                proximo += 1
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _abrir_entrada(caminho: str) -> TextIO:
+    return sys.stdin if caminho == "-" else open(caminho, encoding="utf-8-sig", newline="")
+
+
+def _formato(caminho: str, formato: str | None) -> str:
+    if formato:
+        return formato
+    return "csv" if caminho.lower().endswith(".csv") else "jsonl"
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Executa trabalhos dos solvers em lote (JSONL/CSV -> JSONL).")
+    parser.add_argument("entrada", help="arquivo de trabalhos (.jsonl ou .csv); '-' lê da entrada padrão")
+    parser.add_argument("--saida", default="-", help="arquivo JSONL de resultados (padrão: saída padrão)")
+    parser.add_argument("--formato", choices=("jsonl", "csv"), help="formato da entrada (padrão: pela extensão)")
+    parser.add_argument("--trabalhadores", type=int, help="processos no pool (padrão: número de núcleos)")
+    parser.add_argument("--em-voo", type=int, help="grupos pendentes ao mesmo tempo (padrão: 2x trabalhadores)")
+    parser.add_argument("--grupo", type=int, default=1, help="trabalhos enviados juntos a cada processo")
+    parser.add_argument("--sem-ordem", action="store_true", help="escreve cada resultado assim que termina")
+    parser.add_argument(
+        "--memoria-mib", type=float, help="orçamento de memória por trabalho; acima dele, caminho econômico ou erro"
+    )
+    parser.add_argument(
+        "--max-iter",
+        type=int,
+        default=MAX_ITER_CIRCUITO,
+        help=f"varreduras de Gauss-Seidel por circuito antes de desistir (padrão: {MAX_ITER_CIRCUITO})",
+    )
+    args = parser.parse_args(argv)
+
+    padroes: Dict[str, Dict[str, object]] = {"circuit": {"max_iter": args.max_iter}}
+    if args.memoria_mib is not None:
+        for tipo in COM_ORCAMENTO:
+            padroes.setdefault(tipo, {})["orcamento_memoria"] = int(args.memoria_mib * 2**20)
+    leitor = ler_csv if _formato(args.entrada, args.formato) == "csv" else ler_jsonl
+    entrada = _abrir_entrada(args.entrada)
+    trabalhos = com_padroes(leitor(entrada), padroes)
+    saida = sys.stdout if args.saida == "-" else open(args.saida, "w", encoding="utf-8")
+    total = falhas = 0
+    try:
+        for registro in processar(
+            trabalhos,
+            trabalhadores=args.trabalhadores,
+            max_em_voo=args.em_voo,
+            ordenado=not args.sem_ordem,
+            tamanho_grupo=args.grupo,
+        ):
+            saida.write(json_estrito(registro) + "\n")
+            saida.flush()
+            total += 1
+            falhas += not registro["ok"]
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if saida is not sys.stdout:
+            saida.close()
+
+    print(f"{total} trabalhos, {falhas} com erro.", file=sys.stderr)
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import sys
+from collections import deque
+from typing import Callable, Deque, Dict, Iterator, List, Sequence, TextIO, Tuple
+
+import numpy as np
+
+Evento = Tuple[object, ...]
+
+LARGURA = 80
+
+
+def formatar_matriz(matriz: np.ndarray, nome: str = "Matriz") -> str:
+    """Texto de uma matriz com 4 casas decimais, zerando resíduos menores que 1e-10."""
+    valores = np.where(np.abs(matriz) < 1e-10, 0.0, matriz)
+    linhas = [f"\n{nome}:", "-" * LARGURA]
+    for linha in valores:
+        linhas.append("| " + "".join(f"{valor:10.4f} " for valor in linha) + "|")
+    linhas.append("-" * LARGURA)
+    return "\n".join(linhas)
+
+
+def _secao(titulo: str) -> str:
+    return "\n" + "=" * LARGURA + f"\n{titulo}\n" + "=" * LARGURA
+
+
+def _calculo(x_alvo: float) -> str:
+    return f"\nCalculando para x = {x_alvo}"
+
+
+def _troca(k: int, linha: int) -> str:
+    return f"\nTroca de linhas {k+1} ↔ {linha+1} (pivoteamento)"
+
+
+def _fator(i: int, k: int, fator: float) -> str:
+    return f"\nEliminando elemento ({i+1},{k+1}): L{i+1} = L{i+1} - ({fator:.4f}) * L{k+1}"
+
+
+def _retro(i: int, termo: float, soma: float, pivo: float, x: float) -> str:
+    return f"\nx[{i+1}] = ({termo:.4f} - {soma:.4f}) / {pivo:.4f} = {x:.4f}"
+
+
+def _lagrange(i: int, x_pontos: Sequence[float], y_i: float, x_alvo: float, L_i: float) -> str:
+    outros = [x for j, x in enumerate(x_pontos) if j != i]
+    numeradores = " × ".join(f"({x_alvo} - {x})" for x in outros)
+    denominadores = " × ".join(f"({x_pontos[i]} - {x})" for x in outros)
+    return "\n".join(
+        [
+            f"\nTermo {i+1}: y_{i} = {y_i}",
+            f"L_{i}({x_alvo}) = {numeradores} / {denominadores}",
+            f"L_{i}({x_alvo}) = {L_i:.10f}",
+            f"Contribuição: {y_i} × {L_i:.10f} = {y_i * L_i:.10f}",
+        ]
+    )
+
+
+def _diferenca(i: int, ordem: int, valor: float) -> str:
+    return f"f[x_{i},...,x_{i+ordem}] = {valor:.10f}"
+
+
+def _tabela_dd(x_pontos: Sequence[float], tabela: np.ndarray) -> str:
+    n = len(x_pontos)
+    cabecalho = f"{'i':<5} {'x_i':<10} {'f[x_i]':<15}" + "".join(
+        f"f[x_i,...,x_i+{ordem}]".ljust(20) for ordem in range(1, n)
+    )
+    linhas = ["\n=== TABELA DE DIFERENÇAS DIVIDIDAS ===", cabecalho]
+    for i in range(n):
+        linhas.append(
+            f"{i:<5} {x_pontos[i]:<10.2f} {tabela[i, 0]:<15.10f}"
+            + "".join(f"{tabela[i, j]:<20.10f}" for j in range(1, n - i))
+        )
+    return "\n".join(linhas)
+
+
+def _newton_inicio(x_pontos: Sequence[float], x_alvo: float, f0: float) -> str:
+    polinomio = "P(x) = f[x_0]" + "".join(
+        f" + f[x_0,...,x_{i}]" + "".join(f"(x - {x_pontos[j]})" for j in range(i)) for i in range(1, len(x_pontos))
+    )
+    return f"\n=== MÉTODO DE NEWTON ===\n\nCalculando para x = {x_alvo}\n\n{polinomio}\n\nP({x_alvo}) = {f0:.10f}"
+
+
+def _newton(i: int, coeficiente: float, x_pontos: Sequence[float], x_alvo: float, termo: float) -> str:
+    fatores = "".join(f" × ({x_alvo} - {x_pontos[j]})" for j in range(i))
+    return f" + ({coeficiente:.10f}){fatores} = ... + {termo:.10f}"
+
+
+_RENDERIZADORES: Dict[str, Callable[..., str]] = {
+    "secao": _secao,
+    "calculo": _calculo,
+    "matriz": lambda nome, matriz: formatar_matriz(matriz, nome),
+    "troca": _troca,
+    "fator": _fator,
+    "retro": _retro,
+    "lagrange": _lagrange,
+    "diferenca": _diferenca,
+    "tabela_dd": _tabela_dd,
+    "newton_inicio": _newton_inicio,
+    "newton": _newton,
+}
+# Eventos de estrutura: nunca descartados pela amostragem.
+_SEMPRE = {"secao", "calculo", "tabela_dd", "newton_inicio"}
+# Os termos de Newton continuam a linha do P(x) anterior, como na saída original.
+_NA_MESMA_LINHA = {"newton": ("newton_inicio", "newton")}
+
+
+class RegistroPassos:
+    """Registro estruturado dos passos de um método, com texto montado só sob demanda.
+
+    Cada passo é uma tupla compacta (tipo, dados...). Com `capacidade`, apenas os
+    últimos eventos ficam guardados (buffer circular); com `amostragem=k`, só 1
+    a cada k eventos de cada tipo repetitivo é mantido. `matrizes=True` guarda
+    uma cópia da matriz a cada etapa (O(n²) de memória cada uma, O(n³) no
+    total); só o modo didático (`mostrar_passos=True`) liga por padrão.
+    """
+
+    def __init__(self, capacidade: int | None = None, amostragem: int = 1, matrizes: bool = False) -> None:
+        if (capacidade is not None and capacidade < 1) or amostragem < 1:
+            raise ValueError("capacidade e amostragem devem ser positivas.")
+        self._eventos: Deque[Evento] = deque(maxlen=capacidade)
+        self.amostragem = amostragem
+        self.matrizes = matrizes
+        self.total = 0
+        self._vistos: Dict[str, int] = {}
+
+    def registrar(self, tipo: str, *dados: object) -> None:
+        self.total += 1
+        if self.amostragem > 1 and tipo not in _SEMPRE:
+            vistos = self._vistos.get(tipo, 0)
+            self._vistos[tipo] = vistos + 1
+            if vistos % self.amostragem:
+                return
+        self._eventos.append((tipo, *dados))
+
+    def registrar_matriz(self, nome: str, matriz: np.ndarray) -> None:
+        if self.matrizes:
+            self.registrar("matriz", nome, matriz.copy())
+
+    @property
+    def descartados(self) -> int:
+        """Eventos vistos mas não guardados (amostragem ou buffer cheio)."""
+        return self.total - len(self._eventos)
+
+    def eventos(self, tipo: str | None = None) -> List[Evento]:
+        return [evento for evento in self._eventos if tipo is None or evento[0] == tipo]
+
+    def __len__(self) -> int:
+        return len(self._eventos)
+
+    def __iter__(self) -> Iterator[Evento]:
+        return iter(self._eventos)
+
+    def limpar(self) -> None:
+        self._eventos.clear()
+        self._vistos.clear()
+        self.total = 0
+
+    def renderizar(self) -> str:
+        linhas = []
+        if self.descartados:
+            linhas.append(f"[{self.descartados} passos omitidos]")
+        # A tabela completa já mostra cada diferença dividida; as entradas soltas
+        # só aparecem quando a tabela saiu do buffer.
+        tem_tabela = any(evento[0] == "tabela_dd" for evento in self._eventos)
+        anterior = None
+        for tipo, *dados in self._eventos:
+            if tipo == "diferenca" and tem_tabela:
+                continue
+            texto = _RENDERIZADORES[tipo](*dados)
+            if anterior in _NA_MESMA_LINHA.get(tipo, ()):
+                linhas[-1] += texto
+            else:
+                linhas.append(texto)
+            anterior = tipo
+        return "\n".join(linhas)
+
+    def imprimir(self, arquivo: TextIO | None = None) -> None:
+        print(self.renderizar(), file=arquivo or sys.stdout)
@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import json
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from lote import executar_trabalho, json_estrito
+from solvers import solve_circuit_lote
+
+TIPOS = ("q1", "q2", "q3", "circuit")
+LIMITE_FILA = 256
+JANELA_LOTE_MS = 2.0
+MAX_LOTE = 64
+MAX_CORPO_BYTES = 64 * 2**20
+LIMITES_LATENCIA_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1_000, 2_000, 5_000, 10_000)
+PARAMETROS_CIRCUITO = {"matriz", "precision", "max_iter"}
+ERROS_DE_ENTRADA = {"ValueError", "TypeError", "KeyError", "LinAlgError"}
+
+Resposta = Dict[str, object]
+
+
+class ErroHttp(Exception):
+    def __init__(self, status: int, mensagem: str) -> None:
+        super().__init__(mensagem)
+        self.status = status
+        self.mensagem = mensagem
+
+
+MOTIVOS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+def _erro(exc: Exception) -> Resposta:
+    return {"ok": False, "erro": {"tipo": type(exc).__name__, "mensagem": str(exc)}}
+
+
+def _resolver_circuitos(pedidos: Sequence[Dict[str, object]]) -> List[Resposta]:
+    """Agrupa circuitos de mesma forma e parâmetros numa única chamada a `solve_circuit_lote`."""
+    respostas: List[Resposta | None] = [None] * len(pedidos)
+    matrizes: Dict[int, np.ndarray] = {}
+    grupos: Dict[Tuple[Tuple[int, ...], float, int], List[int]] = {}
+    for i, pedido in enumerate(pedidos):
+        try:
+            desconhecidos = set(pedido) - PARAMETROS_CIRCUITO
+            if desconhecidos:
+                raise TypeError(f"Parâmetros desconhecidos: {', '.join(sorted(desconhecidos))}.")
+            if "matriz" not in pedido:
+                raise ValueError("Informe a 'matriz' estendida [A|b].")
+            matriz = np.asarray(pedido["matriz"], dtype=float)
+            if matriz.ndim != 2 or matriz.shape[1] != matriz.shape[0] + 1:
+                raise ValueError("A matriz estendida deve ter n linhas e n+1 colunas.")
+            chave = (matriz.shape, float(pedido.get("precision", 0.0001)), int(pedido.get("max_iter", 10000)))
+        except (TypeError, ValueError) as exc:
+            respostas[i] = _erro(exc)
+            continue
+        matrizes[i] = matriz
+        grupos.setdefault(chave, []).append(i)
+
+    for (_, precision, max_iter), indices in grupos.items():
+        try:
+            lote = solve_circuit_lote(np.stack([matrizes[i] for i in indices]), precision, max_iter)
+        except Exception as exc:
+            for i in indices:
+                respostas[i] = _erro(exc)
+            continue
+        for j, i in enumerate(indices):
+            respostas[i] = {
+                "ok": True,
+                "resultado": {
+                    "correntes": lote.correntes[j].tolist(),
+                    "iteracoes": int(lote.iteracoes[j]),
+                    "convergiu": bool(lote.convergiu[j]),
+                },
+            }
+    return respostas
+
+
+def resolver_grupo(tipo: str, pedidos: Sequence[Dict[str, object]]) -> List[Resposta]:
+    """Resolve, num único envio ao executor, os pedidos de um mesmo tipo acumulados na janela."""
+    if tipo == "circuit":
+        return _resolver_circuitos(pedidos)
+    respostas = []
+    for pedido in pedidos:
+        registro = executar_trabalho({**pedido, "tipo": tipo})
+        respostas.append({chave: registro[chave] for chave in ("ok", "resultado", "erro") if chave in registro})
+    return respostas
+
+
+class HistogramaLatencia:
+    """Contagens de latência (ms) por faixa; a última faixa não tem limite superior."""
+
+    def __init__(self, limites_ms: Sequence[float] = LIMITES_LATENCIA_MS) -> None:
+        self.limites_ms = tuple(limites_ms)
+        self.contagens = [0] * (len(self.limites_ms) + 1)
+        self.total = 0
+        self.soma_ms = 0.0
+
+    def registrar(self, latencia_ms: float) -> None:
+        self.contagens[bisect.bisect_left(self.limites_ms, latencia_ms)] += 1
+        self.total += 1
+        self.soma_ms += latencia_ms
+
+    def quantil(self, q: float) -> float | None:
+        """Limite superior da faixa que contém o quantil `q` (None se vazio ou na faixa aberta)."""
+        if not self.total:
+            return None
+        alvo = q * self.total
+        acumulado = 0
+        for limite, contagem in zip(self.limites_ms, self.contagens):
+            acumulado += contagem
+            if acumulado >= alvo:
+                return float(limite)
+        return None
+
+    def resumo(self) -> Dict[str, object]:
+        return {
+            "limites_ms": list(self.limites_ms),
+            "contagens": list(self.contagens),
+            "total": self.total,
+            "media_ms": self.soma_ms / self.total if self.total else None,
+            "p50_ms": self.quantil(0.50),
+            "p99_ms": self.quantil(0.99),
+        }
+
+
+class ServicoSolvers:
+    """Serviço HTTP/JSON dos solvers, com lotes por tipo e limite de fila.
+
+    Pedidos do mesmo tipo que chegam dentro de `janela_lote_ms` (ou até
+    `max_lote`) vão juntos ao executor. Com mais de `limite_fila` pedidos
+    aguardando ou em execução, novos pedidos recebem 503.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        limite_fila: int = LIMITE_FILA,
+        janela_lote_ms: float = JANELA_LOTE_MS,
+        max_lote: int = MAX_LOTE,
+    ) -> None:
+        self.executor = executor
+        self.limite_fila = limite_fila
+        self.janela_lote_s = janela_lote_ms / 1000.0
+        self.max_lote = max_lote
+        self._em_fila = 0
+        self._pendentes: Dict[str, List[Tuple[Dict[str, object], asyncio.Future]]] = {tipo: [] for tipo in TIPOS}
+        self._temporizadores: Dict[str, asyncio.TimerHandle] = {}
+        self._latencias = {tipo: HistogramaLatencia() for tipo in TIPOS}
+        self._contadores = {tipo: {"pedidos": 0, "erros": 0, "rejeitados": 0, "lotes": 0} for tipo in TIPOS}
+        self._tarefas: set = set()
+
+    async def resolver(self, tipo: str, parametros: Dict[str, object]) -> Resposta:
+        if self._em_fila >= self.limite_fila:
+            self._contadores[tipo]["rejeitados"] += 1
+            raise ErroHttp(503, "Fila de pedidos cheia; tente novamente.")
+        self._em_fila += 1
+        try:
+            futuro = asyncio.get_running_loop().create_future()
+            pendentes = self._pendentes[tipo]
+            pendentes.append((parametros, futuro))
+            if len(pendentes) >= self.max_lote:
+                self._disparar(tipo)
+            elif tipo not in self._temporizadores:
+                self._temporizadores[tipo] = asyncio.get_running_loop().call_later(
+                    self.janela_lote_s, self._disparar, tipo
+                )
+            return await futuro
+        finally:
+            self._em_fila -= 1
+
+    def _disparar(self, tipo: str) -> None:
+        temporizador = self._temporizadores.pop(tipo, None)
+        if temporizador is not None:
+            temporizador.cancel()
+        itens, self._pendentes[tipo] = self._pendentes[tipo], []
+        if itens:
+            tarefa = asyncio.ensure_future(self._executar_lote(tipo, itens))
+            self._tarefas.add(tarefa)
+            tarefa.add_done_callback(self._tarefas.discard)
+
+    async def _executar_lote(self, tipo: str, itens: List[Tuple[Dict[str, object], asyncio.Future]]) -> None:
+        self._contadores[tipo]["lotes"] += 1
+        loop = asyncio.get_running_loop()
+        try:
+            respostas = await loop.run_in_executor(self.executor, resolver_grupo, tipo, [p for p, _ in itens])
+        except Exception as exc:
+            respostas = [_erro(exc)] * len(itens)
+        for (_, futuro), resposta in zip(itens, respostas):
+            if not futuro.done():
+                futuro.set_result(resposta)
+
+    def metricas(self) -> Dict[str, object]:
+        return {
+            "em_fila": self._em_fila,
+            "limite_fila": self.limite_fila,
+            "tipos": {
+                tipo: {
+                    **self._contadores[tipo],
+                    "tamanho_medio_lote": (
+                        self._contadores[tipo]["pedidos"] / self._contadores[tipo]["lotes"]
+                        if self._contadores[tipo]["lotes"]
+                        else None
+                    ),
+                    "latencia": self._latencias[tipo].resumo(),
+                }
+                for tipo in TIPOS
+            },
+        }
+
+    async def _rotear(self, metodo: str, caminho: str, corpo: bytes) -> Tuple[int, object]:
+        if caminho == "/metrics":
+            if metodo != "GET":
+                raise ErroHttp(405, "Use GET.")
+            return 200, self.metricas()
+        if caminho == "/saude":
+            return 200, {"ok": True}
+
+        partes = caminho.strip("/").split("/")
+        if len(partes) != 2 or partes[0] != "solve" or partes[1] not in TIPOS:
+            raise ErroHttp(404, f"Caminho desconhecido: {caminho}")
+        if metodo != "POST":
+            raise ErroHttp(405, "Use POST.")
+        tipo = partes[1]
+        try:
+            parametros = json.loads(corpo or b"{}")
+        except ValueError as exc:
+            raise ErroHttp(400, f"JSON inválido: {exc}") from None
+        if not isinstance(parametros, dict):
+            raise ErroHttp(400, "O corpo deve ser um objeto JSON com os parâmetros do solver.")
+
+        inicio = time.perf_counter()
+        resposta = await self.resolver(tipo, parametros)
+        self._latencias[tipo].registrar((time.perf_counter() - inicio) * 1000.0)
+        self._contadores[tipo]["pedidos"] += 1
+        if resposta["ok"]:
+            return 200, resposta
+        self._contadores[tipo]["erros"] += 1
+        return (400 if resposta["erro"]["tipo"] in ERROS_DE_ENTRADA else 500), resposta
+
+    async def tratar_conexao(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Atende pedidos HTTP/1.1 (com keep-alive) de uma conexão."""
+        try:
+            while True:
+                linha = await reader.readline()
+                if not linha.strip():
+                    break
+                cabecalhos: Dict[str, str] = {}
+                while True:
+                    cabecalho = await reader.readline()
+                    if cabecalho in (b"\r\n", b"\n", b""):
+                        break
+                    nome, _, valor = cabecalho.decode("latin-1").partition(":")
+                    cabecalhos[nome.strip().lower()] = valor.strip()
+
+                manter = False
+                try:
+                    metodo, caminho, versao = linha.decode("latin-1").split()
+                    manter = versao == "HTTP/1.1" and cabecalhos.get("connection", "").lower() != "close"
+                    tamanho = int(cabecalhos.get("content-length", "0"))
+                    if tamanho < 0 or tamanho > MAX_CORPO_BYTES:
+                        manter = False
+                        raise ErroHttp(413, "Corpo do pedido grande demais.")
+                    corpo = await reader.readexactly(tamanho) if tamanho else b""
+                    status, resposta = await self._rotear(metodo, caminho.split("?", 1)[0], corpo)
+                except ErroHttp as exc:
+                    status, resposta = exc.status, {"ok": False, "erro": {"tipo": "HTTP", "mensagem": exc.mensagem}}
+                except ValueError:
+                    status, resposta = 400, {"ok": False, "erro": {"tipo": "HTTP", "mensagem": "Pedido malformado."}}
+                    manter = False
+
+                self._escrever(writer, status, resposta, manter)
+                await writer.drain()
+                if not manter:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _escrever(writer: asyncio.StreamWriter, status: int, resposta: object, manter: bool) -> None:
+        corpo = json_estrito(resposta).encode("utf-8")
+        cabecalhos = [
+            f"HTTP/1.1 {status} {MOTIVOS.get(status, '')}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(corpo)}",
+            f"Connection: {'keep-alive' if manter else 'close'}",
+        ]
+        if status == 503:
+            cabecalhos.append("Retry-After: 1")
+        writer.write(("\r\n".join(cabecalhos) + "\r\n\r\n").encode("latin-1") + corpo)
+
+
+async def servir(servico: ServicoSolvers, host: str = "127.0.0.1", porta: int = 8765) -> None:
+    servidor = await asyncio.start_server(servico.tratar_conexao, host, porta)
+    enderecos = ", ".join(str(sock.getsockname()) for sock in servidor.sockets)
+    print(f"Servindo em {enderecos}", file=sys.stderr)
+    async with servidor:
+        await servidor.serve_forever()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Serviço HTTP/JSON local para os solvers.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--trabalhadores", type=int, help="processos do executor (padrão: número de núcleos)")
+    parser.add_argument("--threads", action="store_true", help="usa threads em vez de processos no executor")
+    parser.add_argument("--limite-fila", type=int, default=LIMITE_FILA)
+    parser.add_argument("--janela-lote-ms", type=float, default=JANELA_LOTE_MS)
+    parser.add_argument("--max-lote", type=int, default=MAX_LOTE)
+    args = parser.parse_args(argv)
+
+    classe = ThreadPoolExecutor if args.threads else ProcessPoolExecutor
+    with classe(max_workers=args.trabalhadores) as executor:
+        servico = ServicoSolvers(executor, args.limite_fila, args.janela_lote_ms, args.max_lote)
+        try:
+            asyncio.run(servir(servico, args.host, args.porta))
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,67 +1,1092 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Sequence, Tuple
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType, ModuleType
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple, get_type_hints
 
+# hashlib, inspect, json, logging, platform, tempfile e tracemalloc só servem
+# ao cache, ao perfil, aos checkpoints e aos caminhos de memória e disco, e o
+# pool de processos e a memória compartilhada (`compartilhado`, que puxa
+# multiprocessing) só às variantes `*_processos`: são importados nas funções
+# que os usam, para não pesar em `import solvers`.
+import functools
 import importlib
+import os
+import threading
+import time
+import warnings
+
 import numpy as np
 
-Q1 = importlib.import_module("T1-Q3")
-Q2 = importlib.import_module("T3-Q2")
-Q3 = importlib.import_module("T4-Q1")
-Circuit = importlib.import_module("T2-Q3")
+if TYPE_CHECKING:
+    import hashlib
+
+    from compartilhado import ArrayCompartilhado
+
+# Módulos das questões, importados apenas no primeiro uso (solvers.Q1 etc. continuam válidos).
+_MODULOS = {
+    "Q1": "T1-Q3",
+    "Q2": "T3-Q2",
+    "Q3": "T4-Q1",
+    "Circuit": "T2-Q3",
+}
+
+
+def _modulo(nome: str) -> ModuleType:
+    modulo = globals().get(nome)
+    if modulo is None:
+        modulo = importlib.import_module(_MODULOS[nome])
+        globals()[nome] = modulo
+    return modulo
+
+
+def __getattr__(nome: str) -> ModuleType:
+    if nome in _MODULOS:
+        return _modulo(nome)
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+
+class SolucaoCancelada(Exception):
+    """Levantada quando uma solução iterativa é interrompida por cancelamento."""
+
+
+class NaoConvergiu(ValueError):
+    """Levantada quando Gauss-Seidel não atinge a precisão em `max_iter` varreduras."""
+
+
+class OrcamentoMemoriaExcedido(MemoryError):
+    """Levantada antes de resolver quando nem o caminho econômico cabe no orçamento de memória."""
+
+    def __init__(self, estimado: int, orcamento: int) -> None:
+        super().__init__(
+            f"Memória estimada de {_tamanho(estimado)} excede o orçamento de "
+            f"{_tamanho(orcamento)}, mesmo no caminho econômico."
+        )
+        self.estimado = estimado
+        self.orcamento = orcamento
+
+
+def _tamanho(n_bytes: int) -> str:
+    for unidade in ("bytes", "KiB", "MiB"):
+        if n_bytes < 1024:
+            return f"{n_bytes:.0f} {unidade}" if unidade == "bytes" else f"{n_bytes:.1f} {unidade}"
+        n_bytes /= 1024
+    return f"{n_bytes:.1f} GiB"
+
+
+class _Resultado:
+    """Base dos resultados: `para_dict()` converte os arrays em listas só quando chamado."""
+
+    __slots__ = ()
 
+    def para_dict(self, excluir: Sequence[str] = ()) -> Dict[str, object]:
+        return resultado_para_dict(self, excluir)
 
-@dataclass
-class Q1Result:
+
+@dataclass(slots=True)
+class Q1Result(_Resultado):
+    quantidades_minas: np.ndarray
+    necessidades: np.ndarray
+    obtido: np.ndarray
+    erros: np.ndarray
+
+
+@dataclass(slots=True)
+class BlendResult(_Resultado):
     quantidades_minas: np.ndarray
     necessidades: np.ndarray
     obtido: np.ndarray
     erros: np.ndarray
+    residuo: float
+    iteracoes: int
+    nao_negativo: bool
 
 
-@dataclass
-class Q2Result:
-    pontos_selecionados: List[Tuple[float, float]]
+@dataclass(slots=True)
+class Q2Result(_Resultado):
+    pontos_selecionados: np.ndarray  # k x 2: colunas x e y
     valor_lagrange: float
     valor_newton: float
     diferenca: float
 
 
-@dataclass
-class Q3Result:
-    distancias: List[float]
-    profundidades: List[float]
+@dataclass(slots=True)
+class Q3Result(_Resultado):
+    distancias: np.ndarray
+    profundidades: np.ndarray
     espacamento: float
     area_trapezio: float
     area_simpson: float
     diferenca: float
     diferenca_percentual: float
+    uniforme: bool
+    # Trechos (ponto inicial, ponto final) da Simpson composta e a regra usada em cada um.
+    segmentos_simpson: np.ndarray
+    regras_simpson: np.ndarray
+
 
+@dataclass(slots=True)
+class Q3BatchResult(_Resultado):
+    area_trapezio: np.ndarray
+    area_simpson: np.ndarray
+    diferenca: np.ndarray
+    segmentos_simpson: np.ndarray
+    regras_simpson: np.ndarray
 
-@dataclass
-class CircuitResult:
+
+@dataclass(slots=True)
+class Q3FluxoResult(_Resultado):
+    pontos: int
+    area_trapezio: float
+    area_simpson: float
+    diferenca: float
+    segmentos_simpson: np.ndarray
+    regras_simpson: np.ndarray
+
+
+@dataclass(slots=True)
+class CircuitResult(_Resultado):
     correntes: np.ndarray
     matriz: np.ndarray
     termos_independentes: np.ndarray
+    iteracoes: int = 0
+    historico: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+
+@dataclass(slots=True)
+class CircuitBatchResult(_Resultado):
+    correntes: np.ndarray
+    iteracoes: np.ndarray
+    convergiu: np.ndarray
+
+
+@dataclass(slots=True)
+class MalhaResult(_Resultado):
+    tensoes: np.ndarray
+    ciclos: int
+    residuos: np.ndarray
+
+
+def _somente_leitura(array: np.ndarray) -> np.ndarray:
+    """Visão somente leitura de `array`, sem cópia e sem mudar o array original."""
+    visao = array.view()
+    visao.flags.writeable = False
+    return visao
+
+
+def _para_json(valor: object) -> object:
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, (list, tuple)):
+        return [_para_json(item) for item in valor]
+    return valor
+
+
+def resultado_para_dict(resultado: object, excluir: Sequence[str] = ()) -> Dict[str, object]:
+    """Converte um resultado dos solvers em dicionário serializável em JSON (arrays viram listas)."""
+    return {
+        campo.name: _para_json(getattr(resultado, campo.name))
+        for campo in fields(resultado)
+        if campo.name not in excluir
+    }
+
+
+class MetricasChamada:
+    """Tempos por fase (s) e contadores coletados durante uma chamada de solver."""
+
+    __slots__ = ("solver", "fases", "contadores", "_inicio")
+
+    def __init__(self, solver: str) -> None:
+        self.solver = solver
+        self.fases: Dict[str, float] = {}
+        self.contadores: Dict[str, int] = {}
+        self._inicio = 0.0
+
+    def __enter__(self) -> MetricasChamada:
+        self._inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fases["total"] = time.perf_counter() - self._inicio
+        REGISTRO_METRICAS.adicionar(self)
+        for callback in list(_callbacks_metricas):
+            # Um callback com defeito não pode trocar o resultado nem mascarar o erro do solver.
+            try:
+                callback(self)
+            except Exception:
+                import logging
+
+                logging.getLogger(__name__).exception(
+                    "Callback de métricas %r falhou para %s.", callback, self.solver
+                )
+
+    @contextmanager
+    def fase(self, nome: str) -> Iterator[None]:
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.fases[nome] = self.fases.get(nome, 0.0) + time.perf_counter() - inicio
+
+    def contar(self, nome: str, quantidade: int = 1) -> None:
+        self.contadores[nome] = self.contadores.get(nome, 0) + int(quantidade)
+
+    @contextmanager
+    def memoria(self) -> Iterator[None]:
+        """Registra em "memoria_pico_bytes" o pico alocado no bloco, medido com tracemalloc.
+
+        Só mede com `ativar_instrumentacao(memoria=True)`. O tracemalloc é único
+        no processo: as medições simultâneas (de outras threads) compartilham o
+        mesmo rastreamento, ligado pela primeira e desligado pela última, e o pico
+        só é zerado quando nenhuma outra está em curso. Assim o pico de uma
+        chamada é o do processo durante ela e inclui as alocações das outras.
+        """
+        if not _memoria_ativa:
+            yield
+            return
+        import tracemalloc
+
+        global _medicoes_memoria, _rastreio_proprio
+        with _trava_memoria:
+            if _medicoes_memoria == 0:
+                _rastreio_proprio = not tracemalloc.is_tracing()
+                if _rastreio_proprio:
+                    tracemalloc.start()
+                tracemalloc.reset_peak()
+            _medicoes_memoria += 1
+            base = tracemalloc.get_traced_memory()[0]
+        try:
+            yield
+        finally:
+            with _trava_memoria:
+                pico = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else base
+                _medicoes_memoria -= 1
+                if _medicoes_memoria == 0 and _rastreio_proprio:
+                    tracemalloc.stop()
+            self.contar("memoria_pico_bytes", max(0, pico - base))
+
+
+class _MetricasDesligadas:
+    """Substituto sem custo de MetricasChamada quando a instrumentação está desligada."""
+
+    __slots__ = ()
+    fases: Mapping[str, float] = MappingProxyType({})
+    contadores: Mapping[str, int] = MappingProxyType({})
+
+    def __enter__(self) -> _MetricasDesligadas:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def fase(self, nome: str) -> _MetricasDesligadas:
+        return self
+
+    def memoria(self) -> _MetricasDesligadas:
+        return self
+
+    def contar(self, nome: str, quantidade: int = 1) -> None:
+        pass
+
+
+class RegistroMetricas:
+    """Agrega, por solver, as métricas de todas as chamadas instrumentadas.
+
+    Os contadores são somados, exceto os de memória ("memoria_*"), que guardam o maior valor.
+    """
+
+    def __init__(self) -> None:
+        self._trava = threading.Lock()
+        self._dados: Dict[str, Dict[str, object]] = {}
+
+    def adicionar(self, metricas: MetricasChamada) -> None:
+        with self._trava:
+            dados = self._dados.setdefault(metricas.solver, {"chamadas": 0, "fases": {}, "contadores": {}})
+            dados["chamadas"] += 1
+            for nome, valor in metricas.fases.items():
+                dados["fases"][nome] = dados["fases"].get(nome, 0.0) + valor
+            for nome, valor in metricas.contadores.items():
+                anterior = dados["contadores"].get(nome, 0)
+                dados["contadores"][nome] = max(anterior, valor) if nome.startswith("memoria_") else anterior + valor
+
+    def resumo(self) -> Dict[str, Dict[str, object]]:
+        with self._trava:
+            return {
+                solver: {"chamadas": d["chamadas"], "fases": dict(d["fases"]), "contadores": dict(d["contadores"])}
+                for solver, d in self._dados.items()
+            }
+
+    def limpar(self) -> None:
+        with self._trava:
+            self._dados.clear()
+
+
+REGISTRO_METRICAS = RegistroMetricas()
+_DESLIGADAS = _MetricasDesligadas()
+_instrumentacao_ativa = False
+_memoria_ativa = False
+# Medições de memória em curso; o tracemalloc é um só para o processo.
+_trava_memoria = threading.Lock()
+_medicoes_memoria = 0
+_rastreio_proprio = False
+_callbacks_metricas: List[Callable[[MetricasChamada], None]] = []
+
+
+def ativar_instrumentacao(ativa: bool = True, memoria: bool = False) -> None:
+    """Liga ou desliga a coleta de tempos por fase e contadores nos solvers.
 
+    Com `memoria`, mede também o pico de memória de cada chamada (tracemalloc
+    deixa as alocações mais lentas, então os tempos ficam um pouco maiores).
+    """
+    global _instrumentacao_ativa, _memoria_ativa
+    _instrumentacao_ativa = ativa
+    _memoria_ativa = ativa and memoria
+
+
+def registrar_callback_metricas(callback: Callable[[MetricasChamada], None]) -> None:
+    """Registra uma função chamada com as métricas ao fim de cada chamada instrumentada."""
+    _callbacks_metricas.append(callback)
+
+
+def remover_callback_metricas(callback: Callable[[MetricasChamada], None]) -> None:
+    _callbacks_metricas.remove(callback)
+
+
+def _medir(solver: str) -> MetricasChamada | _MetricasDesligadas:
+    return MetricasChamada(solver) if _instrumentacao_ativa else _DESLIGADAS
+
+
+class CacheResultados:
+    """Cache em disco de resultados, endereçado pelo conteúdo das entradas.
+
+    A chave é o SHA-256 do nome do solver, das entradas normalizadas (arrays
+    float64 com forma), dos parâmetros e do código-fonte de `solvers.py` e do
+    módulo da questão. Cada resultado é um .npz gravado de forma atômica
+    (arquivo temporário + `os.replace`), então vários processos podem
+    compartilhar o diretório. Acima de `tamanho_maximo` bytes, os arquivos
+    usados há mais tempo (mtime, atualizado a cada acerto) são removidos.
+    """
+
+    def __init__(self, diretorio: str, tamanho_maximo: int = 512 * 2**20) -> None:
+        if tamanho_maximo <= 0:
+            raise ValueError("O tamanho máximo do cache deve ser positivo.")
+        os.makedirs(diretorio, exist_ok=True)
+        self.diretorio = diretorio
+        self.tamanho_maximo = tamanho_maximo
+        self._trava = threading.Lock()
+        self._versoes: Dict[str, str] = {}
+        self._estatisticas = {"acertos": 0, "faltas": 0, "gravacoes": 0, "remocoes": 0}
+        self._tamanho = sum(tamanho for _, _, tamanho in self._arquivos())
+
+    def chave(self, solver: str, modulo: str, argumentos: Dict[str, object]) -> str:
+        import hashlib
+
+        h = hashlib.sha256(f"{solver}|{self._versao(modulo)}|".encode())
+        for nome in sorted(argumentos):
+            h.update(f"{nome}=".encode())
+            _atualizar_hash(h, argumentos[nome])
+        return h.hexdigest()
+
+    def ler(self, chave: str) -> object | None:
+        caminho = self._caminho(chave)
+        try:
+            with np.load(caminho, allow_pickle=False) as dados:
+                resultado = _resultado_de_arrays(dados)
+        except (OSError, KeyError, ValueError):
+            resultado = None  # ausente, removido por outro processo ou corrompido
+        else:
+            try:
+                os.utime(caminho)
+            except OSError:
+                pass
+        with self._trava:
+            self._estatisticas["acertos" if resultado is not None else "faltas"] += 1
+        return resultado
+
+    def gravar(self, chave: str, resultado: object) -> None:
+        import tempfile
+
+        caminho = self._caminho(chave)
+        fd, temporario = tempfile.mkstemp(dir=self.diretorio, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as arquivo:
+                np.savez(arquivo, **_resultado_para_arrays(resultado))
+            tamanho = os.path.getsize(temporario)
+            os.replace(temporario, caminho)
+        except BaseException:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+            raise
+        with self._trava:
+            self._estatisticas["gravacoes"] += 1
+            self._tamanho += tamanho
+            if self._tamanho > self.tamanho_maximo:
+                self._remover_antigos()
+
+    def estatisticas(self) -> Dict[str, object]:
+        with self._trava:
+            dados: Dict[str, object] = dict(self._estatisticas)
+            consultas = dados["acertos"] + dados["faltas"]
+            dados["taxa_acerto"] = dados["acertos"] / consultas if consultas else 0.0
+            dados["bytes"] = self._tamanho
+            return dados
+
+    def limpar(self) -> None:
+        with self._trava:
+            for caminho, _, _ in self._arquivos():
+                _remover_se_existir(caminho)
+            self._tamanho = 0
+
+    def _remover_antigos(self) -> None:
+        # Reconta pelo disco: outros processos também gravam no diretório.
+        arquivos = sorted(self._arquivos(), key=lambda item: item[1])
+        self._tamanho = sum(tamanho for _, _, tamanho in arquivos)
+        alvo = 0.9 * self.tamanho_maximo
+        for caminho, _, tamanho in arquivos:
+            if self._tamanho <= alvo:
+                break
+            if _remover_se_existir(caminho):
+                self._estatisticas["remocoes"] += 1
+            self._tamanho -= tamanho
+
+    def _arquivos(self) -> List[Tuple[str, float, int]]:
+        arquivos = []
+        with os.scandir(self.diretorio) as entradas:
+            for entrada in entradas:
+                if entrada.name.endswith(".npz"):
+                    try:
+                        info = entrada.stat()
+                    except FileNotFoundError:
+                        continue
+                    arquivos.append((entrada.path, info.st_mtime, info.st_size))
+        return arquivos
+
+    def _caminho(self, chave: str) -> str:
+        return os.path.join(self.diretorio, f"{chave}.npz")
+
+    def _versao(self, modulo: str) -> str:
+        versao = self._versoes.get(modulo)
+        if versao is None:
+            import hashlib
+            import importlib.util
+
+            h = hashlib.sha256()
+            for origem in (__file__, importlib.util.find_spec(_MODULOS[modulo]).origin):
+                with open(origem, "rb") as arquivo:
+                    h.update(arquivo.read())
+            versao = self._versoes[modulo] = h.hexdigest()
+        return versao
+
+
+def _remover_se_existir(caminho: str) -> bool:
+    try:
+        os.remove(caminho)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _atualizar_hash(h: hashlib._Hash, valor: object) -> None:
+    if valor is None or isinstance(valor, (bool, int, float, str)):
+        h.update(f"{type(valor).__name__}:{valor!r};".encode())
+        return
+    matriz = np.ascontiguousarray(valor, dtype=float)
+    h.update(f"array{matriz.shape};".encode())
+    h.update(matriz.tobytes())
+
+
+def _resultado_para_arrays(resultado: object) -> Dict[str, np.ndarray]:
+    arrays = {"__tipo__": np.array(type(resultado).__name__)}
+    somente_leitura = []
+    for campo in fields(resultado):
+        valor = getattr(resultado, campo.name)
+        arrays[campo.name] = np.asarray(valor)
+        if isinstance(valor, np.ndarray) and not valor.flags.writeable:
+            somente_leitura.append(campo.name)
+    arrays["__somente_leitura__"] = np.array(somente_leitura, dtype=str)
+    return arrays
+
+
+@functools.lru_cache(maxsize=None)
+def _tipos_dos_campos(classe: type) -> Dict[str, type]:
+    return get_type_hints(classe)
+
+
+def _resultado_de_arrays(dados: np.lib.npyio.NpzFile) -> object:
+    """Reconstrói o resultado; os arrays que eram visões somente leitura voltam assim."""
+    classe = _RESULTADOS_CACHEAVEIS[str(dados["__tipo__"])]
+    tipos = _tipos_dos_campos(classe)
+    somente_leitura = set(dados["__somente_leitura__"].tolist()) if "__somente_leitura__" in dados.files else set()
+    valores = {}
+    for campo in fields(classe):
+        array = dados[campo.name]
+        if tipos[campo.name] is np.ndarray:
+            valores[campo.name] = _somente_leitura(array) if campo.name in somente_leitura else array
+        else:
+            valores[campo.name] = tipos[campo.name](array.item())
+    return classe(**valores)
+
+
+_RESULTADOS_CACHEAVEIS = {classe.__name__: classe for classe in (Q1Result, Q2Result, Q3Result, CircuitResult)}
+_cache: CacheResultados | None = None
+
+
+def ativar_cache(diretorio: str, tamanho_maximo: int = 512 * 2**20) -> CacheResultados:
+    """Liga o cache em disco de `solve_q1`, `solve_q2`, `solve_q3` e `solve_circuit`."""
+    global _cache
+    _cache = CacheResultados(diretorio, tamanho_maximo)
+    return _cache
+
+
+def desativar_cache() -> None:
+    global _cache
+    _cache = None
+
+
+def estatisticas_cache() -> Dict[str, object]:
+    """Acertos, faltas, gravações, remoções, taxa de acerto e bytes em disco do cache ativo."""
+    return _cache.estatisticas() if _cache is not None else {}
+
+
+def _com_cache(solver: str, modulo: str, ignorar: Sequence[str] = (), desviar: Sequence[str] = ()):
+    """Consulta o cache antes de chamar o solver.
+
+    Parâmetros em `ignorar` não entram na chave (não mudam o resultado); se
+    algum parâmetro em `desviar` for informado, a chamada não usa o cache.
+    """
+
+    def decorar(funcao: Callable[..., object]) -> Callable[..., object]:
+        assinatura = None  # obtida na primeira chamada com o cache ligado
+
+        @functools.wraps(funcao)
+        def envoltorio(*args, **kwargs):
+            nonlocal assinatura
+            cache = _cache
+            if cache is None:
+                return funcao(*args, **kwargs)
+            if assinatura is None:
+                import inspect
+
+                assinatura = inspect.signature(funcao)
+            argumentos = assinatura.bind(*args, **kwargs)
+            argumentos.apply_defaults()
+            if any(argumentos.arguments[nome] is not None for nome in desviar):
+                return funcao(*args, **kwargs)
+            try:
+                chave = cache.chave(
+                    solver,
+                    modulo,
+                    {nome: valor for nome, valor in argumentos.arguments.items() if nome not in ignorar},
+                )
+            except (TypeError, ValueError):
+                return funcao(*args, **kwargs)  # entrada inválida: o solver relata o erro
+            resultado = cache.ler(chave)
+            if resultado is None:
+                resultado = funcao(*args, **kwargs)
+                cache.gravar(chave, resultado)
+            return resultado
+
+        return envoltorio
+
+    return decorar
+
+
+class PerfilDesempenho:
+    """Métodos escolhidos pelo modo `metodo="auto"`, por assinatura de problema.
+
+    Cada assinatura guarda o método vencedor e os tempos medidos. Sem `caminho`,
+    as escolhas ficam só na memória do processo; com ele, o arquivo JSON é
+    gravado de forma atômica e vale para uma máquina (host, núcleos e versão
+    do numpy); um perfil de outra máquina é ignorado e refeito.
+    """
+
+    def __init__(self, caminho: str | None = None) -> None:
+        self.caminho = caminho
+        self._trava = threading.Lock()
+        self._escolhas: Dict[str, Dict[str, object]] = self._ler()
+
+    def escolha(self, assinatura: str) -> str | None:
+        with self._trava:
+            registro = self._escolhas.get(assinatura)
+        return None if registro is None else str(registro["metodo"])
+
+    def registrar(self, assinatura: str, metodo: str, tempos: Dict[str, float | None]) -> None:
+        with self._trava:
+            # Junta com o que outros processos gravaram desde a leitura.
+            self._escolhas = {**self._ler(), **self._escolhas}
+            self._escolhas[assinatura] = {"metodo": metodo, "tempos": tempos}
+            if self.caminho is not None:
+                self._gravar()
+
+    def escolhas(self) -> Dict[str, Dict[str, object]]:
+        with self._trava:
+            return {assinatura: dict(registro) for assinatura, registro in self._escolhas.items()}
+
+    def limpar(self) -> None:
+        with self._trava:
+            self._escolhas = {}
+            if self.caminho is not None:
+                _remover_se_existir(self.caminho)
+
+    def _ler(self) -> Dict[str, Dict[str, object]]:
+        if self.caminho is None:
+            return {}
+        import json
+
+        try:
+            with open(self.caminho, encoding="utf-8") as arquivo:
+                dados = json.load(arquivo)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(dados, dict) or dados.get("maquina") != _maquina():
+            return {}
+        return dict(dados.get("escolhas", {}))
+
+    def _gravar(self) -> None:
+        import json
+        import tempfile
+
+        diretorio = os.path.dirname(os.path.abspath(self.caminho))
+        os.makedirs(diretorio, exist_ok=True)
+        fd, temporario = tempfile.mkstemp(dir=diretorio, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as arquivo:
+                json.dump({"maquina": _maquina(), "escolhas": self._escolhas}, arquivo, indent=2, sort_keys=True)
+            os.replace(temporario, self.caminho)
+        except BaseException:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+            raise
+
+
+def _maquina() -> Dict[str, object]:
+    import platform
+
+    return {"host": platform.node(), "nucleos": os.cpu_count() or 1, "numpy": np.__version__}
+
+
+# Local sugerido para `definir_perfil_desempenho`; nada é gravado sem essa chamada.
+PERFIL_PADRAO = os.path.join(os.path.expanduser("~"), ".cache", "metodos_numericos", "perfil_desempenho.json")
+_perfil: PerfilDesempenho | None = None
+
+
+def definir_perfil_desempenho(caminho: str | None = None) -> PerfilDesempenho:
+    """Troca o arquivo onde o modo `metodo="auto"` guarda e consulta suas escolhas.
+
+    O padrão (None) mantém as escolhas só na memória do processo.
+    """
+    global _perfil
+    _perfil = PerfilDesempenho(caminho)
+    return _perfil
+
+
+def perfil_desempenho() -> PerfilDesempenho:
+    return _perfil if _perfil is not None else definir_perfil_desempenho()
+
+
+def assinatura_problema(solver: str, A: np.ndarray) -> str:
+    """Classe do problema para o autoajuste: faixa de tamanho, densidade, simetria e dominância diagonal.
+
+    A dominância é estrita (|a_ii| > soma dos demais |a_ij| em cada linha), a que
+    garante a convergência de Gauss-Seidel.
+    """
+    n = A.shape[0]
+    faixa = 1 << max(0, (n - 1).bit_length())
+    densidade = np.count_nonzero(A) / max(1, A.size)
+    classe = "esparsa" if densidade < 0.1 else "media" if densidade < 0.5 else "densa"
+    simetrica = A.shape[0] == A.shape[1] and np.allclose(A, A.T)
+    absoluta = np.abs(A)
+    diagonal = np.diagonal(absoluta)
+    dominante = A.shape[0] == A.shape[1] and bool(np.all(2 * diagonal > absoluta.sum(axis=1)))
+    return "|".join(
+        [
+            solver,
+            f"n<={faixa}",
+            classe,
+            "simetrica" if simetrica else "assimetrica",
+            "dominante" if dominante else "nao_dominante",
+        ]
+    )
 
-def solve_q1(necessidades: Sequence[float], composicao: Sequence[Sequence[float]]) -> Q1Result:
-    """Resolve o sistema da Questão 1 e retorna métricas essenciais."""
-    A, b = Q1.criar_sistema_mineracao(list(necessidades), [list(row) for row in composicao])
-    solucao = Q1.eliminacao_gaussiana(A, b, mostrar_passos=False)
-    obtido = A @ solucao
-    erros = obtido - b
-    return Q1Result(quantidades_minas=solucao, necessidades=b, obtido=obtido, erros=erros)
 
+def _autoajustar(
+    solver: str, A: np.ndarray, candidatos: Dict[str, Callable[[float | None], object | None]]
+) -> Tuple[str, object | None]:
+    """Método para `A`: o salvo no perfil para sua assinatura ou o mais rápido medido agora.
 
+    Na medição, cada candidato roda sobre a própria entrada e recebe como prazo o
+    tempo do melhor até então (devolvendo None se o excedeu); um candidato que
+    levanta `NaoConvergiu` também é descartado. O resultado do vencedor é
+    devolvido para não resolver o sistema de novo. Quando a escolha vem do
+    perfil, o resultado é None.
+    """
+    perfil = perfil_desempenho()
+    assinatura = assinatura_problema(solver, A)
+    salvo = perfil.escolha(assinatura)
+    if salvo in candidatos:
+        return salvo, None
+
+    tempos: Dict[str, float | None] = {}
+    melhor, resultado_melhor = None, None
+    for nome, executar in candidatos.items():
+        inicio = time.perf_counter()
+        try:
+            # Um candidato que diverge é só descartado, sem avisos de overflow.
+            with np.errstate(over="ignore", invalid="ignore"):
+                resultado = executar(None if melhor is None else tempos[melhor])
+        except NaoConvergiu:
+            resultado = None
+        tempos[nome] = None if resultado is None else time.perf_counter() - inicio
+        if resultado is not None and (melhor is None or tempos[nome] < tempos[melhor]):
+            melhor, resultado_melhor = nome, resultado
+    perfil.registrar(assinatura, melhor, tempos)
+    return melhor, resultado_melhor
+
+
+_BLOCO_ECONOMICO = 65536  # pontos por bloco na integração econômica da Questão 3
+
+
+def _bytes_conversao(entrada: object, elementos: int) -> int:
+    """Bytes da cópia que `np.asarray(entrada, dtype=float)` fará (0 se já for um array float64)."""
+    return 0 if isinstance(entrada, np.ndarray) and entrada.dtype == np.float64 else 8 * elementos
+
+
+def _memoria_em_disco(n: int) -> int:
+    """Mínimo para a eliminação em disco: painel de uma coluna e vetores de trabalho."""
+    return 8 * (n + 3) + 8 * 6 * n
+
+
+def _estimar(solver: str, n: int, conversao: int, metodo: str | None = None) -> Tuple[int, int]:
+    """Picos estimados (caminho padrão, caminho econômico), em bytes, além das próprias entradas.
+
+    `conversao` são os bytes gastos para converter as entradas em arrays float64.
+    """
+    if solver == "q1":
+        # A, sua cópia escalada e [A|b]; o econômico grava [A|b] em disco.
+        return conversao + 8 * (2 * n * n + 8 * n), conversao + _memoria_em_disco(n)
+    if solver == "q2":
+        # Seleção com listas Python (ponteiro e objeto por valor) contra arrays e argsort.
+        listas = 16 * n if conversao else 80 * n
+        return listas + 76 * n, conversao + 24 * n
+    if solver == "q3":
+        return conversao + 8 * 3 * n, conversao + 8 * 8 * min(n, _BLOCO_ECONOMICO)
+    gauss_seidel = conversao + 8 * (n * n + 8 * n), conversao + 8 * 8 * n
+    direto = conversao + 8 * (n * (n + 1) + min(n, 256) * (n + 768) + 6 * n), conversao + _memoria_em_disco(n)
+    if metodo == "direto":
+        return direto
+    if metodo == "auto":
+        return max(gauss_seidel[0], direto[0]), gauss_seidel[1]
+    return gauss_seidel
+
+
+def estimar_memoria(solver: str, n: int, convertida: bool = True, metodo: str | None = None) -> Dict[str, int]:
+    """Pico de memória estimado, em bytes, de um solver para um problema de tamanho `n`.
+
+    `solver` é "q1", "q2", "q3" ou "circuit" e `n` o número de materiais, pontos
+    ou correntes; `convertida` indica entradas já em arrays float64 e `metodo` é
+    o do circuito. Retorna {"padrao": ..., "economico": ...}; o caminho
+    econômico é o usado quando `orcamento_memoria` não comporta o padrão.
+    """
+    elementos = {"q1": n * n + n, "q2": 2 * n, "q3": 2 * n, "circuit": n * (n + 1)}
+    if solver not in elementos:
+        raise ValueError(f"Solver desconhecido: {solver!r}.")
+    padrao, economico = _estimar(solver, n, 0 if convertida else 8 * elementos[solver], metodo)
+    return {"padrao": padrao, "economico": economico}
+
+
+def _caminho_economico(
+    metricas: MetricasChamada | _MetricasDesligadas, padrao: int, economico: int, orcamento: int | None
+) -> bool:
+    """True se o caminho padrão não cabe em `orcamento`; falha cedo se nem o econômico cabe."""
+    if orcamento is not None and orcamento <= 0:
+        raise ValueError("O orçamento de memória deve ser positivo.")
+    usar = orcamento is not None and padrao > orcamento
+    if usar and economico > orcamento:
+        raise OrcamentoMemoriaExcedido(economico, orcamento)
+    metricas.contar("memoria_estimada_bytes", economico if usar else padrao)
+    if usar:
+        metricas.contar("caminho_economico")
+    return usar
+
+
+def _folga_em_disco(
+    metricas: MetricasChamada | _MetricasDesligadas, economico: int, orcamento: int
+) -> int:
+    """Bytes do orçamento cedidos aos painéis da eliminação em disco (somados à estimativa).
+
+    Só metade da sobra vai para os painéis: as cópias de linhas e blocos feitas
+    na fatoração ocupam o resto.
+    """
+    folga = (orcamento - economico) // 2
+    metricas.contar("memoria_estimada_bytes", folga)
+    return folga
+
+
+def _resolver_em_disco(A: np.ndarray, b: np.ndarray, folga: int) -> np.ndarray:
+    """Resolve A x = b pela eliminação em disco, com [A|b] num .npy temporário.
+
+    A matriz é gravada em blocos de linhas e fatorada em painéis que usam o
+    mínimo de `_memoria_em_disco` mais `folga` bytes; A pode ser uma visão
+    (por exemplo, transposta) sem cópia.
+    """
+    import tempfile
+
+    n = len(b)
+    memoria = 8 * (n + 3) + folga
+    Q1 = _modulo("Q1")
+    with tempfile.TemporaryDirectory(prefix="metodos_numericos_") as diretorio:
+        sistema = os.path.join(diretorio, "sistema.npy")
+        Q1.salvar_sistema_em_disco(A, b, sistema, linhas_por_bloco=max(1, memoria // (8 * (n + 1))))
+        x = Q1.eliminacao_gaussiana_em_disco(sistema, os.path.join(diretorio, "solucao.npy"), memoria_maxima=memoria)
+        solucao = np.array(x)
+        del x  # fecha o memmap antes de apagar o diretório
+    return solucao
+
+
+@_com_cache("q1", "Q1", ignorar=("num_threads", "orcamento_memoria"))
+def solve_q1(
+    necessidades: Sequence[float],
+    composicao: Sequence[Sequence[float]],
+    metodo: str = "gauss",
+    num_threads: int | None = None,
+    orcamento_memoria: int | None = None,
+) -> Q1Result:
+    """Resolve o sistema da Questão 1 e retorna métricas essenciais.
+
+    `metodo` escolhe entre a eliminação gaussiana clássica ("gauss") e a versão
+    em blocos com atualização paralela ("blocos", usando `num_threads` threads).
+    Com "auto", usa a combinação de método e threads mais rápida já medida para
+    problemas da mesma assinatura, medindo-as nesta entrada na primeira vez.
+
+    Com `orcamento_memoria` (bytes) menor que o pico estimado, o sistema é
+    gravado e fatorado em disco dentro do orçamento; se nem isso couber, levanta
+    `OrcamentoMemoriaExcedido` antes de começar.
+    """
+    if metodo not in ("gauss", "blocos", "auto"):
+        raise ValueError(f"Método desconhecido: {metodo!r}.")
+    n = len(necessidades)
+    conversao = _bytes_conversao(composicao, n * n) + _bytes_conversao(necessidades, n)
+    with _medir("q1") as metricas, metricas.memoria():
+        padrao, economico = _estimar("q1", n, conversao)
+        if _caminho_economico(metricas, padrao, economico, orcamento_memoria):
+            with metricas.fase("conversao"):
+                A = np.asarray(composicao, dtype=float).T
+                b = np.asarray(necessidades, dtype=float)
+            with metricas.fase("fatoracao"):
+                # (C^T / 100) x = b equivale a C^T x = 100 b, sem copiar a composição.
+                escala = 100.0
+                folga = _folga_em_disco(metricas, economico, orcamento_memoria)
+                solucao = _resolver_em_disco(A, escala * b, folga)
+        else:
+            with metricas.fase("conversao"):
+                A, b = _modulo("Q1").criar_sistema_mineracao(
+                    np.asarray(necessidades, dtype=float), np.asarray(composicao, dtype=float)
+                )
+            escala = 1.0
+            contadores = metricas.contadores if isinstance(metricas, MetricasChamada) else None
+            solucao = None
+            if metodo == "auto":
+                with metricas.fase("autoajuste"):
+                    escolhido, solucao = _autoajustar("q1", A, _candidatos_q1(A, b))
+                metodo, _, threads = escolhido.partition(":")
+                num_threads = int(threads) if threads else num_threads
+            if solucao is None:
+                with metricas.fase("fatoracao"):
+                    if metodo == "gauss":
+                        solucao = _modulo("Q1").eliminacao_gaussiana(A, b, mostrar_passos=False, contadores=contadores)
+                    else:
+                        solucao = _modulo("Q1").eliminacao_gaussiana_blocos(
+                            A, b, num_threads=num_threads, contadores=contadores
+                        )
+        with metricas.fase("resultado"):
+            obtido = A @ solucao / escala
+            erros = obtido - b
+            return Q1Result(quantidades_minas=solucao, necessidades=b, obtido=obtido, erros=erros)
+
+
+def _candidatos_q1(A: np.ndarray, b: np.ndarray) -> Dict[str, Callable[[float | None], np.ndarray | None]]:
+    """Métodos medidos pelo autoajuste da Questão 1: "gauss" e "blocos:<threads>"."""
+    Q1 = _modulo("Q1")
+    candidatos: Dict[str, Callable[[float | None], np.ndarray | None]] = {
+        "gauss": lambda prazo: Q1.eliminacao_gaussiana(A, b, mostrar_passos=False, prazo=prazo),
+    }
+    for threads in sorted({1, os.cpu_count() or 1}):
+        candidatos[f"blocos:{threads}"] = lambda prazo, t=threads: Q1.eliminacao_gaussiana_blocos(
+            A, b, num_threads=t, prazo=prazo
+        )
+    return candidatos
+
+
+def solve_blend(
+    necessidades: Sequence[float],
+    composicao: Sequence[Sequence[float]],
+    nao_negativo: bool = True,
+    x_inicial: Sequence[float] | None = None,
+) -> BlendResult:
+    """Mistura generalizada: N materiais x M minas, por mínimos quadrados.
+
+    `composicao` tem uma linha por mina com o percentual de cada material. O
+    sistema pode ser sobre ou subdeterminado; com `nao_negativo` as tonelagens
+    são restritas a x >= 0 (NNLS). `x_inicial` (por exemplo, a solução de um
+    problema parecido) é usado como partida a quente do NNLS.
+    """
+    b = np.asarray(necessidades, dtype=float)
+    comp = np.asarray(composicao, dtype=float)
+    if b.ndim != 1 or b.size == 0:
+        raise ValueError("Informe ao menos uma necessidade.")
+    if comp.ndim != 2 or comp.shape[0] == 0 or comp.shape[1] != b.size:
+        raise ValueError("Cada mina deve ter um percentual para cada material.")
+
+    with _medir("blend") as metricas:
+        A, b = _modulo("Q1").criar_sistema_mineracao(b, comp)
+        with metricas.fase("minimos_quadrados"):
+            if nao_negativo:
+                solucao, iteracoes = _modulo("Q1").nnls_conjunto_ativo(A, b, x_inicial=x_inicial)
+            else:
+                solucao, iteracoes = _modulo("Q1").minimos_quadrados_qr(A, b), 0
+        metricas.contar("iteracoes_nnls", iteracoes)
+        obtido = A @ solucao
+        erros = obtido - b
+    return BlendResult(
+        quantidades_minas=solucao,
+        necessidades=b,
+        obtido=obtido,
+        erros=erros,
+        residuo=float(np.linalg.norm(erros)),
+        iteracoes=iteracoes,
+        nao_negativo=nao_negativo,
+    )
+
+
+def solve_q1_em_disco(
+    caminho_sistema: str,
+    caminho_solucao: str,
+    tamanho_bloco: int = 256,
+    memoria_maxima: int = 256 * 2**20,
+    num_threads: int = 1,
+) -> np.ndarray:
+    """Resolve um sistema [A|b] gravado em .npy sem carregá-lo inteiro na memória.
+
+    O arquivo de entrada é sobrescrito pela fatoração; use
+    `Q1.salvar_sistema_em_disco` para gerá-lo a partir de A e b.
+    """
+    return _modulo("Q1").eliminacao_gaussiana_em_disco(
+        caminho_sistema,
+        caminho_solucao,
+        tamanho_bloco=tamanho_bloco,
+        memoria_maxima=memoria_maxima,
+        num_threads=num_threads,
+    )
+
+
+def _faixas(total: int, partes: int) -> List[Tuple[int, int]]:
+    limites = np.linspace(0, total, partes + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(limites[:-1], limites[1:]) if b > a]
+
+
+def _resolver_q1_compartilhado(
+    matriz: ArrayCompartilhado,
+    termos: ArrayCompartilhado,
+    saida: ArrayCompartilhado,
+    inicio: int,
+    fim: int,
+    metodo: str,
+) -> None:
+    from compartilhado import anexar
+
+    with anexar(matriz, termos, saida) as (A, B, X):
+        for i in range(inicio, fim):
+            if metodo == "gauss":
+                X[i] = _modulo("Q1").eliminacao_gaussiana(A, B[i], mostrar_passos=False)
+            else:
+                X[i] = _modulo("Q1").eliminacao_gaussiana_blocos(A, B[i], num_threads=1)
+
+
+def solve_q1_processos(
+    necessidades: Sequence[Sequence[float]] | np.ndarray,
+    composicao: Sequence[Sequence[float]] | np.ndarray,
+    metodo: str = "gauss",
+    trabalhadores: int | None = None,
+) -> Q1Result:
+    """Resolve a Questão 1 para vários vetores de necessidades, dividindo-os entre processos.
+
+    A matriz do sistema é publicada uma única vez em memória compartilhada; cada
+    processo recebe só identificadores e uma faixa de linhas, e grava as
+    soluções direto no buffer de saída. O resultado traz uma linha por vetor.
+    """
+    B = np.asarray(necessidades, dtype=float)
+    comp = np.asarray(composicao, dtype=float)
+    if B.ndim != 2 or B.shape[0] == 0:
+        raise ValueError("Informe uma matriz com um vetor de necessidades por linha.")
+    if comp.shape != (B.shape[1], B.shape[1]):
+        raise ValueError("A composição deve ser quadrada, com um percentual por material.")
+    if metodo not in ("gauss", "blocos"):
+        raise ValueError(f"Método desconhecido: {metodo!r}.")
+
+    with _medir("q1_processos") as metricas:
+        A = _modulo("Q1").criar_sistema_mineracao(B[0], comp)[0]
+        with metricas.fase("fatoracao"):
+            solucoes = _em_processos(
+                _resolver_q1_compartilhado, [A, B], [(B.shape, np.float64)], len(B), trabalhadores, metodo
+            )[0]
+        metricas.contar("sistemas", len(B))
+        obtido = solucoes @ A.T
+    return Q1Result(quantidades_minas=solucoes, necessidades=B, obtido=obtido, erros=obtido - B)
+
+
+def _em_processos(
+    tarefa: Callable[..., None],
+    entradas: Sequence[np.ndarray],
+    saidas: Sequence[Tuple[Tuple[int, ...], type]],
+    total: int,
+    trabalhadores: int | None,
+    *argumentos: object,
+) -> List[np.ndarray]:
+    """Publica `entradas` e aloca `saidas` em memória compartilhada e roda `tarefa` por faixas.
+
+    Cada chamada recebe os identificadores das entradas e saídas, `inicio`, `fim`
+    e `argumentos`. Os blocos são removidos ao final mesmo que um processo
+    trabalhador morra (o erro `BrokenProcessPool` é propagado).
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from compartilhado import AreaCompartilhada
+
+    trabalhadores = max(1, min(trabalhadores or os.cpu_count() or 1, total))
+    with AreaCompartilhada() as area:
+        identificadores = [area.publicar(entrada) for entrada in entradas]
+        buffers = [area.alocar(forma, dtype) for forma, dtype in saidas]
+        identificadores += [identificador for identificador, _ in buffers]
+        with ProcessPoolExecutor(max_workers=trabalhadores) as executor:
+            futuros = [
+                executor.submit(tarefa, *identificadores, inicio, fim, *argumentos)
+                for inicio, fim in _faixas(total, trabalhadores)
+            ]
+            for futuro in futuros:
+                futuro.result()
+        # Copia antes de fechar a área: as visões deixam de valer quando os blocos somem.
+        resultados = [buffer.copy() for _, buffer in buffers]
+        del buffers
+    return resultados
+
+
+@_com_cache("q2", "Q2", ignorar=("orcamento_memoria",))
 def solve_q2(
     x_pontos: Sequence[float],
     y_pontos: Sequence[float],
     x_alvo: float,
     grau: int,
+    orcamento_memoria: int | None = None,
 ) -> Q2Result:
-    """Executa os métodos de Lagrange e Newton da Questão 2."""
+    """Executa os métodos de Lagrange e Newton da Questão 2.
+
+    Com `orcamento_memoria` (bytes) menor que o pico estimado, os pontos são
+    escolhidos com arrays em vez de listas; se nem isso couber, levanta
+    `OrcamentoMemoriaExcedido` antes de começar.
+    """
     if len(x_pontos) != len(y_pontos):
         raise ValueError("As listas de x e y devem ter o mesmo tamanho.")
     if len(x_pontos) == 0:
@@ -71,85 +1096,717 @@ def solve_q2(
     if grau + 1 > len(x_pontos):
         raise ValueError("Número de pontos insuficiente para o grau desejado.")
 
-    x_sel, y_sel = Q2.escolher_pontos_centralizados(list(x_pontos), list(y_pontos), x_alvo, grau)
-    valor_lagrange = Q2.interpolacao_lagrange(x_sel, y_sel, x_alvo, mostrar_passos=False)
-    valor_newton = Q2.interpolacao_newton(x_sel, y_sel, x_alvo, mostrar_passos=False)
+    n = len(x_pontos)
+    conversao = _bytes_conversao(x_pontos, n) + _bytes_conversao(y_pontos, n)
+    with _medir("q2") as metricas, metricas.memoria():
+        economico = _caminho_economico(metricas, *_estimar("q2", n, conversao), orcamento_memoria)
+        with metricas.fase("selecao"):
+            if economico:
+                x_sel, y_sel = _modulo("Q2").escolher_pontos_centralizados_vetorizado(x_pontos, y_pontos, x_alvo, grau)
+            else:
+                x_sel, y_sel = _modulo("Q2").escolher_pontos_centralizados(list(x_pontos), list(y_pontos), x_alvo, grau)
+        metricas.contar("pontos_selecionados", len(x_sel))
+        with metricas.fase("lagrange"):
+            valor_lagrange = _modulo("Q2").interpolacao_lagrange(x_sel, y_sel, x_alvo, mostrar_passos=False)
+        with metricas.fase("newton"):
+            valor_newton = _modulo("Q2").interpolacao_newton(x_sel, y_sel, x_alvo, mostrar_passos=False)
 
-    pontos = list(zip(x_sel, y_sel))
-    diferenca = abs(valor_lagrange - valor_newton)
+        pontos = np.column_stack([np.asarray(x_sel, dtype=float), np.asarray(y_sel, dtype=float)])
+        diferenca = abs(valor_lagrange - valor_newton)
 
     return Q2Result(
         pontos_selecionados=pontos,
-        valor_lagrange=valor_lagrange,
-        valor_newton=valor_newton,
-        diferenca=diferenca,
+        valor_lagrange=float(valor_lagrange),
+        valor_newton=float(valor_newton),
+        diferenca=float(diferenca),
     )
 
 
-def _infer_espacamento(distancias: Sequence[float]) -> float:
+def _espacamento_uniforme(distancias: np.ndarray, bloco: int | None = None) -> float | None:
+    """Passo comum das distâncias, ou None se os pontos não forem igualmente espaçados.
+
+    Com `bloco`, as diferenças são verificadas aos poucos (memória O(bloco)).
+    """
     if len(distancias) < 2:
         raise ValueError("São necessários pelo menos dois pontos para medir o espaçamento.")
-    diffs = np.diff(distancias)
-    if not np.allclose(diffs, diffs[0], rtol=1e-3, atol=1e-6):
-        raise ValueError("Os pontos não estão igualmente espaçados.")
-    return float(diffs[0])
+    bloco = bloco or len(distancias)
+    passo, uniforme = None, True
+    for inicio in range(0, len(distancias) - 1, bloco):
+        diffs = np.diff(distancias[inicio:inicio + bloco + 1])
+        if np.any(diffs <= 0):
+            raise ValueError("As distâncias devem ser estritamente crescentes.")
+        if passo is None:
+            passo = diffs[0]
+        uniforme = uniforme and np.allclose(diffs, passo, rtol=1e-3, atol=1e-6)
+    return float(passo) if uniforme else None
 
 
+def _integrar_em_blocos(distancias: np.ndarray, profundidades: np.ndarray, bloco: int):
+    integrador = _modulo("Q3").IntegradorPerfil()
+    for inicio in range(0, len(distancias), bloco):
+        integrador.adicionar(distancias[inicio:inicio + bloco], profundidades[inicio:inicio + bloco])
+    return integrador.resultado()
+
+
+def _segmentos_para_arrays(segmentos: Sequence[Tuple[int, int, str]]) -> Tuple[np.ndarray, np.ndarray]:
+    trechos = np.array([(inicio, fim) for inicio, fim, _ in segmentos], dtype=np.int64).reshape(-1, 2)
+    return trechos, np.array([regra for _, _, regra in segmentos], dtype=str)
+
+
+@_com_cache("q3", "Q3", ignorar=("orcamento_memoria",))
 def solve_q3(
     profundidades: Sequence[float],
     espacamento: float | None = None,
     distancias: Sequence[float] | None = None,
+    orcamento_memoria: int | None = None,
 ) -> Q3Result:
-    """Calcula as áreas pelas regras de Trapézio e Simpson para a Questão 3."""
+    """Calcula as áreas pelas regras de Trapézio e Simpson para a Questão 3.
+
+    Com `distancias` desigualmente espaçadas, usa as versões das regras para
+    espaçamentos quaisquer e `espacamento` do resultado é o passo médio
+    (informá-lo também é um erro). Os
+    trechos e regras da Simpson composta ficam em `segmentos_simpson` e
+    `regras_simpson`.
+
+    Com `orcamento_memoria` (bytes) menor que o pico estimado, o espaçamento é
+    verificado e o perfil integrado em blocos; se nem isso couber, levanta
+    `OrcamentoMemoriaExcedido` antes de começar.
+    """
     if len(profundidades) < 2:
         raise ValueError("Forneça pelo menos dois pontos de profundidade.")
     if distancias is not None and len(distancias) != len(profundidades):
         raise ValueError("Listas de distâncias e profundidades devem ter o mesmo tamanho.")
-
-    if espacamento is None:
-        if distancias is None:
-            raise ValueError("Informe o espaçamento ou a lista de distâncias acumuladas.")
-        espacamento = _infer_espacamento(distancias)
-    elif espacamento <= 0:
+    if espacamento is not None and espacamento <= 0:
         raise ValueError("O espaçamento deve ser positivo.")
 
+    if distancias is None and espacamento is None:
+        raise ValueError("Informe o espaçamento ou a lista de distâncias acumuladas.")
+
+    n = len(profundidades)
+    conversao = _bytes_conversao(profundidades, n) + (16 * n if distancias is None else _bytes_conversao(distancias, n))
+    with _medir("q3") as metricas, metricas.memoria():
+        economico = _caminho_economico(metricas, *_estimar("q3", n, conversao), orcamento_memoria)
+        bloco = _BLOCO_ECONOMICO if economico else None
+        with metricas.fase("conversao"):
+            if distancias is None:
+                distancias_arr = np.arange(n) * float(espacamento)
+            else:
+                distancias_arr = np.asarray(distancias, dtype=float)
+                passo = _espacamento_uniforme(distancias_arr, bloco)
+                if passo is None:
+                    if espacamento is not None:
+                        raise ValueError("As distâncias não são igualmente espaçadas; omita o espaçamento.")
+                elif espacamento is None:
+                    espacamento = passo
+            uniforme = espacamento is not None
+            profundidade_arr = np.asarray(profundidades, dtype=float)
+        Q3 = _modulo("Q3")
+        with metricas.fase("integracao"):
+            if uniforme:
+                area_trap = Q3.regra_trapezio(profundidade_arr, float(espacamento))
+                area_simp = Q3.regra_simpson_1_3(profundidade_arr, float(espacamento), mostrar_aviso=False)
+                segmentos = Q3.segmentos_simpson(len(profundidade_arr))
+            elif economico:
+                area_trap, area_simp, segmentos = _integrar_em_blocos(distancias_arr, profundidade_arr, bloco)
+                espacamento = (distancias_arr[-1] - distancias_arr[0]) / (len(distancias_arr) - 1)
+            else:
+                area_trap = Q3.trapezio_nao_uniforme(distancias_arr, profundidade_arr)
+                area_simp, segmentos = Q3.regra_simpson_nao_uniforme(distancias_arr, profundidade_arr)
+                espacamento = (distancias_arr[-1] - distancias_arr[0]) / (len(distancias_arr) - 1)
+        diferenca = abs(area_trap - area_simp)
+        diferenca_percentual = diferenca / area_simp * 100 if area_simp != 0 else 0.0
+        trechos, regras = _segmentos_para_arrays(segmentos)
+
+        with metricas.fase("resultado"):
+            return Q3Result(
+                distancias=_somente_leitura(distancias_arr),
+                profundidades=_somente_leitura(profundidade_arr),
+                espacamento=float(espacamento),
+                area_trapezio=float(area_trap),
+                area_simpson=float(area_simp),
+                diferenca=float(diferenca),
+                diferenca_percentual=float(diferenca_percentual),
+                uniforme=uniforme,
+                segmentos_simpson=trechos,
+                regras_simpson=regras,
+            )
+
+
+def solve_q3_lote(
+    profundidades: Sequence[Sequence[float]] | np.ndarray,
+    distancias: Sequence[float] | np.ndarray | None = None,
+    espacamento: float | None = None,
+) -> Q3BatchResult:
+    """Áreas de muitos perfis de uma vez (um por linha de `profundidades`), vetorizado no lote.
+
+    `distancias` pode ser comum a todos (n) ou uma linha por perfil (L x n), com
+    espaçamentos quaisquer; sem ela, os pontos ficam a `espacamento` uns dos outros.
+    """
+    Y = np.asarray(profundidades, dtype=float)
+    if Y.ndim != 2 or Y.shape[1] < 2:
+        raise ValueError("Forneça um perfil por linha, cada um com pelo menos dois pontos.")
     if distancias is None:
-        distancias = [i * espacamento for i in range(len(profundidades))]
+        if espacamento is None or espacamento <= 0:
+            raise ValueError("Informe um espaçamento positivo ou as distâncias acumuladas.")
+        X = np.arange(Y.shape[1]) * float(espacamento)
     else:
-        _ = _infer_espacamento(distancias)
-
-    profundidade_arr = np.array(profundidades, dtype=float)
-    area_trap = Q3.regra_trapezio(profundidade_arr, float(espacamento))
-    area_simp = Q3.regra_simpson_1_3(profundidade_arr, float(espacamento), mostrar_aviso=False)
-    diferenca = abs(area_trap - area_simp)
-    diferenca_percentual = diferenca / area_simp * 100 if area_simp != 0 else 0.0
-
-    return Q3Result(
-        distancias=list(map(float, distancias)),
-        profundidades=list(map(float, profundidades)),
-        espacamento=float(espacamento),
+        X = np.asarray(distancias, dtype=float)
+        if X.shape not in ((Y.shape[1],), Y.shape):
+            raise ValueError("As distâncias devem ter um valor por ponto (comuns ou uma linha por perfil).")
+
+    with _medir("q3_lote") as metricas:
+        with metricas.fase("integracao"):
+            Q3 = _modulo("Q3")
+            area_trap = Q3.trapezio_nao_uniforme(X, Y)
+            area_simp, segmentos = Q3.regra_simpson_nao_uniforme(X, Y)
+        metricas.contar("perfis", len(Y))
+    trechos, regras = _segmentos_para_arrays(segmentos)
+    return Q3BatchResult(
+        area_trapezio=area_trap,
+        area_simpson=area_simp,
+        diferenca=np.abs(area_trap - area_simp),
+        segmentos_simpson=trechos,
+        regras_simpson=regras,
+    )
+
+
+def solve_q3_fluxo(blocos: Iterable[Tuple[Sequence[float], Sequence[float]]]) -> Q3FluxoResult:
+    """Áreas de um perfil recebido em blocos (distâncias, profundidades), sem guardá-lo inteiro.
+
+    As distâncias podem ter espaçamentos quaisquer, mas devem crescer também de
+    um bloco para o seguinte; veja `ler_perfil_em_blocos` para arquivos de texto.
+    """
+    with _medir("q3_fluxo") as metricas:
+        integrador = _modulo("Q3").IntegradorPerfil()
+        with metricas.fase("integracao"):
+            for distancias, profundidades in blocos:
+                integrador.adicionar(distancias, profundidades)
+            area_trap, area_simp, segmentos = integrador.resultado()
+        metricas.contar("pontos", integrador.pontos)
+    trechos, regras = _segmentos_para_arrays(segmentos)
+    return Q3FluxoResult(
+        pontos=integrador.pontos,
         area_trapezio=float(area_trap),
         area_simpson=float(area_simp),
-        diferenca=float(diferenca),
-        diferenca_percentual=float(diferenca_percentual),
+        diferenca=float(abs(area_trap - area_simp)),
+        segmentos_simpson=trechos,
+        regras_simpson=regras,
     )
 
 
+_SEPARADORES = str.maketrans({",": " ", ";": " "})
+_BYTES_POR_BLOCO = 16 * 2**20
+
+
+# O numpy 2 levanta ValueError em um valor inválido; o 1.x só avisa (DeprecationWarning)
+# e devolve os números lidos até ali.
+_FROMSTRING_AVISA = int(np.__version__.split(".")[0]) < 2
+
+
+def ler_numeros(texto: str) -> np.ndarray:
+    """Converte números separados por espaço, tabulação, vírgula, ponto e vírgula ou nova linha."""
+    texto = texto.translate(_SEPARADORES)
+    if not texto.strip():
+        return np.empty(0)  # fromstring devolve [-1.] para texto só com espaços
+    try:
+        if not _FROMSTRING_AVISA:
+            return np.fromstring(texto, sep=" ")
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            return np.fromstring(texto, sep=" ")
+    except (ValueError, DeprecationWarning):
+        raise ValueError("A entrada contém valores não numéricos.") from None
+
+
+def _matriz_de_linhas(linhas: Sequence[str], colunas: int | None = None) -> np.ndarray:
+    if colunas is None:
+        colunas = ler_numeros(linhas[0]).size
+    valores = ler_numeros("\n".join(linhas))
+    if colunas == 0 or valores.size != colunas * len(linhas):
+        raise ValueError("Todas as linhas da matriz devem ter o mesmo número de colunas.")
+    return valores.reshape(len(linhas), colunas)
+
+
+def _linhas_de_dados(texto: str) -> List[str]:
+    return [linha for linha in texto.splitlines() if linha.strip() and not linha.lstrip().startswith("#")]
+
+
+def ler_matriz_texto(texto: str) -> np.ndarray:
+    """Converte texto (uma linha da matriz por linha; `#` inicia comentário) em matriz 2D."""
+    linhas = _linhas_de_dados(texto)
+    if not linhas:
+        raise ValueError("Matriz vazia.")
+    return _matriz_de_linhas(linhas)
+
+
+def _blocos_de_linhas(arquivo, bloco_bytes: int) -> Iterator[List[str]]:
+    """Lê o arquivo em blocos de ~`bloco_bytes`, sempre cortando em fim de linha."""
+    resto = ""
+    while True:
+        bloco = arquivo.read(bloco_bytes)
+        if bloco:
+            bloco = resto + bloco
+            corte = bloco.rfind("\n") + 1
+            texto, resto = bloco[:corte], bloco[corte:]
+        else:
+            texto, resto = resto, ""
+        linhas = _linhas_de_dados(texto)
+        if linhas:
+            yield linhas
+        if not bloco:
+            return
+
+
+def _ler_matriz_csv(caminho: str, bloco_bytes: int) -> np.ndarray:
+    partes: List[np.ndarray] = []
+    colunas: int | None = None
+    primeiro_bloco = True
+    with open(caminho, encoding="utf-8-sig") as arquivo:
+        for linhas in _blocos_de_linhas(arquivo, bloco_bytes):
+            if primeiro_bloco:
+                primeiro_bloco = False
+                try:
+                    ler_numeros(linhas[0])
+                except ValueError:
+                    linhas = linhas[1:]  # cabeçalho
+                    if not linhas:
+                        continue
+            partes.append(_matriz_de_linhas(linhas, colunas))
+            colunas = partes[-1].shape[1]
+    if not partes:
+        raise ValueError(f"O arquivo não contém dados numéricos: {caminho}")
+    return partes[0] if len(partes) == 1 else np.concatenate(partes)
+
+
+def carregar_matriz(caminho: str, chave: str | None = None, bloco_bytes: int = _BYTES_POR_BLOCO) -> np.ndarray:
+    """Carrega uma matriz 2D de .npy, .npz (array `chave`, ou o primeiro) ou texto/CSV.
+
+    Arquivos de texto são lidos em blocos e convertidos de forma vetorizada; uma
+    linha de cabeçalho não numérica e linhas iniciadas por `#` são ignoradas.
+    Uma série 1D vira uma matriz de uma coluna.
+    """
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao == ".npy":
+        matriz = np.load(caminho, allow_pickle=False)
+    elif extensao == ".npz":
+        with np.load(caminho, allow_pickle=False) as arquivo:
+            if not arquivo.files:
+                raise ValueError(f"O arquivo não contém arrays: {caminho}")
+            nome = chave if chave is not None else arquivo.files[0]
+            if nome not in arquivo.files:
+                raise ValueError(f"Array '{nome}' não encontrado em {caminho}.")
+            matriz = arquivo[nome]
+    else:
+        matriz = _ler_matriz_csv(caminho, bloco_bytes)
+
+    matriz = np.asarray(matriz, dtype=float)
+    if matriz.ndim == 1:
+        matriz = matriz[:, np.newaxis]
+    if matriz.ndim != 2:
+        raise ValueError(f"Esperava uma matriz 2D, mas o arquivo tem {matriz.ndim} dimensões.")
+    return matriz
+
+
+def _carregar_colunas(caminho: str, nomes: Sequence[str]) -> List[np.ndarray]:
+    """Séries nomeadas de um .npz ou, nos demais formatos, as colunas (ou linhas) da matriz."""
+    if os.path.splitext(caminho)[1].lower() == ".npz":
+        with np.load(caminho, allow_pickle=False) as arquivo:
+            if all(nome in arquivo.files for nome in nomes):
+                return [np.asarray(arquivo[nome], dtype=float).ravel() for nome in nomes]
+    matriz = carregar_matriz(caminho)
+    if matriz.shape[1] not in (1, len(nomes)) and matriz.shape[0] in (1, len(nomes)):
+        matriz = matriz.T
+    return [matriz[:, j] for j in range(matriz.shape[1])]
+
+
+def carregar_pontos(caminho: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Pontos (x, y) para a Questão 2: arrays `x` e `y` de um .npz ou duas colunas."""
+    colunas = _carregar_colunas(caminho, ("x", "y"))
+    if len(colunas) != 2:
+        raise ValueError("O arquivo de pontos deve ter duas colunas: x e y.")
+    return colunas[0], colunas[1]
+
+
+def carregar_perfil(caminho: str) -> Tuple[np.ndarray | None, np.ndarray]:
+    """Perfil para a Questão 3: só profundidades (uma coluna) ou distâncias e profundidades."""
+    colunas = _carregar_colunas(caminho, ("distancias", "profundidades"))
+    if len(colunas) == 1:
+        return None, colunas[0]
+    if len(colunas) != 2:
+        raise ValueError("O arquivo de perfil deve ter uma ou duas colunas: [distâncias,] profundidades.")
+    return colunas[0], colunas[1]
+
+
+def ler_perfil_em_blocos(caminho: str, bloco_bytes: int = _BYTES_POR_BLOCO) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Lê um perfil de texto/CSV com colunas distâncias e profundidades, um bloco por vez."""
+    primeiro_bloco = True
+    with open(caminho, encoding="utf-8-sig") as arquivo:
+        for linhas in _blocos_de_linhas(arquivo, bloco_bytes):
+            if primeiro_bloco:
+                primeiro_bloco = False
+                try:
+                    ler_numeros(linhas[0])
+                except ValueError:
+                    linhas = linhas[1:]  # cabeçalho
+                    if not linhas:
+                        continue
+            matriz = _matriz_de_linhas(linhas, 2)
+            yield matriz[:, 0], matriz[:, 1]
+
+
+def hash_matriz(matriz: np.ndarray) -> str:
+    """Hash de conteúdo (SHA-256) de uma matriz, incluindo forma e tipo."""
+    import hashlib
+
+    matriz = np.ascontiguousarray(matriz)
+    h = hashlib.sha256(f"{matriz.shape}|{matriz.dtype.str}|".encode())
+    h.update(matriz.tobytes())
+    return h.hexdigest()
+
+
+def _gravar_checkpoint(caminho: str, hash_: str, k: np.ndarray, iteracao: int, historico: List[float]) -> None:
+    import tempfile
+
+    diretorio = os.path.dirname(os.path.abspath(caminho))
+    fd, temporario = tempfile.mkstemp(dir=diretorio, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as arquivo:
+            np.savez(
+                arquivo,
+                hash=np.array(hash_),
+                k=k,
+                iteracao=np.array(iteracao),
+                historico=np.asarray(historico, dtype=float),
+            )
+        os.replace(temporario, caminho)
+    except BaseException:
+        os.unlink(temporario)
+        raise
+
+
+def _ler_checkpoint(caminho: str, hash_: str) -> Tuple[np.ndarray, int, List[float]]:
+    with np.load(caminho, allow_pickle=False) as dados:
+        if str(dados["hash"]) != hash_:
+            raise ValueError("O checkpoint pertence a outra matriz (hash de conteúdo diferente).")
+        return dados["k"].copy(), int(dados["iteracao"]), dados["historico"].tolist()
+
+
+# Varreduras de Gauss-Seidel antes de `metodo="auto"` desistir dele quando `max_iter` é None.
+MAX_ITER_AUTO = 10000
+
+
+@_com_cache(
+    "circuit",
+    "Circuit",
+    ignorar=("intervalo_checkpoint", "progresso", "cancelamento", "orcamento_memoria", "max_iter"),
+    desviar=("checkpoint",),
+)
 def solve_circuit(
     matriz: Sequence[Sequence[float]],
     precision: float = 0.0001,
+    checkpoint: str | None = None,
+    intervalo_checkpoint: int = 100,
+    progresso: Callable[[int, float], None] | None = None,
+    cancelamento: threading.Event | None = None,
+    metodo: str = "gauss_seidel",
+    orcamento_memoria: int | None = None,
+    max_iter: int | None = 10000,
+    vetorizado: bool = False,
 ) -> CircuitResult:
-    """Resolve o circuito usando Gauss-Seidel."""
-    matriz_np = np.array(matriz, dtype=float)
-    rows, cols = matriz_np.shape
+    """Resolve o circuito usando Gauss-Seidel.
+
+    Se não convergir em `max_iter` varreduras (contando as já feitas antes de
+    um checkpoint; None não limita), levanta `NaoConvergiu` (um ValueError).
+    As somas de cada varredura seguem a ordem do laço original de
+    `gauss_sidel`, com o mesmo resultado bit a bit; `vetorizado=True` usa um
+    produto matriz-vetor, mais rápido para n grande, mas com arredondamento
+    diferente.
 
-    solucao = Circuit.gauss_sidel(matriz_np, rows, cols, precision=precision)
+    Com `checkpoint`, o iterado, a contagem de iterações e o histórico de
+    convergência são gravados nesse arquivo a cada `intervalo_checkpoint`
+    varreduras (e ao final). Se o arquivo já existir, a solução é retomada dele,
+    desde que o hash de conteúdo da matriz seja o mesmo.
 
-    A = matriz_np[:, :-1]
-    b = matriz_np[:, -1]
+    `progresso(iteracao, diffR)` é chamado após cada varredura. Se o evento
+    `cancelamento` for acionado, a solução para entre duas varreduras (gravando
+    o checkpoint, se houver) e levanta `SolucaoCancelada`.
 
+    `metodo="direto"` usa eliminação gaussiana com pivoteamento (sem iterações
+    nem histórico). Com "auto", usa o método mais rápido já medido para
+    circuitos da mesma assinatura, medindo os dois nesta entrada na primeira
+    vez, e cai para "direto" se Gauss-Seidel não convergir; com `checkpoint`,
+    o método é sempre Gauss-Seidel.
+
+    Com `orcamento_memoria` (bytes) menor que o pico estimado, Gauss-Seidel (e
+    "auto") itera sem copiar a matriz e "direto" fatora em disco; "auto" passa
+    para a fatoração em disco se Gauss-Seidel não convergir em `max_iter` (ou
+    `MAX_ITER_AUTO`, sem limite informado) varreduras. Se nem isso couber,
+    levanta `OrcamentoMemoriaExcedido` antes de começar.
+    """
+    if metodo not in ("gauss_seidel", "direto", "auto"):
+        raise ValueError(f"Método desconhecido: {metodo!r}.")
+    if checkpoint is not None and intervalo_checkpoint < 1:
+        raise ValueError("O intervalo de checkpoint deve ser positivo.")
+    if max_iter is not None and max_iter < 1:
+        raise ValueError("O número máximo de iterações deve ser positivo.")
+
+    n = len(matriz)
+    automatico = metodo == "auto" and checkpoint is None
+    with _medir("circuit") as metricas, metricas.memoria():
+        padrao, economico = _estimar("circuit", n, _bytes_conversao(matriz, n * (n + 1)), metodo)
+        economizar = _caminho_economico(metricas, padrao, economico, orcamento_memoria)
+        with metricas.fase("conversao"):
+            matriz_np = np.asarray(matriz, dtype=float)
+
+        solucao = None
+        if economizar:
+            with metricas.fase("iteracao"):
+                if metodo != "direto":
+                    try:
+                        solucao = _circuito_gauss_seidel(
+                            matriz_np, precision, checkpoint, intervalo_checkpoint, progresso, cancelamento,
+                            economizar_memoria=True,
+                            max_iter=max_iter if max_iter is not None or not automatico else MAX_ITER_AUTO,
+                            vetorizado=vetorizado,
+                        )
+                    except NaoConvergiu:
+                        # Sem memória para medir os dois, "auto" tenta Gauss-Seidel primeiro.
+                        if not automatico:
+                            raise
+                        metodo = "direto"
+                if metodo == "direto":
+                    folga = _folga_em_disco(metricas, economico, orcamento_memoria)
+                    correntes = _resolver_em_disco(matriz_np[:, :-1], matriz_np[:, -1], folga)
+                    solucao = correntes, 0, [], 0
+        elif automatico:
+            with metricas.fase("autoajuste"):
+                metodo, solucao = _autoajustar(
+                    "circuit",
+                    matriz_np[:, :-1],
+                    {
+                        "direto": lambda prazo: _circuito_direto(matriz_np),
+                        "gauss_seidel": lambda prazo: _circuito_gauss_seidel(
+                            matriz_np, precision, None, intervalo_checkpoint, progresso, cancelamento, prazo,
+                            max_iter=max_iter, vetorizado=vetorizado,
+                        ),
+                    },
+                )
+        if solucao is None:
+            with metricas.fase("iteracao"):
+                if metodo != "direto":
+                    try:
+                        solucao = _circuito_gauss_seidel(
+                            matriz_np, precision, checkpoint, intervalo_checkpoint, progresso, cancelamento,
+                            max_iter=max_iter, vetorizado=vetorizado,
+                        )
+                    except NaoConvergiu:
+                        # Escolha do perfil feita para outra entrada da mesma assinatura.
+                        if not automatico:
+                            raise
+                        metodo = "direto"
+                if metodo == "direto":
+                    solucao = _circuito_direto(matriz_np)
+        correntes, iteracoes, historico, inicio = solucao
+        metricas.contar("varreduras", iteracoes - inicio)
+
+    # A e b são visões somente leitura da matriz recebida, não cópias.
     return CircuitResult(
-        correntes=solucao,
-        matriz=A,
-        termos_independentes=b,
+        correntes=correntes,
+        matriz=_somente_leitura(matriz_np[:, :-1]),
+        termos_independentes=_somente_leitura(matriz_np[:, -1]),
+        iteracoes=iteracoes,
+        historico=np.asarray(historico, dtype=float),
     )
+
+
+SolucaoCircuito = Tuple[np.ndarray, int, List[float], int]
+
+
+def _circuito_direto(matriz_np: np.ndarray) -> SolucaoCircuito:
+    correntes = _modulo("Q1").eliminacao_gaussiana_blocos(matriz_np[:, :-1], matriz_np[:, -1], num_threads=1)
+    return correntes, 0, [], 0
+
+
+def _circuito_gauss_seidel(
+    matriz_np: np.ndarray,
+    precision: float,
+    checkpoint: str | None,
+    intervalo_checkpoint: int,
+    progresso: Callable[[int, float], None] | None,
+    cancelamento: threading.Event | None,
+    prazo: float | None = None,
+    economizar_memoria: bool = False,
+    max_iter: int | None = None,
+    vetorizado: bool = False,
+) -> SolucaoCircuito | None:
+    """Varreduras de Gauss-Seidel com checkpoint; devolve None se passar de `prazo` segundos.
+
+    Levanta NaoConvergiu (gravando o checkpoint) se não convergir em `max_iter` varreduras.
+    """
+    rows, cols = matriz_np.shape
+    k_inicial, iteracoes, historico = None, 0, []
+    if checkpoint is not None:
+        hash_ = hash_matriz(matriz_np)
+        if os.path.exists(checkpoint):
+            k_inicial, iteracoes, historico = _ler_checkpoint(checkpoint, hash_)
+    inicio = iteracoes
+    limite = None if prazo is None else time.perf_counter() + prazo
+
+    solucao = k_inicial
+    if not historico or historico[-1] > precision:
+        if max_iter is not None and iteracoes >= max_iter:
+            raise NaoConvergiu(f"Gauss-Seidel não convergiu em {max_iter} iterações (diffR = {historico[-1]:.3g}).")
+        for solucao, diffR in _modulo("Circuit").iterar_gauss_sidel(
+            matriz_np, rows, cols, precision, k_inicial, economizar_memoria, max_iter=None,
+            ordem_original=not vetorizado,
+        ):
+            iteracoes += 1
+            historico.append(float(diffR))
+            if checkpoint is not None and iteracoes % intervalo_checkpoint == 0:
+                _gravar_checkpoint(checkpoint, hash_, solucao, iteracoes, historico)
+            if progresso is not None:
+                progresso(iteracoes, float(diffR))
+            if cancelamento is not None and cancelamento.is_set():
+                if checkpoint is not None:
+                    _gravar_checkpoint(checkpoint, hash_, solucao, iteracoes, historico)
+                raise SolucaoCancelada(f"Solução cancelada após {iteracoes} iterações.")
+            if max_iter is not None and iteracoes >= max_iter and not diffR <= precision:
+                if checkpoint is not None:
+                    _gravar_checkpoint(checkpoint, hash_, solucao, iteracoes, historico)
+                raise NaoConvergiu(f"Gauss-Seidel não convergiu em {max_iter} iterações (diffR = {diffR:.3g}).")
+            if limite is not None and time.perf_counter() > limite:
+                return None
+    if checkpoint is not None:
+        _gravar_checkpoint(checkpoint, hash_, solucao, iteracoes, historico)
+    return solucao, iteracoes, historico, inicio
+
+
+def solve_circuit_lote(
+    matrizes: Sequence[Sequence[Sequence[float]]] | np.ndarray,
+    precision: float = 0.0001,
+    max_iter: int = 10000,
+) -> CircuitBatchResult:
+    """Resolve muitos circuitos de uma vez com Gauss-Seidel vetorizado no lote.
+
+    Aceita uma pilha de matrizes estendidas (L x n x n+1), com uma corrente por
+    linha de `correntes`, ou uma única matriz de coeficientes seguida de várias
+    colunas de termos independentes (n x n+k), com uma solução por coluna.
+    """
+    with _medir("circuit_lote") as metricas:
+        with metricas.fase("iteracao"):
+            correntes, iteracoes, convergiu = _resolver_lote(matrizes, precision, max_iter)
+        metricas.contar("varreduras", int(iteracoes.max(initial=0)))
+        metricas.contar("sistemas", len(iteracoes))
+    return CircuitBatchResult(correntes=correntes, iteracoes=iteracoes, convergiu=convergiu)
+
+
+def _resolver_lote(
+    matrizes: Sequence[Sequence[Sequence[float]]] | np.ndarray,
+    precision: float,
+    max_iter: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    matrizes_np = np.asarray(matrizes, dtype=float)
+    if matrizes_np.ndim == 3:
+        n = matrizes_np.shape[1]
+        if matrizes_np.shape[2] != n + 1:
+            raise ValueError("Cada matriz estendida deve ter n linhas e n+1 colunas.")
+        A, B = matrizes_np[:, :, :n], matrizes_np[:, :, n]
+        correntes, iteracoes, convergiu = _modulo("Circuit").gauss_sidel_lote(A, B, precision, max_iter)
+    elif matrizes_np.ndim == 2:
+        n = matrizes_np.shape[0]
+        if matrizes_np.shape[1] <= n:
+            raise ValueError("Forneça ao menos uma coluna de termos independentes.")
+        A, B = matrizes_np[:, :n], matrizes_np[:, n:].T
+        correntes, iteracoes, convergiu = _modulo("Circuit").gauss_sidel_lote(A, B, precision, max_iter)
+        correntes = correntes.T
+    else:
+        raise ValueError("Forneça uma pilha de matrizes estendidas ou uma matriz com várias colunas.")
+    return correntes, iteracoes, convergiu
+
+
+def _resolver_circuitos_compartilhados(
+    matrizes: ArrayCompartilhado,
+    correntes: ArrayCompartilhado,
+    iteracoes: ArrayCompartilhado,
+    convergiu: ArrayCompartilhado,
+    inicio: int,
+    fim: int,
+    precision: float,
+    max_iter: int,
+) -> None:
+    from compartilhado import anexar
+
+    with anexar(matrizes, correntes, iteracoes, convergiu) as (M, X, it, cv):
+        X[inicio:fim], it[inicio:fim], cv[inicio:fim] = _resolver_lote(M[inicio:fim], precision, max_iter)
+
+
+def solve_circuit_processos(
+    matrizes: Sequence[Sequence[Sequence[float]]] | np.ndarray,
+    precision: float = 0.0001,
+    max_iter: int = 10000,
+    trabalhadores: int | None = None,
+) -> CircuitBatchResult:
+    """Como `solve_circuit_lote` para uma pilha L x n x n+1, dividindo os sistemas entre processos.
+
+    A pilha é publicada uma única vez em memória compartilhada e os processos
+    recebem só identificadores, escrevendo correntes, iterações e convergência
+    direto nos buffers de saída compartilhados.
+    """
+    matrizes_np = np.asarray(matrizes, dtype=float)
+    if matrizes_np.ndim != 3 or matrizes_np.shape[2] != matrizes_np.shape[1] + 1:
+        raise ValueError("Forneça uma pilha de matrizes estendidas com n linhas e n+1 colunas.")
+    L, n = matrizes_np.shape[:2]
+
+    with _medir("circuit_processos") as metricas:
+        with metricas.fase("iteracao"):
+            correntes, iteracoes, convergiu = _em_processos(
+                _resolver_circuitos_compartilhados,
+                [matrizes_np],
+                [((L, n), np.float64), ((L,), np.int64), ((L,), np.bool_)],
+                L,
+                trabalhadores,
+                precision,
+                max_iter,
+            )
+        metricas.contar("varreduras", int(iteracoes.max(initial=0)))
+        metricas.contar("sistemas", L)
+    return CircuitBatchResult(correntes=correntes, iteracoes=iteracoes, convergiu=convergiu)
+
+
+def solve_circuit_malha(
+    linhas: int,
+    colunas: int,
+    condutancia_horizontal: float | np.ndarray,
+    condutancia_vertical: float | np.ndarray,
+    condutancia_terra: float | np.ndarray,
+    correntes: float | np.ndarray,
+    precision: float = 1e-6,
+    ciclo: str = "V",
+    max_ciclos: int = 100,
+) -> MalhaResult:
+    """Resolve uma malha resistiva em grade por multigrid geométrico (ciclos V ou W).
+
+    As condutâncias podem ser escalares ou arrays com a forma das arestas
+    horizontais (linhas x colunas-1), verticais (linhas-1 x colunas) e dos nós
+    (terra e correntes injetadas, linhas x colunas).
+    """
+    if linhas < 1 or colunas < 1:
+        raise ValueError("A malha deve ter pelo menos um nó.")
+    gh = np.broadcast_to(np.asarray(condutancia_horizontal, dtype=float), (linhas, colunas - 1)).copy()
+    gv = np.broadcast_to(np.asarray(condutancia_vertical, dtype=float), (linhas - 1, colunas)).copy()
+    gt = np.broadcast_to(np.asarray(condutancia_terra, dtype=float), (linhas, colunas)).copy()
+    b = np.broadcast_to(np.asarray(correntes, dtype=float), (linhas, colunas)).copy()
+    if (gh < 0).any() or (gv < 0).any() or (gt < 0).any():
+        raise ValueError("As condutâncias devem ser não negativas.")
+    if not gt.any():
+        raise ValueError("Ao menos um nó deve estar ligado à terra.")
+    if precision <= 0:
+        raise ValueError("A precisão deve ser positiva.")
+
+    with _medir("circuit_malha") as metricas:
+        with metricas.fase("multigrid"):
+            tensoes, residuos = _modulo("Circuit").multigrid_malha(
+                b, gh, gv, gt, precision=precision, ciclo=ciclo, max_ciclos=max_ciclos
+            )
+        metricas.contar("ciclos", len(residuos))
+    return MalhaResult(tensoes=tensoes, ciclos=len(residuos), residuos=np.asarray(residuos, dtype=float))
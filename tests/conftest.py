@@ -0,0 +1,50 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import solvers  # noqa: E402
+
+# Matriz estendida da questão do circuito (T2-Q3).
+CIRCUITO = [
+    [11.5, -2.5, 0, -4, 0, 12],
+    [-2.5, 7, 0, 0, -3, -16],
+    [0, 0, 8, 0, 0, 14],
+    [-4, 0, 0, 9, -3, -12],
+    [0, -3, 0, -3, 6, 30],
+]
+
+
+@pytest.fixture(autouse=True)
+def estado_limpo():
+    """Cada teste começa sem cache, sem perfil gravado e sem instrumentação."""
+    solvers.desativar_cache()
+    solvers.definir_perfil_desempenho()
+    solvers.ativar_instrumentacao(False)
+    yield
+    solvers.desativar_cache()
+    solvers.definir_perfil_desempenho()
+    solvers.ativar_instrumentacao(False)
+
+
+@pytest.fixture
+def sistema():
+    """Sistema 150 x 150 bem condicionado, sem simetria nem dominância diagonal."""
+    rng = np.random.default_rng(42)
+    n = 150
+    A = rng.standard_normal((n, n)) + n ** 0.5 * np.eye(n)
+    b = rng.standard_normal(n)
+    return A, b
+
+
+@pytest.fixture
+def dominante():
+    """Sistema estendido estritamente diagonal dominante, em que Gauss-Seidel converge."""
+    rng = np.random.default_rng(7)
+    n = 40
+    A = rng.random((n, n))
+    A[np.diag_indices(n)] = A.sum(axis=1) + 1.0
+    return np.column_stack([A, rng.random(n)])
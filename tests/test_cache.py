@@ -0,0 +1,64 @@
+import dataclasses
+
+import numpy as np
+
+import solvers
+from conftest import CIRCUITO
+from solvers import solve_circuit, solve_q1, solve_q2, solve_q3
+
+CHAMADAS = [
+    (solve_q1, ([100.0, 200.0, 150.0], [[50.0, 20.0, 10.0], [10.0, 60.0, 20.0], [15.0, 10.0, 70.0]])),
+    (solve_q2, ([0.0, 1.0, 2.0, 3.0, 4.0], [1.0, 2.0, 0.5, 3.0, 2.5], 2.5, 3)),
+    (solve_q3, ([1.0, 2.5, 3.0, 2.0, 1.5], 2.0)),
+    (solve_circuit, (CIRCUITO, 1e-8)),
+]
+
+
+def _campos(resultado):
+    return {campo.name: getattr(resultado, campo.name) for campo in dataclasses.fields(resultado)}
+
+
+def _assert_resultados_iguais(obtido, esperado):
+    assert type(obtido) is type(esperado)
+    for nome, valor in _campos(esperado).items():
+        outro = getattr(obtido, nome)
+        if isinstance(valor, np.ndarray):
+            np.testing.assert_array_equal(outro, valor)
+            assert outro.dtype == valor.dtype
+            assert outro.flags.writeable == valor.flags.writeable, nome
+        else:
+            assert type(outro) is type(valor), nome
+            assert outro == valor, nome
+
+
+def test_cache_devolve_o_mesmo_resultado(tmp_path):
+    cache = solvers.ativar_cache(str(tmp_path))
+    for solver, argumentos in CHAMADAS:
+        gravado = solver(*argumentos)
+        lido = solver(*argumentos)
+        _assert_resultados_iguais(lido, gravado)
+    estatisticas = cache.estatisticas()
+    assert estatisticas["faltas"] == len(CHAMADAS)
+    assert estatisticas["acertos"] == len(CHAMADAS)
+
+
+def test_cache_persiste_entre_instancias(tmp_path):
+    solver, argumentos = CHAMADAS[0]
+    solvers.ativar_cache(str(tmp_path))
+    gravado = solver(*argumentos)
+    cache = solvers.ativar_cache(str(tmp_path))
+    _assert_resultados_iguais(solver(*argumentos), gravado)
+    assert cache.estatisticas()["acertos"] == 1
+
+
+def test_parametros_diferentes_nao_colidem(tmp_path):
+    solvers.ativar_cache(str(tmp_path))
+    profundidades = [1.0, 2.5, 3.0, 2.0, 1.5]
+    assert solve_q3(profundidades, 1.0).area_simpson * 2 == solve_q3(profundidades, 2.0).area_simpson
+
+
+def test_sem_cache_nada_e_gravado(tmp_path):
+    solver, argumentos = CHAMADAS[2]
+    solver(*argumentos)
+    assert solvers.estatisticas_cache() == {}
+    assert not any(tmp_path.iterdir())
@@ -0,0 +1,105 @@
+import threading
+import warnings
+
+import numpy as np
+import pytest
+
+import solvers
+from conftest import CIRCUITO
+from solvers import NaoConvergiu, SolucaoCancelada, solve_circuit, solve_circuit_lote
+
+
+def test_lote_igual_numpy(dominante):
+    A, b = dominante[:, :-1], dominante[:, -1]
+    pilha = np.stack([dominante, np.column_stack([A, 2.0 * b]), np.column_stack([A.T, b])])
+    resultado = solve_circuit_lote(pilha, precision=1e-12)
+    assert resultado.convergiu.all()
+    for matriz, correntes in zip(pilha, resultado.correntes):
+        np.testing.assert_allclose(correntes, np.linalg.solve(matriz[:, :-1], matriz[:, -1]), rtol=1e-9)
+
+
+def test_lote_com_termos_independentes_nulos(dominante):
+    A, b = dominante[:, :-1], dominante[:, -1]
+    colunas = np.column_stack([A, b, np.zeros_like(b), -b])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        resultado = solve_circuit_lote(colunas, precision=1e-12)
+    assert resultado.convergiu.all()
+    assert resultado.iteracoes[1] == 1
+    np.testing.assert_array_equal(resultado.correntes[:, 1], 0.0)
+    np.testing.assert_allclose(resultado.correntes[:, 2], -resultado.correntes[:, 0])
+
+
+def test_gauss_seidel_com_termos_independentes_nulos(dominante):
+    matriz = dominante.copy()
+    matriz[:, -1] = 0.0
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        k = solvers.Circuit.gauss_sidel(matriz, *matriz.shape, max_iter=5)
+    np.testing.assert_array_equal(k, 0.0)
+
+
+def test_gauss_seidel_resolve_a_questao():
+    matriz = np.array(CIRCUITO, dtype=float)
+    resultado = solve_circuit(CIRCUITO, precision=1e-10)
+    np.testing.assert_allclose(resultado.correntes, np.linalg.solve(matriz[:, :-1], matriz[:, -1]), rtol=1e-8)
+    assert resultado.iteracoes == len(resultado.historico)
+
+
+@pytest.mark.parametrize("economico", [False, True])
+def test_padrao_identico_ao_gauss_sidel_original(dominante, economico):
+    original = solvers.Circuit.gauss_sidel(dominante.copy(), *dominante.shape, precision=1e-10)
+    estimativa = solvers.estimar_memoria("circuit", len(dominante))
+    orcamento = estimativa["economico"] + 1 if economico else None
+    resultado = solve_circuit(dominante, 1e-10, orcamento_memoria=orcamento)
+    np.testing.assert_array_equal(resultado.correntes, original)
+
+
+def test_vetorizado_difere_so_por_arredondamento(dominante):
+    padrao = solve_circuit(dominante, 1e-12)
+    vetorizado = solve_circuit(dominante, 1e-12, vetorizado=True)
+    np.testing.assert_allclose(vetorizado.correntes, padrao.correntes, rtol=1e-10)
+
+
+def test_direto_igual_gauss_seidel(dominante):
+    direto = solve_circuit(dominante, metodo="direto")
+    iterativo = solve_circuit(dominante, precision=1e-12)
+    np.testing.assert_allclose(direto.correntes, iterativo.correntes, rtol=1e-9)
+
+
+@pytest.mark.parametrize("vetorizado", [False, True])
+def test_checkpoint_retomado_igual_a_execucao_direta(dominante, tmp_path, vetorizado):
+    caminho = str(tmp_path / "circuito.npz")
+    cancelamento = threading.Event()
+
+    def progresso(iteracao, diffR):
+        if iteracao == 5:
+            cancelamento.set()
+
+    with pytest.raises(SolucaoCancelada):
+        solve_circuit(dominante, 1e-12, checkpoint=caminho, intervalo_checkpoint=2,
+                      progresso=progresso, cancelamento=cancelamento, vetorizado=vetorizado)
+    retomado = solve_circuit(dominante, 1e-12, checkpoint=caminho, vetorizado=vetorizado)
+    direto = solve_circuit(dominante, 1e-12, vetorizado=vetorizado)
+
+    np.testing.assert_array_equal(retomado.correntes, direto.correntes)
+    np.testing.assert_array_equal(retomado.historico, direto.historico)
+    assert retomado.iteracoes == direto.iteracoes
+
+
+def test_checkpoint_de_outra_matriz_levanta(dominante, tmp_path):
+    caminho = str(tmp_path / "circuito.npz")
+    solve_circuit(dominante, checkpoint=caminho)
+    outra = dominante.copy()
+    outra[0, -1] += 1.0
+    with pytest.raises(ValueError):
+        solve_circuit(outra, checkpoint=caminho)
+
+
+def test_nao_convergencia_levanta_e_auto_cai_para_direto():
+    matriz = [[1.0, 2, 3, 1], [3, 1, 2, 2], [2, 3, 1, 3]]
+    with pytest.raises(NaoConvergiu):
+        solve_circuit(matriz, max_iter=30)
+    resultado = solve_circuit(matriz, metodo="auto", max_iter=30)
+    A = np.array(matriz)
+    np.testing.assert_allclose(resultado.correntes, np.linalg.solve(A[:, :-1], A[:, -1]))
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+import solvers
+
+Q1 = solvers.Q1
+
+
+def test_blocos_igual_numpy(sistema):
+    A, b = sistema
+    x = Q1.eliminacao_gaussiana_blocos(A, b, tamanho_bloco=32, num_threads=1)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), rtol=1e-10, atol=1e-12)
+
+
+def test_classica_igual_numpy(sistema):
+    A, b = sistema
+    x = Q1.eliminacao_gaussiana(A, b, mostrar_passos=False)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), rtol=1e-10, atol=1e-12)
+
+
+@pytest.mark.parametrize("num_threads", [2, 3, 8])
+def test_blocos_identico_com_qualquer_numero_de_threads(sistema, num_threads):
+    A, b = sistema
+    referencia = Q1.eliminacao_gaussiana_blocos(A, b, tamanho_bloco=16, num_threads=1)
+    x = Q1.eliminacao_gaussiana_blocos(A, b, tamanho_bloco=16, num_threads=num_threads)
+    np.testing.assert_array_equal(x, referencia)
+
+
+def test_pivo_zero_levanta():
+    A = np.array([[1.0, 2.0], [2.0, 4.0]])
+    with pytest.raises(ValueError):
+        Q1.eliminacao_gaussiana_blocos(A, np.ones(2), num_threads=1)
+
+
+def test_prazo_esgotado_devolve_none(sistema):
+    A, b = sistema
+    assert Q1.eliminacao_gaussiana(A, b, mostrar_passos=False, prazo=0.0) is None
+    assert Q1.eliminacao_gaussiana_blocos(A, b, tamanho_bloco=16, prazo=0.0) is None
+
+
+@pytest.mark.parametrize("memoria_maxima", [8 * 2**10, 256 * 2**20])
+def test_em_disco_igual_numpy(sistema, tmp_path, memoria_maxima):
+    A, b = sistema
+    caminho = str(tmp_path / "sistema.npy")
+    Q1.salvar_sistema_em_disco(A, b, caminho, linhas_por_bloco=7)
+    x = Q1.eliminacao_gaussiana_em_disco(caminho, str(tmp_path / "solucao.npy"), memoria_maxima=memoria_maxima)
+    np.testing.assert_allclose(np.array(x), np.linalg.solve(A, b), rtol=1e-10, atol=1e-12)
+    del x
+
+
+def test_em_disco_identico_com_threads(sistema, tmp_path):
+    A, b = sistema
+    solucoes = []
+    for num_threads in (1, 4):
+        caminho = str(tmp_path / f"sistema{num_threads}.npy")
+        Q1.salvar_sistema_em_disco(A, b, caminho)
+        x = Q1.eliminacao_gaussiana_em_disco(
+            caminho, str(tmp_path / f"solucao{num_threads}.npy"), tamanho_bloco=16, num_threads=num_threads
+        )
+        solucoes.append(np.array(x))
+        del x
+    np.testing.assert_array_equal(solucoes[0], solucoes[1])
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+import solvers
+from solvers import solve_q3, solve_q3_fluxo, solve_q3_lote
+
+Q3 = solvers.Q3
+
+
+def _quadratica(x):
+    return 2.0 * x ** 2 - 3.0 * x + 1.0
+
+
+def _integral_quadratica(a, b):
+    primitiva = lambda x: 2.0 * x ** 3 / 3 - 1.5 * x ** 2 + x
+    return primitiva(b) - primitiva(a)
+
+
+@pytest.fixture
+def perfil_desigual():
+    rng = np.random.default_rng(3)
+    distancias = np.cumsum(rng.uniform(0.5, 2.0, 41)) - 0.5
+    return distancias, rng.uniform(1.0, 6.0, 41)
+
+
+@pytest.mark.parametrize("n_pontos", [3, 9, 41])
+def test_simpson_nao_uniforme_exata_em_quadraticas(n_pontos):
+    rng = np.random.default_rng(n_pontos)
+    x = np.sort(rng.uniform(0.0, 10.0, n_pontos))
+    area, segmentos = Q3.regra_simpson_nao_uniforme(x, _quadratica(x))
+    assert segmentos == [(0, n_pontos - 1, "simpson_1_3")]
+    assert area == pytest.approx(_integral_quadratica(x[0], x[-1]), rel=1e-12)
+
+
+def test_simpson_uniforme_coincide_com_nao_uniforme():
+    x = np.arange(11) * 2.5
+    y = _quadratica(x)
+    area, _ = Q3.regra_simpson_nao_uniforme(x, y)
+    assert Q3.regra_simpson_1_3(y, 2.5, mostrar_aviso=False) == pytest.approx(area, rel=1e-12)
+
+
+def test_dois_pontos_usam_so_o_trapezio():
+    resultado = solve_q3([1.0, 3.0], espacamento=1.0)
+    assert resultado.area_simpson == resultado.area_trapezio == 2.0
+    assert resultado.regras_simpson.tolist() == ["trapezio"]
+
+
+def test_espacamento_em_conflito_com_distancias_desiguais_levanta():
+    with pytest.raises(ValueError):
+        solve_q3([1.0, 2.0, 3.0], espacamento=5.0, distancias=[0.0, 1.0, 2.5])
+
+
+@pytest.mark.parametrize("tamanho_bloco", [1, 2, 7, 100])
+def test_fluxo_igual_solve_q3(perfil_desigual, tamanho_bloco):
+    distancias, profundidades = perfil_desigual
+    referencia = solve_q3(profundidades, distancias=distancias)
+    blocos = (
+        (distancias[i:i + tamanho_bloco], profundidades[i:i + tamanho_bloco])
+        for i in range(0, len(distancias), tamanho_bloco)
+    )
+    fluxo = solve_q3_fluxo(blocos)
+    assert fluxo.pontos == len(distancias)
+    assert fluxo.area_trapezio == pytest.approx(referencia.area_trapezio, rel=1e-12)
+    assert fluxo.area_simpson == pytest.approx(referencia.area_simpson, rel=1e-12)
+    np.testing.assert_array_equal(fluxo.regras_simpson, referencia.regras_simpson)
+
+
+def test_fluxo_lido_de_arquivo_igual_solve_q3(perfil_desigual, tmp_path):
+    distancias, profundidades = perfil_desigual
+    caminho = tmp_path / "perfil.csv"
+    linhas = ["distancias,profundidades"] + [f"{x:.17g},{y:.17g}" for x, y in zip(distancias, profundidades)]
+    caminho.write_text("\n".join(linhas) + "\n", encoding="utf-8")
+    referencia = solve_q3(profundidades, distancias=distancias)
+    fluxo = solve_q3_fluxo(solvers.ler_perfil_em_blocos(str(caminho), bloco_bytes=64))
+    assert fluxo.area_simpson == pytest.approx(referencia.area_simpson, rel=1e-12)
+
+
+@pytest.mark.parametrize("n_pontos", [2, 3, 10, 11])
+def test_lote_igual_solve_q3(n_pontos):
+    rng = np.random.default_rng(n_pontos)
+    perfis = rng.uniform(1.0, 6.0, (4, n_pontos))
+    distancias = np.cumsum(rng.uniform(0.5, 2.0, n_pontos))
+    lote = solve_q3_lote(perfis, distancias=distancias)
+    uniforme = solve_q3_lote(perfis, espacamento=1.5)
+    for i, perfil in enumerate(perfis):
+        referencia = solve_q3(perfil, distancias=distancias)
+        assert lote.area_trapezio[i] == pytest.approx(referencia.area_trapezio, rel=1e-12)
+        assert lote.area_simpson[i] == pytest.approx(referencia.area_simpson, rel=1e-12)
+        referencia = solve_q3(perfil, espacamento=1.5)
+        assert uniforme.area_simpson[i] == pytest.approx(referencia.area_simpson, rel=1e-12)
+
+
+def test_main_informa_distancias_nao_crescentes(monkeypatch, capsys):
+    # Manual, 4 pontos, espaçamento desigual com distância repetida, profundidades.
+    respostas = iter(["2", "4", "2", "0", "2", "2", "5", "1", "2", "3", "1"])
+    monkeypatch.setattr("builtins.input", lambda *_: next(respostas))
+    Q3.main()
+    assert "Erro ao calcular a área: As distâncias devem ser estritamente crescentes." in capsys.readouterr().out
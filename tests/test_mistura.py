@@ -0,0 +1,60 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import solvers
+from solvers import solve_blend
+
+Q1 = solvers.Q1
+
+
+def _nnls_exaustivo(A, b):
+    """Menor resíduo entre as soluções de mínimos quadrados de todos os suportes viáveis."""
+    n = A.shape[1]
+    melhor, residuo_melhor = np.zeros(n), np.linalg.norm(b)
+    for tamanho in range(1, n + 1):
+        for suporte in itertools.combinations(range(n), tamanho):
+            x = np.zeros(n)
+            x[list(suporte)] = np.linalg.lstsq(A[:, suporte], b, rcond=None)[0]
+            residuo = np.linalg.norm(A @ x - b)
+            if (x >= 0).all() and residuo < residuo_melhor - 1e-12:
+                melhor, residuo_melhor = x, residuo
+    return melhor, residuo_melhor
+
+
+def test_passo_ignora_variavel_parada_em_zero():
+    # x_j = s_j = 0 não pode limitar o passo (antes dava 0/0 e NaN em x).
+    x = np.array([0.0, 1.0, 2.0])
+    s = np.array([0.0, -1.0, 3.0])
+    passivo = np.ones(3, dtype=bool)
+    assert Q1._passo_viavel(x, s, passivo) == 0.5
+    assert Q1._passo_viavel(x, np.array([0.0, 2.0, 3.0]), passivo) == 1.0
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_nnls_igual_busca_exaustiva(semente):
+    rng = np.random.default_rng(semente)
+    A = rng.standard_normal((6, 4))
+    b = rng.standard_normal(6)
+    x, _ = Q1.nnls_conjunto_ativo(A, b)
+    _, residuo = _nnls_exaustivo(A, b)
+    assert (x >= 0).all()
+    assert np.linalg.norm(A @ x - b) == pytest.approx(residuo, rel=1e-9, abs=1e-12)
+
+
+def test_nnls_degenerado_fica_finito():
+    # Colunas repetidas e nula, com partida a quente sobre a coluna nula.
+    A = np.array([[1.0, 1.0, 0.0, 2.0], [0.0, 0.0, 0.0, 1.0], [1.0, 1.0, 0.0, 0.0]])
+    b = np.array([2.0, 0.0, 2.0])
+    x, _ = Q1.nnls_conjunto_ativo(A, b, x_inicial=np.array([0.0, 0.0, 1.0, 0.0]))
+    assert np.isfinite(x).all() and (x >= 0).all()
+    np.testing.assert_allclose(A @ x, b, atol=1e-12)
+
+
+def test_mistura_quadrada_igual_q1():
+    necessidades = [100.0, 200.0, 150.0]
+    composicao = [[50.0, 20.0, 10.0], [10.0, 60.0, 20.0], [15.0, 10.0, 70.0]]
+    mistura = solve_blend(necessidades, composicao)
+    np.testing.assert_allclose(mistura.quantidades_minas, solvers.solve_q1(necessidades, composicao).quantidades_minas)
+    assert mistura.residuo == pytest.approx(0.0, abs=1e-9)
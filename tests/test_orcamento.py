@@ -0,0 +1,80 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import solvers
+from solvers import OrcamentoMemoriaExcedido, estimar_memoria, solve_circuit, solve_q1
+
+
+def _orcamento(solver, n, metodo=None):
+    """Orçamento entre o caminho econômico e o padrão, forçando o econômico."""
+    estimativa = estimar_memoria(solver, n, metodo=metodo)
+    assert estimativa["economico"] < estimativa["padrao"]
+    return (estimativa["economico"] + estimativa["padrao"]) // 2
+
+
+@pytest.fixture
+def mineracao():
+    rng = np.random.default_rng(11)
+    n = 60
+    composicao = rng.uniform(0.0, 30.0, (n, n)) + 40.0 * np.eye(n)
+    return rng.uniform(100.0, 500.0, n), composicao
+
+
+def test_q1_economico_igual_padrao(mineracao):
+    necessidades, composicao = mineracao
+    padrao = solve_q1(necessidades, composicao)
+    economico = solve_q1(necessidades, composicao, orcamento_memoria=_orcamento("q1", len(necessidades)))
+    np.testing.assert_allclose(economico.quantidades_minas, padrao.quantidades_minas, rtol=1e-10)
+    np.testing.assert_allclose(economico.obtido, padrao.obtido, rtol=1e-10)
+
+
+def test_q1_economico_usa_o_disco(mineracao):
+    necessidades, composicao = mineracao
+    solvers.ativar_instrumentacao(True)
+    chamadas = []
+    solvers.registrar_callback_metricas(chamadas.append)
+    try:
+        solve_q1(necessidades, composicao, orcamento_memoria=_orcamento("q1", len(necessidades)))
+    finally:
+        solvers.remover_callback_metricas(chamadas.append)
+    assert chamadas[-1].contadores["caminho_economico"] == 1
+
+
+@pytest.mark.parametrize("metodo", ["gauss_seidel", "direto", "auto"])
+def test_circuito_economico_igual_padrao(dominante, metodo):
+    n = len(dominante)
+    padrao = solve_circuit(dominante, 1e-12, metodo=metodo)
+    economico = solve_circuit(dominante, 1e-12, metodo=metodo, orcamento_memoria=_orcamento("circuit", n, metodo))
+    np.testing.assert_allclose(economico.correntes, padrao.correntes, rtol=1e-9)
+
+
+def test_circuito_auto_economico_cai_para_direto():
+    matriz = np.array([[1.0, 2, 3, 1], [3, 1, 2, 2], [2, 3, 1, 3]])
+    with np.errstate(all="ignore"):
+        resultado = solve_circuit(matriz, metodo="auto", max_iter=50, orcamento_memoria=_orcamento("circuit", 3, "auto"))
+    np.testing.assert_allclose(resultado.correntes, np.linalg.solve(matriz[:, :-1], matriz[:, -1]))
+
+
+@pytest.mark.parametrize("solver", ["q1", "circuit"])
+def test_orcamento_insuficiente_levanta_antes(solver):
+    argumentos = {
+        "q1": lambda: solve_q1(np.ones(50), np.eye(50), orcamento_memoria=64),
+        "circuit": lambda: solve_circuit(np.eye(50, 51), orcamento_memoria=64),
+    }
+    with pytest.raises(OrcamentoMemoriaExcedido):
+        argumentos[solver]()
+
+
+def test_medicoes_de_memoria_simultaneas_compartilham_o_tracemalloc():
+    solvers.ativar_instrumentacao(True, memoria=True)
+    primeira, segunda = solvers.MetricasChamada("a"), solvers.MetricasChamada("b")
+    with primeira.memoria():
+        with segunda.memoria():
+            bloco = np.ones(2**16)
+        assert tracemalloc.is_tracing()
+        del bloco
+    assert not tracemalloc.is_tracing()
+    assert segunda.contadores["memoria_pico_bytes"] >= 8 * 2**16
+    assert primeira.contadores["memoria_pico_bytes"] >= segunda.contadores["memoria_pico_bytes"]